@@ -5,7 +5,9 @@ This module defines templates for prompts sent to language models for various
 tasks such as command parsing, task planning, and error recovery.
 """
 
-from typing import Dict, List, Any, Optional
+import string
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
 # Command parsing prompt
 COMMAND_PARSE_TEMPLATE = """
@@ -77,6 +79,43 @@ Return a structured plan with the following format:
 Ensure each step is specific, actionable, and includes all necessary parameters.
 """
 
+# Batched task planning prompt
+TASK_PLANNING_BATCH_TEMPLATE = """
+You are an AI assistant responsible for planning browser automation tasks.
+Break down each of the following {count} parsed commands into a sequence of executable browser automation steps.
+Plan each command independently of the others.
+
+Parsed Commands:
+{parsed_commands}
+
+Consider:
+- Navigation steps required
+- User interaction steps (clicking, typing, etc.)
+- Waiting conditions (page loads, element visibility)
+- Potential error conditions and how to recover
+- Data extraction steps (if applicable)
+
+Return a JSON array with exactly {count} plans, one per command and in the same order, each with the following format:
+{{
+    "steps": [
+        {{
+            "action": string (e.g., "navigate", "click", "type", "wait", "extract"),
+            "params": {{
+                action-specific parameters
+            }},
+            "description": string,
+            "error_recovery": {{
+                "conditions": [string],
+                "actions": [string]
+            }}
+        }}
+    ],
+    "expected_outcome": string
+}}
+
+Ensure each step is specific, actionable, and includes all necessary parameters.
+"""
+
 # Context enhancement prompt
 CONTEXT_ENHANCEMENT_TEMPLATE = """
 You are helping a browser automation system understand and maintain context.
@@ -111,6 +150,43 @@ Return your analysis in JSON format:
 }}
 """
 
+# Context enhancement prompt split into a static system part and a per-turn
+# part, so providers can cache the unchanging prefix. The system part is sent
+# as-is rather than formatted, hence the single braces.
+CONTEXT_ENHANCEMENT_SYSTEM = """
+You are helping a browser automation system understand and maintain context.
+You will be given the current browser state and command sequence. Use it to provide enhanced context:
+
+1. Identify what the user is trying to accomplish
+2. Note any important elements on the page relevant to the command
+3. Suggest how to interpret ambiguous references based on the current state
+4. Highlight any contextual information that would help with executing the command
+
+Return your analysis in JSON format:
+{
+    "interpreted_goal": string,
+    "relevant_elements": [
+        {
+            "description": string,
+            "importance": string,
+            "suggestions": string
+        }
+    ],
+    "disambiguation": {
+        key: value pairs for ambiguous terms and their likely meanings
+    },
+    "context_enhancements": [string]
+}
+"""
+
+CONTEXT_ENHANCEMENT_STATE_TEMPLATE = """
+Current Page: {current_page}
+Page Title: {page_title}
+Visible Elements: {visible_elements}
+Command History: {command_history}
+Current Command: {current_command}
+"""
+
 # Element selection prompt
 ELEMENT_SELECTION_TEMPLATE = """
 You are helping a browser automation system identify the most appropriate element on a page.
@@ -279,6 +355,7 @@ Return your response as plain text that can be directly shown to the user.
 PROMPT_TEMPLATES = {
     "command_parse": COMMAND_PARSE_TEMPLATE,
     "task_planning": TASK_PLANNING_TEMPLATE,
+    "task_planning_batch": TASK_PLANNING_BATCH_TEMPLATE,
     "context_enhancement": CONTEXT_ENHANCEMENT_TEMPLATE,
     "element_selection": ELEMENT_SELECTION_TEMPLATE,
     "error_recovery": ERROR_RECOVERY_TEMPLATE,
@@ -287,6 +364,11 @@ PROMPT_TEMPLATES = {
     "feedback_generation": FEEDBACK_GENERATION_TEMPLATE
 }
 
+# Prompt types available as (static system prompt, per-turn template) pairs
+PROMPT_PARTS = {
+    "context_enhancement": (CONTEXT_ENHANCEMENT_SYSTEM, CONTEXT_ENHANCEMENT_STATE_TEMPLATE)
+}
+
 
 def get_prompt(prompt_type: str, **kwargs) -> str:
     """
@@ -304,6 +386,57 @@ def get_prompt(prompt_type: str, **kwargs) -> str:
     """
     if prompt_type not in PROMPT_TEMPLATES:
         raise ValueError(f"Unknown prompt type: {prompt_type}")
+    
+    parts = _compile_template(prompt_type)
+    if parts is None:
+        return PROMPT_TEMPLATES[prompt_type].format(**kwargs)
+    return "".join(literal if field is None else literal + str(kwargs[field]) for literal, field in parts)
+
+
+@lru_cache(maxsize=32)
+def _compile_template(prompt_type: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Split a prompt template into literal text and field names once.
+    
+    Rendering the pre-split parts skips rescanning the template, including
+    its escaped JSON braces, on every call.
+    
+    Args:
+        prompt_type: The type of prompt to compile
+        
+    Returns:
+        Tuple of (literal text, field name or None) pairs, or None if the
+        template uses format specs, conversions or indexed fields
+    """
+    parts: List[Tuple[str, Optional[str]]] = []
+    for literal, field, spec, conversion in string.Formatter().parse(PROMPT_TEMPLATES[prompt_type]):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        if parts and parts[-1][1] is None:
+            literal = parts.pop()[0] + literal
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+def get_prompt_parts(prompt_type: str, **kwargs) -> Tuple[str, str]:
+    """
+    Get a prompt split into its static system part and formatted dynamic part.
+    
+    The system part is identical on every call, which lets LLM providers
+    reuse their cached processing of it.
+    
+    Args:
+        prompt_type: The type of prompt to retrieve
+        **kwargs: Variables to format the dynamic part with
+        
+    Returns:
+        Tuple of (system prompt, formatted user prompt)
+        
+    Raises:
+        ValueError: If prompt_type has no split form
+    """
+    if prompt_type not in PROMPT_PARTS:
+        raise ValueError(f"Unknown split prompt type: {prompt_type}")
         
-    template = PROMPT_TEMPLATES[prompt_type]
-    return template.format(**kwargs)
+    system_prompt, template = PROMPT_PARTS[prompt_type]
+    return system_prompt, template.format(**kwargs)
@@ -42,6 +42,8 @@ class Settings:
     anthropic_model: str = "claude-3-opus-20240229"
     temperature: float = 0.2
     max_tokens: int = 1000
+    llm_cache_size: int = 128  # Cached LLM responses per component (0 disables)
+    plan_batch_window_ms: int = 0  # Window for batching concurrent LLM plans (0 disables)
     
     # Session settings
     session_expiry: int = 60 * 60  # 1 hour in seconds
@@ -107,5 +109,7 @@ class Settings:
             default_llm_provider=os.environ.get("DEFAULT_LLM_PROVIDER", "openai"),
             openai_model=os.environ.get("OPENAI_MODEL", "gpt-4"),
             anthropic_model=os.environ.get("ANTHROPIC_MODEL", "claude-3-opus-20240229"),
+            llm_cache_size=int(os.environ.get("LLM_CACHE_SIZE", 128)),
+            plan_batch_window_ms=int(os.environ.get("PLAN_BATCH_WINDOW_MS", 0)),
             log_level=os.environ.get("LOG_LEVEL", "INFO"),
         )
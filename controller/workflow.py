@@ -5,6 +5,7 @@ This module is responsible for orchestrating the execution of task sequences,
 managing the overall workflow from natural language command to browser actions.
 """
 
+import asyncio
 import logging
 import traceback
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -107,12 +108,13 @@ class WorkflowController:
             # Add to context
             self.context_manager.add_command(command, parsed_command)
             
-            # Enhance context
-            enhanced_context = await self.context_manager.enhance_context(command)
+            # Enhance context and plan tasks concurrently; the plan does not
+            # depend on the enhanced context, so the LLM calls can overlap
+            enhanced_context, task_plan = await asyncio.gather(
+                self.context_manager.enhance_context(command),
+                self.task_planner.plan_tasks(parsed_command)
+            )
             logger.debug(f"Enhanced context: {enhanced_context}")
-            
-            # Plan tasks
-            task_plan = await self.task_planner.plan_tasks(parsed_command)
             logger.debug(f"Task plan: {task_plan}")
             
             # Execute the task plan
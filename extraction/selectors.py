@@ -7,15 +7,129 @@ based on context, using various selector strategies.
 
 import logging
 import re
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union, Tuple, Callable
+from weakref import WeakKeyDictionary
 
-from playwright.async_api import Page, ElementHandle, Locator
+from playwright.async_api import Page, ElementHandle, JSHandle, Locator
 
-from browser.elements import find_element, get_elements, get_element_properties
+from browser.elements import find_element, get_elements
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Attributes that carry more weight when they match a query term
+_IMPORTANT_ATTRS = frozenset({"id", "name", "title", "aria-label", "placeholder"})
+_IMPORTANT_FORM_ATTRS = frozenset({"id", "name", "placeholder", "aria-label"})
+
+# Number of selection results kept per page
+_RESULT_CACHE_SIZE = 16
+
+# Returns a token that changes whenever the document is replaced or mutated
+_DOM_VERSION_SCRIPT = """
+    () => {
+        if (window.__natanaiDomVersion === undefined) {
+            window.__natanaiDomId = Math.random().toString(36).slice(2);
+            window.__natanaiDomVersion = 0;
+            new MutationObserver(() => { window.__natanaiDomVersion++; }).observe(document, {
+                subtree: true, childList: true, attributes: true, characterData: true
+            });
+        }
+        return `${window.__natanaiDomId}:${window.__natanaiDomVersion}`;
+    }
+"""
+
+
+class _PageSelectorState:
+    """
+    Selection state shared by every selector working on the same page.
+    
+    Holds the semantic candidate array and the most recent selection results
+    for the DOM version they were computed against.
+    """
+    
+    def __init__(self):
+        """Initialize an empty selector state."""
+        self.dom_version: Optional[str] = None
+        self.candidates: Optional[JSHandle] = None
+        self.results: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+    
+    async def sync(self, page: Page) -> None:
+        """
+        Drop cached state if the page's DOM changed since it was computed.
+        
+        Args:
+            page: The page this state belongs to
+        """
+        try:
+            dom_version = await page.evaluate(_DOM_VERSION_SCRIPT)
+        except Exception as e:
+            logger.debug(f"Error getting DOM version: {str(e)}")
+            dom_version = None
+        
+        if dom_version is None or dom_version != self.dom_version:
+            await self.reset()
+        self.dom_version = dom_version
+    
+    async def reset(self) -> None:
+        """Release the candidate array and forget all cached results."""
+        if self.candidates is not None:
+            try:
+                await self.candidates.dispose()
+            except Exception:
+                # The handle may belong to an execution context that is already gone
+                pass
+            self.candidates = None
+        self.results.clear()
+    
+    def get_result(self, key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+        """
+        Look up a cached selection result.
+        
+        Args:
+            key: The cache key of the selection
+            
+        Returns:
+            Tuple of (found, result)
+        """
+        if key not in self.results:
+            return False, None
+        self.results.move_to_end(key)
+        return True, self.results[key]
+    
+    def put_result(self, key: Tuple[Any, ...], result: Any) -> None:
+        """
+        Cache a selection result, evicting the least recently used one if full.
+        
+        Args:
+            key: The cache key of the selection
+            result: The selection result
+        """
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > _RESULT_CACHE_SIZE:
+            self.results.popitem(last=False)
+
+
+_PAGE_STATES: "WeakKeyDictionary[Page, _PageSelectorState]" = WeakKeyDictionary()
+
+
+async def _get_page_state(page: Page) -> _PageSelectorState:
+    """
+    Get the shared selector state for a page, synced to its current DOM.
+    
+    Args:
+        page: The page to get the state for
+        
+    Returns:
+        The page's selector state
+    """
+    state = _PAGE_STATES.get(page)
+    if state is None:
+        state = _PAGE_STATES[page] = _PageSelectorState()
+    await state.sync(page)
+    return state
+
 
 class ContentSelector:
     """
@@ -68,11 +182,11 @@ class ContentSelector:
             The selected element or None if not found
         """
         # Use semantic scoring to find the best matching element
-        matching_elements = await self._score_elements_by_semantic_query(semantic_query)
+        matching_elements = await self._score_elements_by_semantic_query(semantic_query, limit=1)
         
         if matching_elements and len(matching_elements) > 0:
             # Return the highest scoring element
-            return matching_elements[0]["element"]
+            return matching_elements[0][2]
             
         return None
     
@@ -92,91 +206,141 @@ class ContentSelector:
             The list of selected elements
         """
         # Use semantic scoring to find matching elements
-        matching_elements = await self._score_elements_by_semantic_query(semantic_query)
+        matching_elements = await self._score_elements_by_semantic_query(semantic_query, limit=limit)
         
         # Return the top N elements
-        return [item["element"] for item in matching_elements[:limit]]
+        return [item[2] for item in matching_elements]
     
     async def _score_elements_by_semantic_query(
         self, 
-        semantic_query: str
-    ) -> List[Dict[str, Any]]:
+        semantic_query: str,
+        limit: Optional[int] = None
+    ) -> List[Tuple[int, int, ElementHandle]]:
         """
         Score elements based on how well they match a semantic query.
         
+        Scoring runs against a single browser-side candidate array, and only
+        the top-scoring entries are materialized as element handles.
+        
         Args:
             semantic_query: The semantic description of the content to select
+            limit: Maximum number of elements to return (all matches if None)
             
         Returns:
-            List of dictionaries with elements and their scores
+            List of (score, sequence, element) tuples, best match first
         """
-        # Get all visible interactive elements
-        elements = await self._get_candidate_elements()
-        
-        # Score each element based on relevant attributes
-        scored_elements = []
-        
         # Normalize query for better matching
         query_terms = self._extract_keywords(semantic_query.lower())
+        if not query_terms:
+            return []
+        
+        state = await _get_page_state(self.page)
+        cache_key = ("semantic", tuple(query_terms), limit)
+        found, result = state.get_result(cache_key)
+        if found:
+            return result
+        
+        # Get all visible interactive elements as one browser-side array,
+        # shared with other selectors until the DOM changes
+        candidates = state.candidates
+        if candidates is None:
+            candidates = await self._get_candidate_elements()
+            if candidates is None:
+                return []
+            state.candidates = candidates
+        
+        # Pre-filter and fetch lowercased properties in a single round trip
+        candidate_properties = await self._get_scoring_properties(candidates, query_terms)
+        scored_elements = self._score_candidate_properties(candidate_properties, query_terms)
+        
+        if limit is not None:
+            scored_elements = scored_elements[:limit]
+        
+        # Materialize handles only for the entries that made the cut
+        elements = await self._materialize_candidates(
+            candidates, [-seq for _, seq in scored_elements]
+        )
+        
+        result = [(score, seq, element) for (score, seq), element in zip(scored_elements, elements)]
+        state.put_result(cache_key, result)
+        return result
+    
+    def _score_candidate_properties(
+        self,
+        candidate_properties: List[Dict[str, Any]],
+        query_terms: List[str]
+    ) -> List[Tuple[int, int]]:
+        """
+        Score candidate properties against the query terms.
         
-        for element in elements:
-            # Get element properties to score against
-            properties = await get_element_properties(element)
+        Args:
+            candidate_properties: Lowercased scoring properties with candidate indices
+            query_terms: The normalized query keywords
             
+        Returns:
+            List of (score, sequence) tuples, best match first; the sequence is
+            the negated candidate index
+        """
+        if not query_terms:
+            return []
+        
+        scored_elements = []
+        
+        # One alternation over all terms lets strings without any hit be
+        # rejected by a single regex scan before the per-term counting
+        term_pattern = re.compile("|".join(re.escape(term) for term in query_terms))
+        
+        for properties in candidate_properties:
             # Calculate score based on term matching
             score = 0
             
             # Check text content
-            text = properties.get("text", "").lower()
-            for term in query_terms:
-                if term in text:
-                    score += 2  # Higher weight for text content
+            text = properties["text"]
+            if term_pattern.search(text):
+                score += 2 * sum(term in text for term in query_terms)  # Higher weight for text content
             
             # Check description
-            description = properties.get("description", "").lower()
-            for term in query_terms:
-                if term in description:
-                    score += 3  # Higher weight for description (often contains label/name)
+            description = properties["description"]
+            if term_pattern.search(description):
+                # Higher weight for description (often contains label/name)
+                score += 3 * sum(term in description for term in query_terms)
             
             # Check attributes
-            attributes = properties.get("attributes", {})
+            attributes = properties["attributes"]
             for attr_name, attr_value in attributes.items():
-                if isinstance(attr_value, str):
-                    attr_value = attr_value.lower()
-                    for term in query_terms:
-                        if term in attr_value:
-                            # Higher weight for important attributes
-                            if attr_name in ["id", "name", "title", "aria-label", "placeholder"]:
-                                score += 2
-                            else:
-                                score += 1
+                if not term_pattern.search(attr_value):
+                    continue
+                hits = sum(term in attr_value for term in query_terms)
+                # Higher weight for important attributes
+                if attr_name in _IMPORTANT_ATTRS:
+                    score += 2 * hits
+                else:
+                    score += hits
             
             # Bonus for role matching with query
-            role = properties.get("role", "").lower()
+            role = properties["role"]
             role_terms = ["button", "link", "input", "checkbox", "radio", "select", "menu", "tab"]
             for term in role_terms:
                 if term in query_terms and term in role:
                     score += 3  # Significant bonus for role match
             
-            # Only include elements with a positive score
+            # Only include elements with a positive score. The negated candidate
+            # index breaks ties in document order.
             if score > 0:
-                scored_elements.append({
-                    "element": element,
-                    "score": score,
-                    "properties": properties
-                })
+                scored_elements.append((score, -properties["index"]))
         
         # Sort by score in descending order
-        scored_elements.sort(key=lambda x: x["score"], reverse=True)
+        scored_elements.sort(reverse=True)
         
         return scored_elements
     
-    async def _get_candidate_elements(self) -> List[ElementHandle]:
+    async def _get_candidate_elements(self) -> Optional[JSHandle]:
         """
-        Get a list of candidate elements for semantic selection.
+        Get the candidate elements for semantic selection.
         
         Returns:
-            List of candidate elements
+            Handle to a browser-side array of visible candidate elements in
+            document order, or None if the candidates could not be gathered
         """
         # Get all interactive elements
         selectors = [
@@ -189,25 +353,127 @@ class ContentSelector:
             "section", "article", "main", "aside", "header", "footer"
         ]
         
-        all_elements = []
-        for selector in selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                all_elements.extend(elements)
-            except Exception as e:
-                logger.debug(f"Error getting elements with selector {selector}: {str(e)}")
-        
-        # Filter out invisible elements
-        visible_elements = []
-        for element in all_elements:
-            try:
-                is_visible = await element.is_visible()
-                if is_visible:
-                    visible_elements.append(element)
-            except Exception:
-                continue
-                
-        return visible_elements
+        try:
+            # Filter out invisible elements with the same box/visibility rule
+            # Playwright's is_visible applies
+            return await self.page.evaluate_handle("""
+                (selector) => Array.from(document.querySelectorAll(selector)).filter((el) => {
+                    const rect = el.getBoundingClientRect();
+                    return rect.width > 0 && rect.height > 0 &&
+                        window.getComputedStyle(el).visibility !== 'hidden';
+                })
+            """, ", ".join(selectors))
+        except Exception as e:
+            logger.debug(f"Error getting candidate elements: {str(e)}")
+            return None
+    
+    async def _get_scoring_properties(
+        self,
+        candidates: JSHandle,
+        query_terms: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get lowercased scoring properties for candidates that mention a query term.
+        
+        Candidates whose text, opening tag, role and description contain none
+        of the query terms are dropped in the browser, and the survivors' text,
+        description, role and attributes are lowercased there so the scorer can
+        match them as-is.
+        
+        Args:
+            candidates: Handle to the browser-side candidate array
+            query_terms: The normalized query keywords
+            
+        Returns:
+            List of property dictionaries, each with the candidate's index
+        """
+        try:
+            # The shallow clone's outerHTML is the opening tag, which covers the
+            # attributes; role and description are derived, so they are built
+            # before the filter and checked alongside it
+            return await candidates.evaluate("""
+                (elements, terms) => {
+                    const hit = (s) => terms.some(t => s.includes(t));
+                    const roleMap = {a: 'link', button: 'button', select: 'combobox', textarea: 'textbox', img: 'img'};
+                    const results = [];
+                    elements.forEach((el, i) => {
+                        const textContent = (el.textContent || '').trim();
+                        const tag = el.tagName.toLowerCase();
+                        const attrs = {};
+                        for (const attr of el.attributes) {
+                            attrs[attr.name] = attr.value;
+                        }
+                        
+                        let role = attrs['role'] || '';
+                        if (!role) {
+                            role = tag === 'input' ? (attrs['type'] || 'textbox') : (roleMap[tag] || '');
+                        }
+                        
+                        let description = '';
+                        for (const prop of ['aria-label', 'title', 'name', 'placeholder', 'alt']) {
+                            if (attrs[prop]) {
+                                description = attrs[prop];
+                                break;
+                            }
+                        }
+                        if (!description && textContent && textContent.length < 100) {
+                            description = textContent;
+                        }
+                        if (!description) {
+                            description = attrs['id'] || attrs['class'] || `${tag} element`;
+                        }
+                        
+                        const haystack = [textContent, el.cloneNode(false).outerHTML, role, description].join(' ').toLowerCase();
+                        if (!hit(haystack)) return;
+                        
+                        const text = textContent.length > 100 ? textContent.substring(0, 100) + '...' : textContent;
+                        const lowered = {};
+                        for (const [name, value] of Object.entries(attrs)) {
+                            lowered[name] = value.toLowerCase();
+                        }
+                        
+                        results.push({
+                            index: i,
+                            text: text.toLowerCase(),
+                            description: description.toLowerCase(),
+                            role: role.toLowerCase(),
+                            attributes: lowered
+                        });
+                    });
+                    return results;
+                }
+            """, query_terms)
+        except Exception as e:
+            logger.debug(f"Error getting scoring properties: {str(e)}")
+            return []
+    
+    async def _materialize_candidates(
+        self,
+        candidates: JSHandle,
+        indices: List[int]
+    ) -> List[ElementHandle]:
+        """
+        Materialize element handles for selected entries of the candidate array.
+        
+        Args:
+            candidates: Handle to the browser-side candidate array
+            indices: The candidate indices to materialize, in the desired order
+            
+        Returns:
+            The element handles, in the order of the given indices
+        """
+        if not indices:
+            return []
+        
+        picked = await candidates.evaluate_handle(
+            "(elements, indices) => indices.map(i => elements[i])", indices
+        )
+        try:
+            properties = await picked.get_properties()
+        finally:
+            await picked.dispose()
+        
+        return [properties[str(i)].as_element() for i in range(len(indices))]
     
     def _extract_keywords(self, text: str) -> List[str]:
         """
@@ -257,6 +523,24 @@ class TableSelector:
         Returns:
             The selected table element or None if not found
         """
+        state = await _get_page_state(self.page)
+        cache_key = ("table", description)
+        found, best_table = state.get_result(cache_key)
+        if not found:
+            best_table = await self._find_best_table(description)
+            state.put_result(cache_key, best_table)
+        return best_table
+    
+    async def _find_best_table(self, description: str) -> Optional[ElementHandle]:
+        """
+        Score every table on the page against a description.
+        
+        Args:
+            description: The description of the table to select
+            
+        Returns:
+            The best matching table element or None if there are no tables
+        """
         # Get all tables on the page
         tables = await self.page.query_selector_all("table")
         
@@ -269,43 +553,45 @@ class TableSelector:
         
         description_keywords = set(self._extract_keywords(description.lower()))
         
-        for table in tables:
+        # Gather caption, header and nearby heading text for every table in one round trip
+        summaries = await self.page.evaluate("""
+            (tables) => tables.map((table) => {
+                const caption = table.querySelector('caption');
+                const headers = Array.from(table.querySelectorAll('th'))
+                    .map(th => th.textContent)
+                    .filter(text => text)
+                    .map(text => text.toLowerCase());
+                const prev = table.previousElementSibling;
+                const previous = prev && ['H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'P'].includes(prev.tagName)
+                    ? prev.textContent
+                    : null;
+                return {
+                    caption: caption ? caption.textContent : null,
+                    headers: headers,
+                    previous: previous
+                };
+            })
+        """, tables)
+        
+        for table, summary in zip(tables, summaries):
             score = 0
             
             # Check for caption
-            caption = await table.query_selector("caption")
-            if caption:
-                caption_text = await self.page.evaluate("el => el.textContent", caption)
-                if caption_text:
-                    caption_keywords = set(self._extract_keywords(caption_text.lower()))
-                    # Score based on keyword overlap
-                    score += len(description_keywords.intersection(caption_keywords)) * 2
-            
-            # Check for table headers
-            headers = await table.query_selector_all("th")
-            header_texts = []
-            for header in headers:
-                header_text = await self.page.evaluate("el => el.textContent", header)
-                if header_text:
-                    header_texts.append(header_text.lower())
+            caption_text = summary["caption"]
+            if caption_text:
+                caption_keywords = set(self._extract_keywords(caption_text.lower()))
+                # Score based on keyword overlap
+                score += len(description_keywords.intersection(caption_keywords)) * 2
             
             # Score based on keyword presence in headers
+            header_texts = summary["headers"]
             for keyword in description_keywords:
                 for header_text in header_texts:
                     if keyword in header_text:
                         score += 1
             
             # Check for a table heading or description nearby
-            previous_element = await self.page.evaluate("""
-                (table) => {
-                    let prev = table.previousElementSibling;
-                    if (prev && ['H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'P'].includes(prev.tagName)) {
-                        return prev.textContent;
-                    }
-                    return null;
-                }
-            """, table)
-            
+            previous_element = summary["previous"]
             if previous_element:
                 prev_keywords = set(self._extract_keywords(previous_element.lower()))
                 score += len(description_keywords.intersection(prev_keywords)) * 2
@@ -444,46 +730,78 @@ class FormSelector:
         if not description:
             return forms[0]
         
+        state = await _get_page_state(self.page)
+        cache_key = ("form", description)
+        found, best_form = state.get_result(cache_key)
+        if not found:
+            best_form = await self._find_best_form(forms, description)
+            state.put_result(cache_key, best_form)
+        return best_form
+    
+    async def _find_best_form(
+        self,
+        forms: List[ElementHandle],
+        description: str
+    ) -> ElementHandle:
+        """
+        Score forms against a description.
+        
+        Args:
+            forms: The forms on the page
+            description: Description of the form to select
+            
+        Returns:
+            The best matching form, or the first form if none matches
+        """
         best_form = None
         highest_score = -1
         
         description_keywords = set(self._extract_keywords(description.lower()))
         
-        for form in forms:
+        # Gather form attributes, field attributes and label text for every form in one round trip
+        summaries = await self.page.evaluate("""
+            (forms) => {
+                const attributesOf = (el) => {
+                    const attrs = {};
+                    for (const attr of el.attributes) {
+                        attrs[attr.name] = attr.value;
+                    }
+                    return attrs;
+                };
+                return forms.map((form) => ({
+                    attributes: attributesOf(form),
+                    fields: Array.from(form.querySelectorAll('input, select, textarea, button')).map(attributesOf),
+                    labels: Array.from(form.querySelectorAll('label')).map(label => label.textContent)
+                }));
+            }
+        """, forms)
+        
+        for form, summary in zip(forms, summaries):
             score = 0
             
-            # Check form attributes
-            attributes = await self._get_element_attributes(form)
-            
-            # Score based on attribute matches
-            for attr_name, attr_value in attributes.items():
+            # Score based on form attribute matches
+            for attr_name, attr_value in summary["attributes"].items():
                 if isinstance(attr_value, str):
                     attr_value = attr_value.lower()
                     for keyword in description_keywords:
                         if keyword in attr_value:
                             score += 1
             
-            # Check form fields
-            fields = await form.query_selector_all("input, select, textarea, button")
-            for field in fields:
-                field_attrs = await self._get_element_attributes(field)
-                
-                # Score based on field attributes matching the description
+            # Score based on field attributes matching the description
+            for field_attrs in summary["fields"]:
                 for attr_name, attr_value in field_attrs.items():
                     if isinstance(attr_value, str):
                         attr_value = attr_value.lower()
                         for keyword in description_keywords:
                             if keyword in attr_value:
                                 # Higher weight for important attributes
-                                if attr_name in ["id", "name", "placeholder", "aria-label"]:
+                                if attr_name in _IMPORTANT_FORM_ATTRS:
                                     score += 2
                                 else:
                                     score += 1
             
             # Check for labels within the form
-            labels = await form.query_selector_all("label")
-            for label in labels:
-                label_text = await self.page.evaluate("el => el.textContent", label)
+            for label_text in summary["labels"]:
                 if label_text:
                     label_text = label_text.lower()
                     for keyword in description_keywords:
@@ -516,6 +834,29 @@ class FormSelector:
         Returns:
             The selected input field or None if not found
         """
+        state = await _get_page_state(self.page)
+        cache_key = ("input_field", form, field_description)
+        found, best_field = state.get_result(cache_key)
+        if not found:
+            best_field = await self._find_best_input_field(form, field_description)
+            state.put_result(cache_key, best_field)
+        return best_field
+    
+    async def _find_best_input_field(
+        self,
+        form: ElementHandle,
+        field_description: str
+    ) -> Optional[ElementHandle]:
+        """
+        Score the input fields of a form against a description.
+        
+        Args:
+            form: The form element containing the field
+            field_description: Description of the field to select
+            
+        Returns:
+            The best matching input field or None if no field matches
+        """
         # Get all fields in the form
         fields = await form.query_selector_all("input, select, textarea")
         
@@ -528,11 +869,43 @@ class FormSelector:
         
         description_keywords = set(self._extract_keywords(field_description.lower()))
         
-        for field in fields:
+        # Fetch every field's attributes and containing label, plus a map of
+        # explicit label[for] text keyed by id, in one round trip
+        summary = await self.page.evaluate("""
+            (fields) => {
+                const labelsByFor = {};
+                for (const label of document.querySelectorAll('label[for]')) {
+                    const forId = label.getAttribute('for');
+                    if (!(forId in labelsByFor)) {
+                        labelsByFor[forId] = (label.textContent || '').toLowerCase();
+                    }
+                }
+                const fieldSummaries = fields.map((field) => {
+                    const attrs = {};
+                    for (const attr of field.attributes) {
+                        attrs[attr.name] = attr.value;
+                    }
+                    let containingLabel = null;
+                    let el = field;
+                    while (el && el.tagName !== 'FORM') {
+                        if (el.tagName === 'LABEL') {
+                            containingLabel = (el.textContent || '').toLowerCase();
+                            break;
+                        }
+                        el = el.parentElement;
+                    }
+                    return {attributes: attrs, containingLabel: containingLabel};
+                });
+                return {labelsByFor: labelsByFor, fields: fieldSummaries};
+            }
+        """, fields)
+        labels_by_for = summary["labelsByFor"]
+        
+        for field, field_summary in zip(fields, summary["fields"]):
             score = 0
             
             # Get field attributes
-            attributes = await self._get_element_attributes(field)
+            attributes = field_summary["attributes"]
             
             # Score based on attribute matches
             for attr_name, attr_value in attributes.items():
@@ -541,7 +914,7 @@ class FormSelector:
                     for keyword in description_keywords:
                         if keyword in attr_value:
                             # Higher weight for important attributes
-                            if attr_name in ["id", "name", "placeholder", "aria-label"]:
+                            if attr_name in _IMPORTANT_FORM_ATTRS:
                                 score += 2
                             else:
                                 score += 1
@@ -549,49 +922,18 @@ class FormSelector:
             # Check for an associated label
             field_id = attributes.get("id", "")
             if field_id:
-                label = await self.page.query_selector(f"label[for='{field_id}']")
-                if label:
-                    label_text = await self.page.evaluate("el => el.textContent", label)
-                    if label_text:
-                        label_text = label_text.lower()
-                        for keyword in description_keywords:
-                            if keyword in label_text:
-                                score += 3  # Higher weight for explicitly associated labels
-            
-            # Check if the field is inside a label
-            is_inside_label = await self.page.evaluate("""
-                (field) => {
-                    let el = field;
-                    while (el && el.tagName !== 'FORM') {
-                        if (el.tagName === 'LABEL') {
-                            return true;
-                        }
-                        el = el.parentElement;
-                    }
-                    return false;
-                }
-            """, field)
-            
-            if is_inside_label:
-                # Get the parent label text
-                label_text = await self.page.evaluate("""
-                    (field) => {
-                        let el = field;
-                        while (el && el.tagName !== 'FORM') {
-                            if (el.tagName === 'LABEL') {
-                                return el.textContent;
-                            }
-                            el = el.parentElement;
-                        }
-                        return '';
-                    }
-                """, field)
-                
+                label_text = labels_by_for.get(field_id)
                 if label_text:
-                    label_text = label_text.lower()
                     for keyword in description_keywords:
                         if keyword in label_text:
-                            score += 3  # Higher weight for containing labels
+                            score += 3  # Higher weight for explicitly associated labels
+            
+            # Check if the field is inside a label
+            label_text = field_summary["containingLabel"]
+            if label_text:
+                for keyword in description_keywords:
+                    if keyword in label_text:
+                        score += 3  # Higher weight for containing labels
             
             # Update best match if this field has a higher score
             if score > highest_score:
@@ -604,28 +946,6 @@ class FormSelector:
             
         return best_field
     
-    async def _get_element_attributes(self, element: ElementHandle) -> Dict[str, str]:
-        """
-        Get all attributes of an element.
-        
-        Args:
-            element: The element to get attributes for
-            
-        Returns:
-            Dictionary of attribute names and values
-        """
-        attributes = await self.page.evaluate("""
-            (el) => {
-                const attrs = {};
-                for (const attr of el.attributes) {
-                    attrs[attr.name] = attr.value;
-                }
-                return attrs;
-            }
-        """, element)
-        
-        return attributes
-    
     def _extract_keywords(self, text: str) -> List[str]:
         """
         Extract keywords from text, filtering out common stop words.
@@ -9,9 +9,18 @@ import logging
 import re
 import csv
 import io
+import os
 import json
+import pickle
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Union, Callable, Set, TypeVar
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -19,6 +28,26 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 U = TypeVar('U')
 
+# Precompiled patterns used by TextTransformer
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_PATTERNS = tuple(re.compile(p) for p in (
+    r'\+\d{1,3}\s?\(\d{1,4}\)\s?\d{3,4}[-\s]?\d{3,4}',  # +X (XXX) XXX-XXXX
+    r'\+\d{1,3}\s?\d{1,4}\s?\d{3,4}\s?\d{3,4}',         # +X XXX XXX XXXX
+    r'\(\d{3,4}\)\s?\d{3,4}[-\s]?\d{3,4}',              # (XXX) XXX-XXXX
+    r'\d{3,4}[-\s]?\d{3,4}[-\s]?\d{3,4}',               # XXX-XXX-XXXX
+    r'\d{10,12}'                                         # XXXXXXXXXX
+))
+# Host characters are consumed a run at a time rather than one alternation per character
+_URL_RE = re.compile(r'https?://(?:[-\w.]+|%[\da-fA-F]{2})+')
+_DATE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',              # MM/DD/YYYY or DD/MM/YYYY
+    r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',                # YYYY/MM/DD
+    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}',  # Month DD, YYYY
+    r'\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}'      # DD Month YYYY
+))
+_DIGIT_RE = re.compile(r'\d')
+_PARA_RE = re.compile(r'\n\s*\n')
+
 
 class DataTransformer:
     """
@@ -37,6 +66,14 @@ class DataTransformer:
             JSON string representation of the data
         """
         try:
+            if orjson is not None:
+                try:
+                    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+                except TypeError:
+                    # orjson rejects some values the stdlib accepts (e.g. integers
+                    # wider than 64 bits); fall through to json.dumps for those
+                    pass
+            
             json_str = json.dumps(data, indent=2, ensure_ascii=False)
             return json_str
         except Exception as e:
@@ -44,12 +81,32 @@ class DataTransformer:
             return ""
     
     @staticmethod
-    def to_csv(data: List[Dict[str, Any]]) -> str:
+    def get_fieldnames(data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Get the sorted union of keys across a list of dictionaries.
+        
+        Compute this once and pass it to to_csv and to_markdown_table when
+        rendering the same data in both formats.
+        
+        Args:
+            data: List of dictionaries
+            
+        Returns:
+            Sorted list of all keys
+        """
+        return sorted(set().union(*data))
+    
+    @staticmethod
+    def to_csv(
+        data: List[Dict[str, Any]],
+        fieldnames: Optional[List[str]] = None
+    ) -> str:
         """
         Convert list of dictionaries to CSV string.
         
         Args:
             data: List of dictionaries to convert
+            fieldnames: Precomputed columns from get_fieldnames (computed if None)
             
         Returns:
             CSV string representation of the data
@@ -59,16 +116,15 @@ class DataTransformer:
                 return ""
                 
             # Get all possible keys from all dictionaries
-            fieldnames = set()
-            for item in data:
-                fieldnames.update(item.keys())
-            fieldnames = sorted(list(fieldnames))
+            if fieldnames is None:
+                fieldnames = DataTransformer.get_fieldnames(data)
             
-            # Write to CSV
+            # Write to CSV; missing keys come through as None, which the
+            # csv writer emits as an empty field just like DictWriter's restval
             output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(output)
+            writer.writerow(fieldnames)
+            writer.writerows([item.get(key) for key in fieldnames] for item in data)
             
             return output.getvalue()
         except Exception as e:
@@ -76,12 +132,16 @@ class DataTransformer:
             return ""
     
     @staticmethod
-    def to_markdown_table(data: List[Dict[str, Any]]) -> str:
+    def to_markdown_table(
+        data: List[Dict[str, Any]],
+        fieldnames: Optional[List[str]] = None
+    ) -> str:
         """
         Convert list of dictionaries to Markdown table.
         
         Args:
             data: List of dictionaries to convert
+            fieldnames: Precomputed columns from get_fieldnames (computed if None)
             
         Returns:
             Markdown table representation of the data
@@ -90,13 +150,8 @@ class DataTransformer:
             if not data:
                 return ""
                 
-            # Get all keys from all dictionaries
-            all_keys = set()
-            for item in data:
-                all_keys.update(item.keys())
-            
-            # Sort keys for consistent output
-            headers = sorted(list(all_keys))
+            # Get all keys from all dictionaries, sorted for consistent output
+            headers = fieldnames if fieldnames is not None else DataTransformer.get_fieldnames(data)
             
             # Build markdown table
             table = []
@@ -134,20 +189,20 @@ class DataTransformer:
             Filtered list of dictionaries
         """
         try:
-            result = []
+            if not kwargs:
+                return list(data)
             
-            for item in data:
-                include = True
-                
-                for key, value in kwargs.items():
-                    if key not in item or item[key] != value:
-                        include = False
-                        break
-                
-                if include:
-                    result.append(item)
+            criteria = tuple(kwargs.items())
             
-            return result
+            # Single-field filters are the common case; test them inline
+            if len(criteria) == 1:
+                (key, value), = criteria
+                return [item for item in data if key in item and item[key] == value]
+            
+            return [
+                item for item in data
+                if all(key in item and item[key] == value for key, value in criteria)
+            ]
         except Exception as e:
             logger.error(f"Error filtering data: {str(e)}")
             return []
@@ -160,6 +215,9 @@ class DataTransformer:
         """
         Map dictionary keys to new keys.
         
+        Keys keep their original order. If a new key collides with another key
+        of the same item, whichever of the two comes later in the item wins.
+        
         Args:
             data: List of dictionaries to transform
             key_map: Mapping of old keys to new keys
@@ -168,24 +226,8 @@ class DataTransformer:
             Transformed list of dictionaries
         """
         try:
-            result = []
-            
-            for item in data:
-                new_item = {}
-                
-                # Add mapped keys
-                for old_key, new_key in key_map.items():
-                    if old_key in item:
-                        new_item[new_key] = item[old_key]
-                
-                # Add remaining keys that weren't mapped
-                for key, value in item.items():
-                    if key not in key_map:
-                        new_item[key] = value
-                
-                result.append(new_item)
-            
-            return result
+            key_map_get = key_map.get
+            return [{key_map_get(k, k): v for k, v in item.items()} for item in data]
         except Exception as e:
             logger.error(f"Error mapping dictionary keys: {str(e)}")
             return data  # Return original data on error
@@ -193,7 +235,10 @@ class DataTransformer:
     @staticmethod
     def apply_function(
         data: List[T],
-        func: Callable[[T], U]
+        func: Callable[[T], U],
+        parallel: bool = False,
+        min_parallel: int = 1000,
+        chunk_size: Optional[int] = None
     ) -> List[U]:
         """
         Apply a function to each item in a list.
@@ -201,11 +246,27 @@ class DataTransformer:
         Args:
             data: List to transform
             func: Function to apply to each item
+            parallel: Whether to spread a CPU-bound func over a process pool
+            min_parallel: Minimum number of items before the process pool is used
+            chunk_size: Items handed to a worker at a time (derived from the CPU count if None)
             
         Returns:
             Transformed list
         """
         try:
+            if parallel and len(data) >= min_parallel:
+                try:
+                    # Workers receive func by pickling; lambdas and closures can't be sent
+                    pickle.dumps(func)
+                except Exception as e:
+                    logger.debug(f"Function cannot be sent to worker processes, applying serially: {str(e)}")
+                else:
+                    workers = os.cpu_count() or 1
+                    if chunk_size is None:
+                        chunk_size = max(1, len(data) // (workers * 4))
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        return list(pool.map(func, data, chunksize=chunk_size))
+            
             return [func(item) for item in data]
         except Exception as e:
             logger.error(f"Error applying function to data: {str(e)}")
@@ -229,15 +290,13 @@ class TextTransformer:
             List of extracted email addresses
         """
         try:
-            # Simple regex for email extraction
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            emails = re.findall(email_pattern, text)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_emails = [email.lower() for email in emails if not (email.lower() in seen or seen.add(email.lower()))]
+            # Every address contains '@'; a memchr-speed check skips the regex
+            # scan (quadratic on long runs of local-part characters) otherwise
+            if '@' not in text:
+                return []
             
-            return unique_emails
+            # Lowercase and remove duplicates while preserving order
+            return list(dict.fromkeys(match.group(0).lower() for match in _EMAIL_RE.finditer(text)))
         except Exception as e:
             logger.error(f"Error extracting emails: {str(e)}")
             return []
@@ -254,26 +313,14 @@ class TextTransformer:
             List of extracted phone numbers
         """
         try:
-            # Different phone patterns to catch various formats
-            patterns = [
-                r'\+\d{1,3}\s?\(\d{1,4}\)\s?\d{3,4}[-\s]?\d{3,4}',  # +X (XXX) XXX-XXXX
-                r'\+\d{1,3}\s?\d{1,4}\s?\d{3,4}\s?\d{3,4}',         # +X XXX XXX XXXX
-                r'\(\d{3,4}\)\s?\d{3,4}[-\s]?\d{3,4}',              # (XXX) XXX-XXXX
-                r'\d{3,4}[-\s]?\d{3,4}[-\s]?\d{3,4}',               # XXX-XXX-XXXX
-                r'\d{10,12}'                                         # XXXXXXXXXX
-            ]
-            
-            # Find all matches from all patterns
-            phone_numbers = []
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
-                phone_numbers.extend(matches)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_numbers = [number for number in phone_numbers if not (number in seen or seen.add(number))]
+            # Every phone pattern needs a digit, so one scan can rule them all out
+            if not _DIGIT_RE.search(text):
+                return []
             
-            return unique_numbers
+            # Find all matches from all patterns, removing duplicates while preserving order
+            return list(dict.fromkeys(
+                number for pattern in _PHONE_PATTERNS for number in pattern.findall(text)
+            ))
         except Exception as e:
             logger.error(f"Error extracting phone numbers: {str(e)}")
             return []
@@ -290,15 +337,12 @@ class TextTransformer:
             List of extracted URLs
         """
         try:
-            # URL regex pattern
-            url_pattern = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'
-            urls = re.findall(url_pattern, text)
+            # Every match starts with 'http'; skip the regex scan otherwise
+            if 'http' not in text:
+                return []
             
             # Remove duplicates while preserving order
-            seen = set()
-            unique_urls = [url for url in urls if not (url in seen or seen.add(url))]
-            
-            return unique_urls
+            return list(dict.fromkeys(_URL_RE.findall(text)))
         except Exception as e:
             logger.error(f"Error extracting URLs: {str(e)}")
             return []
@@ -315,25 +359,14 @@ class TextTransformer:
             List of extracted date strings
         """
         try:
-            # Date patterns
-            date_patterns = [
-                r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',              # MM/DD/YYYY or DD/MM/YYYY
-                r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',                # YYYY/MM/DD
-                r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}',  # Month DD, YYYY
-                r'\d{1,2} (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}'      # DD Month YYYY
-            ]
-            
-            # Find all matches from all patterns
-            dates = []
-            for pattern in date_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                dates.extend(matches)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_dates = [date for date in dates if not (date in seen or seen.add(date))]
+            # Every date pattern needs a digit, so one scan can rule them all out
+            if not _DIGIT_RE.search(text):
+                return []
             
-            return unique_dates
+            # Find all matches from all patterns, removing duplicates while preserving order
+            return list(dict.fromkeys(
+                date for pattern in _DATE_PATTERNS for date in pattern.findall(text)
+            ))
         except Exception as e:
             logger.error(f"Error extracting dates: {str(e)}")
             return []
@@ -351,7 +384,7 @@ class TextTransformer:
         """
         try:
             # Split by double newlines and filter out empty paragraphs
-            paragraphs = re.split(r'\n\s*\n', text)
+            paragraphs = _PARA_RE.split(text)
             non_empty_paragraphs = [p.strip() for p in paragraphs if p.strip()]
             
             return non_empty_paragraphs
@@ -371,14 +404,9 @@ class TextTransformer:
             Cleaned text
         """
         try:
-            # Replace multiple spaces with a single space
-            cleaned = re.sub(r'\s+', ' ', text)
-            # Replace multiple newlines with a single newline
-            cleaned = re.sub(r'\n+', '\n', cleaned)
-            # Trim whitespace from beginning and end
-            cleaned = cleaned.strip()
-            
-            return cleaned
+            # Collapse every whitespace run (newlines included) to a single space
+            # and trim the ends; str.split() does both in one C-level pass
+            return " ".join(text.split())
         except Exception as e:
             logger.error(f"Error cleaning whitespace: {str(e)}")
             return text
@@ -396,8 +424,16 @@ class TextTransformer:
             Summarized text
         """
         try:
-            # Clean whitespace
-            cleaned_text = TextTransformer.clean_whitespace(text)
+            # Clean whitespace. The cleaned form of a prefix is itself a prefix of
+            # the cleaned text, so long inputs only need enough raw text cleaned
+            # to fill max_length; heavily padded prefixes fall back to the full text.
+            window = max_length * 2
+            if len(text) > window:
+                cleaned_text = TextTransformer.clean_whitespace(text[:window])
+                if len(cleaned_text) <= max_length:
+                    cleaned_text = TextTransformer.clean_whitespace(text)
+            else:
+                cleaned_text = TextTransformer.clean_whitespace(text)
             
             if len(cleaned_text) <= max_length:
                 return cleaned_text
@@ -439,14 +475,14 @@ class TableTransformer:
             # Get all column names
             columns = list(table_data[0].keys())
             
+            # Build the row labels once rather than once per cell
+            row_labels = [f"Row {i+1}" for i in range(len(table_data))]
+            
             # Create new structure with columns as rows
             result = []
             for col in columns:
                 new_row = {"Column": col}
-                
-                for i, row in enumerate(table_data):
-                    new_row[f"Row {i+1}"] = row.get(col, "")
-                
+                new_row.update(zip(row_labels, [row.get(col, "") for row in table_data]))
                 result.append(new_row)
             
             return result
@@ -477,38 +513,24 @@ class TableTransformer:
             if not table_data:
                 return []
             
-            # Get unique values for the index and pivot columns
-            index_values = set()
-            pivot_values = set()
-            
-            for row in table_data:
-                index_values.add(row.get(index_col, ""))
-                pivot_values.add(row.get(pivot_col, ""))
-            
-            # Create result structure
-            result = []
+            # Fill the pivoted data and collect the pivot values, in first-seen
+            # order, in a single pass
+            pivot_values = {}
+            pivoted_data = defaultdict(dict)
             
-            # Create a dictionary to store the pivoted data
-            pivoted_data = {}
-            
-            # Fill the dictionary with values
             for row in table_data:
-                idx_val = row.get(index_col, "")
                 pivot_val = row.get(pivot_col, "")
-                val = row.get(value_col, "")
-                
-                if idx_val not in pivoted_data:
-                    pivoted_data[idx_val] = {}
-                
-                pivoted_data[idx_val][pivot_val] = val
+                pivot_values[pivot_val] = None
+                pivoted_data[row.get(index_col, "")][pivot_val] = row.get(value_col, "")
+            
+            # Column names are computed once rather than per output row
+            pivot_columns = [(pivot_val, str(pivot_val)) for pivot_val in pivot_values]
             
             # Convert dictionary to list of dictionaries
+            result = []
             for idx_val, values in pivoted_data.items():
                 new_row = {index_col: idx_val}
-                
-                for pivot_val in pivot_values:
-                    new_row[str(pivot_val)] = values.get(pivot_val, "")
-                
+                new_row.update((name, values.get(pivot_val, "")) for pivot_val, name in pivot_columns)
                 result.append(new_row)
             
             return result
@@ -534,14 +556,7 @@ class TableTransformer:
             Table data with the new column
         """
         try:
-            result = []
-            
-            for row in table_data:
-                new_row = row.copy()
-                new_row[new_column] = calculation(row)
-                result.append(new_row)
-            
-            return result
+            return [{**row, new_column: calculation(row)} for row in table_data]
         except Exception as e:
             logger.error(f"Error adding calculated column: {str(e)}")
             return table_data
@@ -567,29 +582,26 @@ class TableTransformer:
             if not table_data:
                 return []
             
-            # Group rows by the group_by column
-            groups = {}
+            # Group rows by the group_by column, collecting each aggregated
+            # column's non-None values directly so rows are only walked once
+            agg_items = list(aggregations.items())
+            agg_columns = [col for col, _ in agg_items]
+            groups = defaultdict(lambda: [[] for _ in agg_columns])
             
             for row in table_data:
-                group_value = row.get(group_by, "")
-                
-                if group_value not in groups:
-                    groups[group_value] = []
-                
-                groups[group_value].append(row)
+                buffers = groups[row.get(group_by, "")]
+                for buffer, col in zip(buffers, agg_columns):
+                    value = row.get(col)
+                    if value is not None:
+                        buffer.append(value)
             
             # Apply aggregations
             result = []
             
-            for group_value, rows in groups.items():
+            for group_value, buffers in groups.items():
                 new_row = {group_by: group_value}
                 
-                for col, agg_func in aggregations.items():
-                    # Extract values for this column
-                    values = [row.get(col, None) for row in rows]
-                    # Remove None values
-                    values = [v for v in values if v is not None]
-                    
+                for (col, agg_func), values in zip(agg_items, buffers):
                     # Apply aggregation function if we have values
                     if values:
                         try:
@@ -11,21 +11,20 @@ setting up command-line interface or API server as needed.
 import argparse
 import asyncio
 import logging
+import os
 import sys
-from typing import Optional
-
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from typing import Optional, TYPE_CHECKING
 
 from config.settings import Settings
 from utils.logger import setup_logger
-from api.interact import setup_interact_routes
-from api.extract import setup_extract_routes
-from controller.workflow import WorkflowController
-from controller.session import SessionManager
+
+# The API stack and the browser controller are imported where they are used,
+# so --help and the other mode don't pay for them at startup
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
-def setup_api_server(settings: Settings) -> FastAPI:
+def setup_api_server(settings: Settings) -> "FastAPI":
     """
     Set up and configure the FastAPI server.
     
@@ -35,6 +34,12 @@ def setup_api_server(settings: Settings) -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    
+    from api.interact import setup_interact_routes
+    from api.extract import setup_extract_routes
+    
     app = FastAPI(
         title="Browser AI Agent API",
         description="API for browser automation via natural language commands",
@@ -57,6 +62,22 @@ def setup_api_server(settings: Settings) -> FastAPI:
     return app
 
 
+def create_api_app() -> "FastAPI":
+    """
+    Build the API application from environment settings.
+    
+    Used for every API server: as the uvicorn app factory with several
+    worker processes, each of which imports this module and builds its own
+    app, and directly with a single worker, so both are configured alike.
+    
+    Returns:
+        Configured FastAPI application
+    """
+    settings = Settings.from_env()
+    setup_logger(getattr(logging, settings.log_level.upper(), logging.INFO))
+    return setup_api_server(settings)
+
+
 async def run_cli_mode(settings: Settings) -> None:
     """
     Run the application in CLI mode, accepting commands from stdin.
@@ -64,6 +85,9 @@ async def run_cli_mode(settings: Settings) -> None:
     Args:
         settings: Application settings
     """
+    from controller.workflow import WorkflowController
+    from controller.session import SessionManager
+    
     logger = logging.getLogger("browser_ai_agent")
     
     session_manager = SessionManager(settings)
@@ -71,9 +95,13 @@ async def run_cli_mode(settings: Settings) -> None:
     
     logger.info("Browser AI Agent CLI started. Type 'exit' to quit.")
     
+    loop = asyncio.get_running_loop()
+    
     while True:
         try:
-            command = input("\nEnter command: ")
+            # Read on a worker thread so the event loop keeps servicing
+            # background tasks while waiting for the user
+            command = await loop.run_in_executor(None, input, "\nEnter command: ")
             if command.lower() in ("exit", "quit"):
                 break
                 
@@ -83,6 +111,9 @@ async def run_cli_mode(settings: Settings) -> None:
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt, shutting down...")
             break
+        except EOFError:
+            logger.info("Input closed, shutting down...")
+            break
         except Exception as e:
             logger.error(f"Error processing command: {str(e)}")
     
@@ -91,6 +122,18 @@ async def run_cli_mode(settings: Settings) -> None:
     logger.info("Browser AI Agent CLI shutdown complete")
 
 
+def install_event_loop_policy() -> None:
+    """
+    Use uvloop's libuv-based event loop for asyncio when it is installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def parse_args() -> argparse.Namespace:
     """
     Parse command line arguments.
@@ -118,6 +161,12 @@ def parse_args() -> argparse.Namespace:
         default=8000,
         help="Port to bind the API server to (API mode only)"
     )
+    parser.add_argument(
+        "--workers", 
+        type=int, 
+        default=1,
+        help="Number of API server worker processes; sessions are not shared between workers (API mode only)"
+    )
     parser.add_argument(
         "--headless", 
         action="store_true",
@@ -144,19 +193,37 @@ def main() -> None:
     setup_logger(log_level)
     logger = logging.getLogger("browser_ai_agent")
     
-    # Load settings
-    settings = Settings(headless=args.headless)
-    
     if args.mode == "api":
         # API server mode
         import uvicorn
         
-        app = setup_api_server(settings)
         logger.info(f"Starting API server on {args.host}:{args.port}")
         
-        uvicorn.run(app, host=args.host, port=args.port)
+        # The app is built from environment settings in every worker process,
+        # so the command line options reach it through the environment
+        os.environ["BROWSER_HEADLESS"] = "true" if args.headless else "false"
+        if args.debug:
+            os.environ["LOG_LEVEL"] = "DEBUG"
+        else:
+            os.environ.setdefault("LOG_LEVEL", "INFO")
+        
+        # uvicorn already picks uvloop and httptools when they are installed;
+        # per-request access logging is only kept in debug mode
+        if args.workers > 1:
+            uvicorn.run(
+                "main:create_api_app",
+                factory=True,
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                access_log=args.debug
+            )
+        else:
+            uvicorn.run(create_api_app(), host=args.host, port=args.port, access_log=args.debug)
     else:
         # CLI mode
+        settings = Settings(headless=args.headless)
+        install_event_loop_policy()
         try:
             asyncio.run(run_cli_mode(settings))
         except KeyboardInterrupt:
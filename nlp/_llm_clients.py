@@ -0,0 +1,180 @@
+"""
+LLM provider clients.
+
+This module wraps the OpenAI and Anthropic SDKs behind plain async functions
+shared by the parser, planner and context manager, and keeps one client per
+API key for the life of the process.
+"""
+
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+from config.settings import Settings
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Pending LLM calls keyed by event loop and full request, see call_llm
+_IN_FLIGHT_CALLS: Dict[Tuple[Any, ...], "asyncio.Future[str]"] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client(api_key: Optional[str]) -> Any:
+    """
+    Get the async OpenAI client for an API key, constructed only once.
+    
+    The client keeps its HTTP connection pool open, so later calls reuse
+    connections instead of repeating the TLS handshake.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        Async OpenAI client
+    """
+    return openai.AsyncOpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def _get_anthropic_client(api_key: Optional[str]) -> Any:
+    """
+    Get the async Anthropic client for an API key, constructed only once.
+    
+    Args:
+        api_key: Anthropic API key
+        
+    Returns:
+        Async Anthropic client
+    """
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
+async def call_openai(settings: Settings, prompt: str, system: Optional[str] = None) -> str:
+    """
+    Call OpenAI API with a prompt.
+    
+    Args:
+        settings: Application settings
+        prompt: The prompt to send to the API
+        system: Optional static system prompt sent ahead of the prompt
+        
+    Returns:
+        Response from the OpenAI API
+    """
+    # This would be implemented with actual API calls
+    # Using a placeholder implementation for now
+    logger.debug("Calling OpenAI API")
+    if openai is None:
+        logger.error("Error calling OpenAI API: the openai package is not installed")
+        return "{}"
+    try:
+        client = _get_openai_client(settings.openai_api_key)
+        
+        if system is None:
+            messages = [{"role": "system", "content": prompt}]
+        else:
+            # A stable leading system message lets OpenAI reuse its prefix cache
+            messages = [
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt}
+            ]
+        
+        response = await client.chat.completions.create(
+            model=settings.openai_model,
+            messages=messages,
+            temperature=settings.temperature,
+            max_tokens=settings.max_tokens
+        )
+        
+        return response.choices[0].message.content
+    except Exception as e:
+        logger.error(f"Error calling OpenAI API: {e}")
+        return "{}"
+
+
+async def call_anthropic(settings: Settings, prompt: str, system: Optional[str] = None) -> str:
+    """
+    Call Anthropic API with a prompt.
+    
+    Args:
+        settings: Application settings
+        prompt: The prompt to send to the API
+        system: Optional static system prompt, marked as cacheable
+        
+    Returns:
+        Response from the Anthropic API
+    """
+    # This would be implemented with actual API calls
+    # Using a placeholder implementation for now
+    logger.debug("Calling Anthropic API")
+    if anthropic is None:
+        logger.error("Error calling Anthropic API: the anthropic package is not installed")
+        return "{}"
+    try:
+        client = _get_anthropic_client(settings.anthropic_api_key)
+        
+        request = {
+            "model": settings.anthropic_model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": settings.max_tokens,
+            "temperature": settings.temperature
+        }
+        if system is not None:
+            request["system"] = [
+                {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+            ]
+        
+        response = await client.messages.create(**request)
+        
+        return "".join(block.text for block in response.content if block.type == "text")
+    except Exception as e:
+        logger.error(f"Error calling Anthropic API: {e}")
+        return "{}"
+
+
+async def call_llm(settings: Settings, prompt: str, system: Optional[str] = None) -> str:
+    """
+    Call the configured LLM provider with a prompt.
+    
+    Args:
+        settings: Application settings
+        prompt: The prompt to send to the API
+        system: Optional static system prompt sent ahead of the prompt
+        
+    Returns:
+        Response from the LLM API
+    """
+    if settings.default_llm_provider == "openai":
+        model = settings.openai_model
+        call = call_openai
+    else:  # anthropic
+        model = settings.anthropic_model
+        call = call_anthropic
+    
+    # Identical requests already in flight share one API call
+    key = (
+        asyncio.get_running_loop(), settings.default_llm_provider, model,
+        settings.temperature, settings.max_tokens, system, prompt
+    )
+    task = _IN_FLIGHT_CALLS.get(key)
+    if task is None:
+        task = asyncio.ensure_future(call(settings, prompt, system))
+        _IN_FLIGHT_CALLS[key] = task
+        task.add_done_callback(lambda _: _IN_FLIGHT_CALLS.pop(key, None))
+    else:
+        logger.debug("Joining in-flight LLM request for identical prompt")
+    
+    # Shield so one cancelled waiter does not cancel the call for the others
+    return await asyncio.shield(task)
@@ -0,0 +1,65 @@
+"""
+Shared patterns and LLM-response parsing helpers for the NLP package.
+
+Patterns and helpers used by more than one module are defined here once.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Absolute http(s) URL, used as a building block in command patterns
+URL_SRC = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w%!.~\'()*+,;=:@/&?#]*)?'
+
+_JSON_DECODER = json.JSONDecoder()
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def parse_llm_json(text: str, opener: str = "{") -> Any:
+    """
+    Parse the JSON object contained in an LLM response.
+    
+    A response that is plain JSON is decoded directly. Otherwise the content
+    of a ```json fence is decoded, and failing that the first object found
+    in the text is decoded in place, ignoring anything after it.
+    
+    Args:
+        text: Raw LLM response
+        opener: Opening character of the expected value, "{" for an object
+            or "[" for an array
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        json.JSONDecodeError: If no JSON object can be decoded
+    """
+    text = text.strip()
+    
+    # Fast path: the model followed the prompt and returned bare JSON
+    if text.startswith(opener):
+        try:
+            return _loads(text)
+        except ValueError:
+            pass
+    
+    # Fenced ```json block
+    fence = text.find("```json")
+    if fence != -1:
+        start = text.find("\n", fence)
+        end = text.find("\n```", start)
+        if start != -1 and end != -1:
+            try:
+                return _loads(text[start + 1:end])
+            except ValueError:
+                pass
+    
+    # First object embedded in surrounding prose
+    brace = text.find(opener)
+    if brace == -1:
+        raise json.JSONDecodeError("No JSON object found", text, 0)
+    return _JSON_DECODER.raw_decode(text, brace)[0]
@@ -8,16 +8,145 @@ history to enhance understanding of user commands and improve task execution.
 import json
 import logging
 import time
-from typing import Dict, List, Any, Optional, Deque
-from collections import deque
+import zlib
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from config.settings import Settings
-from config.prompts import get_prompt
+from config.prompts import get_prompt_parts
+from nlp._patterns import parse_llm_json
+from nlp._llm_clients import call_llm
+from nlp.parser import ResponseCache
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 
+
+class RingBuffer:
+    """
+    Fixed-capacity history buffer backed by a preallocated list.
+    
+    Appending past capacity overwrites the oldest entry. Items are kept in a
+    single contiguous list, so indexing is O(1) and copying out the contents
+    costs at most two slices.
+    """
+    __slots__ = ("_buf", "_head", "_len", "_cap")
+    
+    def __init__(self, capacity: int, items: Iterable[Any] = ()):
+        """
+        Initialize the buffer.
+        
+        Args:
+            capacity: Maximum number of items to keep
+            items: Initial items, oldest first; only the newest `capacity` are kept
+        """
+        self._cap = max(capacity, 0)
+        self._buf: List[Any] = [None] * self._cap
+        self._head = 0
+        self._len = 0
+        for item in items:
+            self.append(item)
+    
+    def append(self, item: Any) -> None:
+        """
+        Add an item, dropping the oldest one if the buffer is full.
+        
+        Args:
+            item: Item to add
+        """
+        if self._cap == 0:
+            return
+        if self._len < self._cap:
+            self._buf[(self._head + self._len) % self._cap] = item
+            self._len += 1
+        else:
+            self._buf[self._head] = item
+            self._head = (self._head + 1) % self._cap
+    
+    def clear(self) -> None:
+        """Remove all items."""
+        self._buf = [None] * self._cap
+        self._head = 0
+        self._len = 0
+    
+    def to_list(self) -> List[Any]:
+        """
+        Get the items as a list.
+        
+        Returns:
+            Items, oldest first
+        """
+        end = self._head + self._len
+        if end <= self._cap:
+            return self._buf[self._head:end]
+        return self._buf[self._head:] + self._buf[:end - self._cap]
+    
+    def recent(self, count: int) -> List[Any]:
+        """
+        Get the newest items.
+        
+        Args:
+            count: Maximum number of items to return
+            
+        Returns:
+            Up to `count` items, newest first
+        """
+        count = min(max(count, 0), self._len)
+        return [self[self._len - 1 - i] for i in range(count)]
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RingBuffer index out of range")
+        return self._buf[(self._head + index) % self._cap]
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.to_list())
+
+
+@dataclass
+class Entity:
+    """
+    Entity remembered in the conversation context.
+    
+    Slotted so that long sessions holding many entities stay compact.
+    """
+    __slots__ = ("type", "value", "first_seen", "last_used", "usage_count")
+    
+    type: str
+    value: Any
+    first_seen: float
+    last_used: float
+    usage_count: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the entity to a plain dictionary.
+        
+        Returns:
+            Dictionary of the entity fields
+        """
+        return {
+            "type": self.type,
+            "value": self.value,
+            "first_seen": self.first_seen,
+            "last_used": self.last_used,
+            "usage_count": self.usage_count
+        }
+
+
 class ContextManager:
     """
     Context manager for maintaining conversation context.
@@ -37,10 +166,10 @@ class ContextManager:
         self.max_history = settings.max_session_history
         
         # Command history, newest at the end
-        self.command_history: Deque[Dict[str, Any]] = deque(maxlen=self.max_history)
+        self.command_history: RingBuffer = RingBuffer(self.max_history)
         
         # Task plan history, newest at the end
-        self.task_plan_history: Deque[Dict[str, Any]] = deque(maxlen=self.max_history)
+        self.task_plan_history: RingBuffer = RingBuffer(self.max_history)
         
         # Current browser state
         self.current_state: Dict[str, Any] = {
@@ -59,7 +188,13 @@ class ContextManager:
         self.session_vars: Dict[str, Any] = {}
         
         # Entity memory (recognized entities)
-        self.entities: Dict[str, Any] = {}
+        self.entities: Dict[str, Entity] = {}
+        
+        # Entity IDs grouped by type, in insertion order (dict as ordered set)
+        self._entities_by_type: Dict[str, Dict[str, None]] = defaultdict(dict)
+        
+        # Enhanced contexts keyed by the prompt that produced them
+        self.response_cache = ResponseCache(settings.llm_cache_size)
     
     def add_command(self, command: str, parsed_command: Dict[str, Any]) -> None:
         """
@@ -119,19 +254,26 @@ class ContextManager:
         """
         if entity_id is None:
             entity_id = f"{entity_type}_{len(self.entities) + 1}"
+        
+        # Re-adding an ID may change its type
+        previous = self.entities.get(entity_id)
+        if previous is not None and previous.type != entity_type:
+            self._entities_by_type[previous.type].pop(entity_id, None)
+        self._entities_by_type[entity_type][entity_id] = None
             
-        self.entities[entity_id] = {
-            "type": entity_type,
-            "value": entity_value,
-            "first_seen": time.time(),
-            "last_used": time.time(),
-            "usage_count": 1
-        }
+        now = time.time()
+        self.entities[entity_id] = Entity(
+            type=entity_type,
+            value=entity_value,
+            first_seen=now,
+            last_used=now,
+            usage_count=1
+        )
         
         logger.debug(f"Added entity: {entity_type} - {entity_id}")
         return entity_id
     
-    def get_entity(self, entity_id: str) -> Optional[Dict[str, Any]]:
+    def get_entity(self, entity_id: str) -> Optional[Entity]:
         """
         Get an entity by ID.
         
@@ -139,13 +281,13 @@ class ContextManager:
             entity_id: The ID of the entity to retrieve
             
         Returns:
-            The entity dictionary or None if not found
+            The entity record or None if not found
         """
         entity = self.entities.get(entity_id)
         if entity:
             # Update usage stats
-            entity["last_used"] = time.time()
-            entity["usage_count"] += 1
+            entity.last_used = time.time()
+            entity.usage_count += 1
             
         return entity
     
@@ -159,15 +301,8 @@ class ContextManager:
         Returns:
             List of matching entities with their IDs
         """
-        results = []
-        for entity_id, entity in self.entities.items():
-            if entity["type"] == entity_type:
-                results.append({
-                    "id": entity_id,
-                    **entity
-                })
-        
-        return results
+        entity_ids = self._entities_by_type.get(entity_type, ())
+        return [{"id": entity_id, **self.entities[entity_id].to_dict()} for entity_id in entity_ids]
     
     def get_recent_commands(self, count: int = 5) -> List[Dict[str, Any]]:
         """
@@ -179,7 +314,7 @@ class ContextManager:
         Returns:
             List of recent commands, most recent first
         """
-        return list(reversed(list(self.command_history)[-count:]))
+        return self.command_history.recent(count)
     
     def get_session_var(self, key: str, default: Any = None) -> Any:
         """
@@ -227,20 +362,20 @@ class ContextManager:
         
         # Format visible elements for prompt
         visible_elements = self.current_state.get("visible_elements", [])
-        visible_elements_str = "\n".join([
+        visible_elements_str = "\n".join(
             f"- {el.get('role', 'element')}: {el.get('description', 'unknown')}" 
-            for el in visible_elements[:20]  # Limit to 20 elements
-        ])
+            for el in islice(visible_elements, 20)  # Limit to 20 elements
+        )
         
         # Format command history for prompt
-        recent_commands = self.get_recent_commands(5)
-        command_history_str = "\n".join([
+        command_history_str = "\n".join(
             f"- {i+1}. \"{cmd['original']}\" ({cmd['parsed']['action']})"
-            for i, cmd in enumerate(recent_commands)
-        ])
+            for i, cmd in enumerate(self.get_recent_commands(5))
+        )
         
-        # Get the prompt
-        prompt = get_prompt(
+        # Get the prompt; the static instructions go in a separate system
+        # prompt so providers can cache them across turns
+        system_prompt, prompt = get_prompt_parts(
             "context_enhancement",
             current_page=current_page,
             page_title=page_title,
@@ -249,28 +384,22 @@ class ContextManager:
             current_command=current_command
         )
         
+        # The prompt captures the page, visible elements and recent history,
+        # so an identical prompt can reuse the earlier enhancement
+        cached_context = self.response_cache.get(prompt)
+        if cached_context is not None:
+            logger.debug(f"Enhanced context from cache: {cached_context}")
+            return cached_context
+        
         # Call appropriate LLM API
-        if self.settings.default_llm_provider == "openai":
-            from nlp.parser import CommandParser
-            result = await CommandParser(self.settings)._call_openai(prompt)
-        else:  # anthropic
-            from nlp.parser import CommandParser
-            result = await CommandParser(self.settings)._call_anthropic(prompt)
+        result = await call_llm(self.settings, prompt, system_prompt)
         
         # Extract and parse JSON from the response
         try:
-            import re
-            
-            # Find JSON in the response
-            json_match = re.search(r'```json\n(.*?)\n```|{.*}', result, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1) if json_match.group(1) else json_match.group(0)
-                enhanced_context = json.loads(json_str)
-            else:
-                # Try to parse the entire response as JSON
-                enhanced_context = json.loads(result)
+            enhanced_context = parse_llm_json(result)
                 
             logger.debug(f"Enhanced context: {enhanced_context}")
+            self.response_cache.put(prompt, enhanced_context)
             return enhanced_context
             
         except (json.JSONDecodeError, AttributeError) as e:
@@ -292,38 +421,96 @@ class ContextManager:
         """
         return {
             "browser_state": self.current_state,
-            "command_history": list(self.command_history),
-            "task_plan_history": list(self.task_plan_history),
+            "command_history": self.command_history.to_list(),
+            "task_plan_history": self.task_plan_history.to_list(),
             "session_vars": self.session_vars,
-            "entities": self.entities
+            "entities": self._export_entities()
         }
     
-    def import_context(self, context_data: Dict[str, Any]) -> None:
+    def _export_entities(self) -> Dict[str, Dict[str, Any]]:
         """
-        Import context from a dictionary.
+        Convert entity records to plain dictionaries for export.
+        
+        Returns:
+            Entities keyed by ID
+        """
+        return {entity_id: entity.to_dict() for entity_id, entity in self.entities.items()}
+    
+    def export_context_bytes(self, compress: bool = False) -> bytes:
+        """
+        Export the current context as serialized JSON bytes.
+        
+        orjson is used when installed.
+        
+        Args:
+            compress: Whether to deflate the output (fastest compression level)
+            
+        Returns:
+            UTF-8 JSON bytes, zlib-compressed if requested
+        """
+        context = {
+            "browser_state": self.current_state,
+            "command_history": self.command_history.to_list(),
+            "task_plan_history": self.task_plan_history.to_list(),
+            "session_vars": self.session_vars,
+            "entities": self._export_entities()
+        }
+        
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.dumps(context, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # orjson rejects some values the stdlib accepts (e.g. integers
+                # wider than 64 bits); fall through to json.dumps for those
+                pass
+        if data is None:
+            data = json.dumps(context).encode("utf-8")
+        
+        return zlib.compress(data, 1) if compress else data
+    
+    def import_context(self, context_data: Union[Dict[str, Any], bytes, str]) -> None:
+        """
+        Import context from a dictionary or serialized JSON.
         
         Args:
-            context_data: The context data to import
+            context_data: The context data to import, either as a dictionary or
+                as the (optionally compressed) output of export_context_bytes
         """
+        if isinstance(context_data, (bytes, bytearray, memoryview)):
+            context_data = bytes(context_data)
+            if not context_data.lstrip().startswith(b"{"):
+                context_data = zlib.decompress(context_data)
+            context_data = orjson.loads(context_data) if orjson is not None else json.loads(context_data)
+        elif isinstance(context_data, str):
+            context_data = orjson.loads(context_data) if orjson is not None else json.loads(context_data)
+        
         if "browser_state" in context_data:
             self.current_state = context_data["browser_state"]
             
         if "command_history" in context_data:
-            self.command_history = deque(
-                context_data["command_history"],
-                maxlen=self.max_history
+            self.command_history = RingBuffer(
+                self.max_history,
+                context_data["command_history"]
             )
             
         if "task_plan_history" in context_data:
-            self.task_plan_history = deque(
-                context_data["task_plan_history"],
-                maxlen=self.max_history
+            self.task_plan_history = RingBuffer(
+                self.max_history,
+                context_data["task_plan_history"]
             )
             
         if "session_vars" in context_data:
             self.session_vars = context_data["session_vars"]
             
         if "entities" in context_data:
-            self.entities = context_data["entities"]
+            # Build the records and the type index in a single pass
+            self.entities = {}
+            self._entities_by_type = defaultdict(dict)
+            for entity_id, entity in context_data["entities"].items():
+                if not isinstance(entity, Entity):
+                    entity = Entity(**entity)
+                self.entities[entity_id] = entity
+                self._entities_by_type[entity.type][entity_id] = None
             
         logger.info("Imported context data")
@@ -6,19 +6,130 @@ structured instructions that can be executed by the browser automation system.
 It uses a combination of patterns and language model inference.
 """
 
+import copy
 import json
 import logging
 import re
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union
+from urllib.parse import quote_plus
 
 from config.settings import Settings
 from config.prompts import get_prompt
+from nlp._llm_clients import call_anthropic, call_openai
+from nlp._patterns import URL_SRC, parse_llm_json
 from utils.validators import validate_parsed_command
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 
+# Prefixes of targets that are already absolute URLs
+_URL_SCHEMES = ("http://", "https://")
+
+# Literal verbs each pattern family requires; a command containing none of a
+# family's anchors (after casefolding) cannot match that family
+_NAVIGATE_ANCHORS = ("go to", "open", "navigate to", "visit")
+_SEARCH_ANCHORS = ("search", "look up", "find", "google", "bing", "yahoo")
+_LOGIN_ANCHORS = ("log in", "sign in")
+
+
+def _combine_patterns(*patterns: str) -> "re.Pattern":
+    """
+    Fuse several patterns into one case-insensitive alternation.
+    
+    Alternatives are tried in the order given, so earlier patterns keep
+    priority over later ones at the same match position.
+    
+    Args:
+        patterns: Regex sources to combine
+        
+    Returns:
+        Compiled combined pattern
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+def _matched_groups(match: "re.Match") -> List[str]:
+    """
+    Get the capture groups of the alternative that actually matched.
+    
+    Args:
+        match: Match object from a combined pattern
+        
+    Returns:
+        Non-empty capture groups in order
+    """
+    return [group for group in match.groups() if group is not None]
+
+
+class ResponseCache:
+    """
+    Exact-match LRU cache for results derived from LLM responses.
+    
+    Values are copied on the way in and out so callers can mutate what they
+    get back without corrupting the cache.
+    """
+    
+    def __init__(self, max_size: int = 128):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries to keep (0 disables caching)
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Hashable cache key
+            
+        Returns:
+            Copy of the cached value or None on a miss
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(value)
+    
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        
+        Args:
+            key: Hashable cache key
+            value: Value to cache
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[key] = copy.deepcopy(value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hit, miss and size counts
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
 class CommandParser:
     """
     Parser for natural language commands.
@@ -35,23 +146,25 @@ class CommandParser:
             settings: Application settings
         """
         self.settings = settings
-        self.url_pattern = re.compile(
-            r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w%!.~\'()*+,;=:@/&?#]*)?'
+        self.response_cache = ResponseCache(settings.llm_cache_size)
+        self.url_pattern = re.compile(URL_SRC)
+        # Common actions patterns. Each family is fused into one alternation so a
+        # command is scanned once per family instead of once per pattern.
+        # Explicit URLs are tried first; the site-name alternatives would
+        # otherwise stop at the scheme and capture only "http"/"https"
+        self.navigate_pattern = _combine_patterns(
+            rf'(?:go to|open|navigate to|visit)\s+({URL_SRC})',
+            r'(?:go to|open|navigate to|visit)\s+(?:the\s+)?(?:website|site|page)?\s*(?:at|of|called|named)?\s*([\w\s.-]+)'
         )
-        # Common actions patterns
-        self.navigate_patterns = [
-            r'(?:go to|open|navigate to|visit)\s+(?:the\s+)?(?:website|site|page)?\s*(?:at|of|called|named)?\s*([\w\s.-]+)',
-            r'(?:go to|open|navigate to|visit)\s+(https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w%!.~\'()*+,;=:@/&?#]*)?)'
-        ]
-        self.search_patterns = [
+        self.search_pattern = _combine_patterns(
             r'(?:search for|look up|find)\s+([\w\s.-]+)',
             r'(?:search|google|bing|yahoo)\s+([\w\s.-]+)'
-        ]
-        self.login_patterns = [
+        )
+        self.login_pattern = _combine_patterns(
+            rf'(?:log|sign) (?:in|into)\s+(?:to\s+)?({URL_SRC})',
             r'(?:log|sign) (?:in|into)\s+(?:to\s+)?(?:the\s+)?(?:website|site|page)?\s*(?:at|of|called|named)?\s*([\w\s.-]+)',
-            r'(?:log|sign) (?:in|into)\s+(?:to\s+)?(https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w%!.~\'()*+,;=:@/&?#]*)?)',
             r'(?:log|sign) (?:in|into)\s+(?:with|using)\s+(?:username|user)\s+[\'"]?([\w\s@.-]+)[\'"]?\s+(?:and|with)\s+(?:password|pass)\s+[\'"]?([\w\s@.-]+)[\'"]?'
-        ]
+        )
     
     async def parse_command(self, command: str) -> Dict[str, Any]:
         """
@@ -71,12 +184,21 @@ class CommandParser:
             logger.debug(f"Parsed via pattern matching: {pattern_result}")
             return pattern_result
         
+        # Reuse an earlier LLM parse of the same command
+        cache_key = command.strip()
+        cached_result = self.response_cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug(f"Parsed via response cache: {cached_result}")
+            return cached_result
+        
         # Fall back to language model inference
         lm_result = await self._lm_parse(command)
         logger.debug(f"Parsed via language model: {lm_result}")
         
         # Validate the result
         validated_result = validate_parsed_command(lm_result)
+        if validated_result.get("action") != "error":
+            self.response_cache.put(cache_key, validated_result)
         return validated_result
     
     def _pattern_match(self, command: str) -> Optional[Dict[str, Any]]:
@@ -89,103 +211,113 @@ class CommandParser:
         Returns:
             Structured command or None if no pattern matches
         """
+        # Cheap substring checks rule out families before running any regex
+        folded = command.casefold()
+        
         # Check for navigation patterns
-        for pattern in self.navigate_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
-            if match:
-                target = match.group(1)
-                # Check if the target is a URL
-                if not self.url_pattern.match(target) and not target.startswith("http"):
-                    # Try to convert to a URL
-                    if "." in target and " " not in target:
-                        target = f"https://{target}"
-                    else:
-                        target = f"https://www.google.com/search?q={target.replace(' ', '+')}"
+        match = (
+            self.navigate_pattern.search(command)
+            if any(anchor in folded for anchor in _NAVIGATE_ANCHORS) else None
+        )
+        if match:
+            target = _matched_groups(match)[0]
+            # The URL alternative only captures targets with a scheme, so
+            # the prefix alone tells whether the target is already a URL
+            if not target.startswith(_URL_SCHEMES):
+                # Try to convert to a URL
+                if "." in target and " " not in target:
+                    target = f"https://{target}"
+                else:
+                    target = f"https://www.google.com/search?q={quote_plus(target)}"
+            return {
+                "action": "navigate",
+                "target_url": target,
+                "elements": [],
+                "inputs": {},
+                "parameters": {}
+            }
+        
+        # Check for search patterns
+        match = (
+            self.search_pattern.search(command)
+            if any(anchor in folded for anchor in _SEARCH_ANCHORS) else None
+        )
+        if match:
+            search_term = _matched_groups(match)[0]
+            return {
+                "action": "search",
+                "target_url": "https://www.google.com",
+                "elements": [
+                    {
+                        "description": "search box",
+                        "role": "input"
+                    }
+                ],
+                "inputs": {
+                    "search_term": search_term
+                },
+                "parameters": {}
+            }
+        
+        # Check for login patterns
+        match = (
+            self.login_pattern.search(command)
+            if any(anchor in folded for anchor in _LOGIN_ANCHORS) else None
+        )
+        if match:
+            groups = _matched_groups(match)
+            if len(groups) == 1:
+                # Just site name or URL
+                target = groups[0]
+                if not target.startswith(_URL_SCHEMES):
+                    target = f"https://{target}"
                 return {
-                    "action": "navigate",
+                    "action": "login",
                     "target_url": target,
-                    "elements": [],
+                    "elements": [
+                        {
+                            "description": "username field",
+                            "role": "input"
+                        },
+                        {
+                            "description": "password field",
+                            "role": "input"
+                        },
+                        {
+                            "description": "login button",
+                            "role": "button"
+                        }
+                    ],
                     "inputs": {},
                     "parameters": {}
                 }
-        
-        # Check for search patterns
-        for pattern in self.search_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
-            if match:
-                search_term = match.group(1)
+            elif len(groups) == 2:
+                # Username and password provided
+                username, password = groups
                 return {
-                    "action": "search",
-                    "target_url": "https://www.google.com",
+                    "action": "login",
+                    "target_url": None,
                     "elements": [
                         {
-                            "description": "search box",
+                            "description": "username field",
+                            "role": "input"
+                        },
+                        {
+                            "description": "password field",
                             "role": "input"
+                        },
+                        {
+                            "description": "login button",
+                            "role": "button"
                         }
                     ],
                     "inputs": {
-                        "search_term": search_term
+                        "username": username,
+                        "password": password
                     },
                     "parameters": {}
                 }
         
-        # Check for login patterns
-        for pattern in self.login_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 1:
-                    # Just site name or URL
-                    target = match.group(1)
-                    if not self.url_pattern.match(target) and not target.startswith("http"):
-                        target = f"https://{target}"
-                    return {
-                        "action": "login",
-                        "target_url": target,
-                        "elements": [
-                            {
-                                "description": "username field",
-                                "role": "input"
-                            },
-                            {
-                                "description": "password field",
-                                "role": "input"
-                            },
-                            {
-                                "description": "login button",
-                                "role": "button"
-                            }
-                        ],
-                        "inputs": {},
-                        "parameters": {}
-                    }
-                elif len(match.groups()) == 2:
-                    # Username and password provided
-                    username = match.group(1)
-                    password = match.group(2)
-                    return {
-                        "action": "login",
-                        "target_url": None,
-                        "elements": [
-                            {
-                                "description": "username field",
-                                "role": "input"
-                            },
-                            {
-                                "description": "password field",
-                                "role": "input"
-                            },
-                            {
-                                "description": "login button",
-                                "role": "button"
-                            }
-                        ],
-                        "inputs": {
-                            "username": username,
-                            "password": password
-                        },
-                        "parameters": {}
-                    }
-        
         # No pattern matched
         return None
     
@@ -199,8 +331,6 @@ class CommandParser:
         Returns:
             Structured command from LLM inference
         """
-        from nlp.context import ContextManager
-        
         # Get the prompt
         prompt = get_prompt("command_parse", command=command)
         
@@ -212,14 +342,7 @@ class CommandParser:
         
         # Extract and parse JSON from the response
         try:
-            # Find JSON in the response
-            json_match = re.search(r'```json\n(.*?)\n```|{.*}', result, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1) if json_match.group(1) else json_match.group(0)
-                parsed_result = json.loads(json_str)
-            else:
-                # Try to parse the entire response as JSON
-                parsed_result = json.loads(result)
+            parsed_result = parse_llm_json(result)
             
             # Ensure all required fields are present
             if "action" not in parsed_result:
@@ -258,25 +381,7 @@ class CommandParser:
         Returns:
             Response from the OpenAI API
         """
-        # This would be implemented with actual API calls
-        # Using a placeholder implementation for now
-        logger.debug("Calling OpenAI API")
-        try:
-            import openai
-            
-            openai.api_key = self.settings.openai_api_key
-            
-            response = await openai.ChatCompletion.acreate(
-                model=self.settings.openai_model,
-                messages=[{"role": "system", "content": prompt}],
-                temperature=self.settings.temperature,
-                max_tokens=self.settings.max_tokens
-            )
-            
-            return response.choices[0].message.content
-        except Exception as e:
-            logger.error(f"Error calling OpenAI API: {e}")
-            return "{}"
+        return await call_openai(self.settings, prompt)
     
     async def _call_anthropic(self, prompt: str) -> str:
         """
@@ -288,22 +393,4 @@ class CommandParser:
         Returns:
             Response from the Anthropic API
         """
-        # This would be implemented with actual API calls
-        # Using a placeholder implementation for now
-        logger.debug("Calling Anthropic API")
-        try:
-            import anthropic
-            
-            client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
-            
-            response = await client.completions.create(
-                model=self.settings.anthropic_model,
-                prompt=prompt,
-                max_tokens_to_sample=self.settings.max_tokens,
-                temperature=self.settings.temperature
-            )
-            
-            return response.completion
-        except Exception as e:
-            logger.error(f"Error calling Anthropic API: {e}")
-            return "{}"
+        return await call_anthropic(self.settings, prompt)
@@ -5,17 +5,374 @@ This module is responsible for converting structured command instructions into
 executable task sequences that can be performed by the browser automation system.
 """
 
+import asyncio
+import copy
+import hashlib
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 from config.settings import Settings
 from config.prompts import get_prompt
+from nlp._llm_clients import call_llm
+from nlp._patterns import parse_llm_json
 from nlp.context import ContextManager
+from nlp.parser import ResponseCache
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Shared encoders; json.dumps builds a new encoder per call whenever it is
+# given non-default options
+_encode_compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_encode_canonical = json.JSONEncoder(sort_keys=True, default=str).encode
+
+# Most commands planned together in one batched LLM request
+_MAX_PLAN_BATCH = 8
+
+# Actions whose specialized planners delegate to the LLM and must be awaited
+_LLM_PLANNED_ACTIONS = frozenset({"extract", "fill"})
+
+# Error recovery configurations shared by generated steps. Consumers only
+# read them, so every plan references the same objects; tuples keep the
+# shared values immutable.
+_RECOVERY_DEFAULT = {
+    "conditions": ("timeout", "element_not_found"),
+    "actions": ("retry", "wait", "abort")
+}
+_RECOVERY_ABORT = {
+    "conditions": (),
+    "actions": ("abort",)
+}
+_RECOVERY_NAVIGATION = {
+    "conditions": ("timeout", "navigation_error"),
+    "actions": ("retry", "check_connection", "abort")
+}
+_RECOVERY_WAIT_SCROLL = {
+    "conditions": ("timeout", "element_not_found"),
+    "actions": ("scroll_into_view", "retry", "abort")
+}
+_RECOVERY_CLICK = {
+    "conditions": ("element_not_found", "element_not_clickable"),
+    "actions": ("scroll_into_view", "retry", "abort")
+}
+_RECOVERY_WAIT = {
+    "conditions": ("timeout", "element_not_found"),
+    "actions": ("retry", "abort")
+}
+_RECOVERY_INPUT = {
+    "conditions": ("element_not_found", "input_error"),
+    "actions": ("retry", "abort")
+}
+_RECOVERY_TIMEOUT = {
+    "conditions": ("timeout",),
+    "actions": ("retry", "abort")
+}
+_RECOVERY_WAIT_LOGIN_FIELD = {
+    "conditions": ("timeout", "element_not_found"),
+    "actions": ("retry", "find_login_link", "abort")
+}
+_RECOVERY_LOGIN_SUBMIT = {
+    "conditions": ("element_not_found", "element_not_clickable"),
+    "actions": ("retry", "press_enter", "abort")
+}
+_RECOVERY_LOGIN_WAIT = {
+    "conditions": ("timeout", "navigation_error"),
+    "actions": ("check_login_status", "retry", "abort")
+}
+_RECOVERY_LOGIN_CHECK = {
+    "conditions": ("login_failed", "captcha_detected"),
+    "actions": ("handle_captcha", "report_login_error", "abort")
+}
+_RECOVERY_SCROLL = {
+    "conditions": ("page_error",),
+    "actions": ("retry", "abort")
+}
+_RECOVERY_NONE = {
+    "conditions": (),
+    "actions": ()
+}
+
+# Command fields that vary between otherwise identical requests, and the
+# placeholders they are replaced with in cached LLM plans
+_PLAN_PLACEHOLDERS = (
+    ("<URL>", ("target_url",)),
+    ("<SEARCH>", ("inputs", "search_term")),
+    ("<USERNAME>", ("inputs", "username")),
+    ("<PASSWORD>", ("inputs", "password")),
+)
+
+# Step parameter each placeholder's value may fill in a cached plan template
+_PLACEHOLDER_SLOTS = {
+    "<URL>": "url",
+    "<SEARCH>": "text",
+    "<USERNAME>": "text",
+    "<PASSWORD>": "text",
+}
+
+
+def _error_plan(message: str, description: str, expected_outcome: str) -> Dict[str, Any]:
+    """
+    Build a single-step plan that reports an error and aborts.
+    
+    Args:
+        message: Error message for the step parameters
+        description: Human-readable step description
+        expected_outcome: Expected outcome of the plan
+        
+    Returns:
+        Task plan with one error step
+    """
+    return {
+        "steps": [
+            {
+                "action": "error",
+                "params": {"error_message": message},
+                "description": description,
+                "error_recovery": _RECOVERY_ABORT
+            }
+        ],
+        "expected_outcome": expected_outcome
+    }
+
+
+def _plan_cache_key(parsed_command: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+    """
+    Build the plan cache key for a command with its volatile fields abstracted.
+    
+    Args:
+        parsed_command: The parsed command
+        
+    Returns:
+        Tuple of (cache key, mapping of placeholder to the command's value)
+    """
+    canonical = dict(parsed_command)
+    if isinstance(canonical.get("inputs"), dict):
+        canonical["inputs"] = dict(canonical["inputs"])
+    
+    values = {}
+    for placeholder, path in _PLAN_PLACEHOLDERS:
+        container = canonical
+        for part in path[:-1]:
+            container = container.get(part)
+            if not isinstance(container, dict):
+                break
+        else:
+            value = container.get(path[-1])
+            if isinstance(value, str) and value:
+                container[path[-1]] = placeholder
+                values[placeholder] = value
+    
+    serialized = _encode_canonical(canonical)
+    key = hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+    return key, values
+
+
+def _substitute(obj: Any, replacements: Dict[str, str]) -> Any:
+    """
+    Copy a plan structure with whole-string replacements applied.
+    
+    Only strings equal to a key are replaced, so a value that also occurs
+    inside a selector or URL cannot corrupt it.
+    
+    Args:
+        obj: Plan structure (dicts, lists and scalars)
+        replacements: Mapping of text to its replacement
+        
+    Returns:
+        New structure with replacements applied
+    """
+    if isinstance(obj, str):
+        return replacements.get(obj, obj)
+    if isinstance(obj, dict):
+        return {key: _substitute(value, replacements) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_substitute(item, replacements) for item in obj]
+    return obj
+
+
+def _is_templatable(obj: Any, slots: Dict[str, str], field: Optional[str] = None) -> bool:
+    """
+    Check whether a plan can be stored as a template for its command's values.
+    
+    Whole-string substitution only swaps a value back correctly where it fills
+    its own parameter. A value inside a longer string would be left in place,
+    and one that also equals another field (an action, key or element) would
+    be replaced there too.
+    
+    Args:
+        obj: Plan structure (dicts, lists and scalars)
+        slots: Mapping of command value to the step parameter it may fill
+        field: Key the structure is stored under, if any
+        
+    Returns:
+        True if every value occurs only as a whole string in its own slot
+    """
+    if isinstance(obj, str):
+        for value, slot in slots.items():
+            if obj == value:
+                if field != slot:
+                    return False
+            elif value in obj:
+                return False
+        return True
+    if isinstance(obj, dict):
+        return all(_is_templatable(value, slots, key) for key, value in obj.items())
+    if isinstance(obj, list):
+        return all(_is_templatable(item, slots, field) for item in obj)
+    return True
+
+
+def _cancel_waiting(queued: List[Tuple[str, "asyncio.Future[str]"]]) -> None:
+    """
+    Cancel the futures of queued planning requests that are still pending.
+    
+    Args:
+        queued: Queued (command JSON, future) pairs
+    """
+    for _, future in queued:
+        if not future.done():
+            future.cancel()
+
+
+class _PlanBatcher:
+    """
+    Coalesces LLM planning requests that arrive within a short window.
+    
+    Requests collected in the window are planned with a single LLM call that
+    returns an array of plans, which are handed back to their callers. If the
+    batched response cannot be split, each command is planned on its own.
+    """
+    __slots__ = ("settings", "window", "_pending", "_flush_tasks")
+    
+    def __init__(self, settings: Settings):
+        """
+        Initialize the batcher.
+        
+        Args:
+            settings: Application settings
+        """
+        self.settings = settings
+        self.window = settings.plan_batch_window_ms / 1000
+        self._pending: List[Tuple[str, "asyncio.Future[str]"]] = []
+        # Running flush tasks, referenced until done so they are not collected
+        self._flush_tasks: Set["asyncio.Task[None]"] = set()
+    
+    async def submit(self, command_str: str) -> str:
+        """
+        Queue a command for planning and wait for its LLM response.
+        
+        Args:
+            command_str: The parsed command serialized as JSON
+            
+        Returns:
+            LLM response text holding the plan for this command
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((command_str, future))
+        if len(self._pending) == 1:
+            task = asyncio.ensure_future(self._flush_after_window())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_done)
+        return await future
+    
+    def _flush_done(self, task: "asyncio.Task[None]") -> None:
+        """
+        Forget a finished flush task and retrieve its outcome.
+        
+        Args:
+            task: The finished flush task
+        """
+        self._flush_tasks.discard(task)
+        if task.cancelled():
+            # Cancelled before taking the queue (no newer flush exists):
+            # release the callers it was going to plan for
+            if not self._flush_tasks:
+                pending, self._pending = self._pending, []
+                _cancel_waiting(pending)
+        elif task.exception() is not None:
+            logger.debug(f"Plan batch flush failed: {task.exception()}")
+    
+    async def _flush_after_window(self) -> None:
+        """Plan everything queued during the batching window."""
+        await asyncio.sleep(self.window)
+        pending, self._pending = self._pending, []
+        
+        batches = [pending[i:i + _MAX_PLAN_BATCH] for i in range(0, len(pending), _MAX_PLAN_BATCH)]
+        try:
+            await asyncio.gather(*(self._run_batch(batch) for batch in batches))
+        finally:
+            # No caller may be left waiting, whatever stopped the batches
+            _cancel_waiting(pending)
+    
+    async def _run_batch(self, batch: List[Tuple[str, "asyncio.Future[str]"]]) -> None:
+        """
+        Plan one batch and resolve its futures.
+        
+        Args:
+            batch: Queued (command JSON, future) pairs
+        """
+        commands = [command_str for command_str, _ in batch]
+        try:
+            if len(commands) == 1:
+                results = [await self._plan_one(commands[0])]
+            else:
+                results = await self._plan_many(commands)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            _cancel_waiting(batch)
+            raise
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def _plan_one(self, command_str: str) -> str:
+        """
+        Plan a single command.
+        
+        Args:
+            command_str: The parsed command serialized as JSON
+            
+        Returns:
+            LLM response text
+        """
+        prompt = get_prompt("task_planning", parsed_command=command_str)
+        return await call_llm(self.settings, prompt)
+    
+    async def _plan_many(self, commands: List[str]) -> List[str]:
+        """
+        Plan several commands with one LLM call.
+        
+        Args:
+            commands: Parsed commands serialized as JSON
+            
+        Returns:
+            Response text for each command, in order
+        """
+        prompt = get_prompt(
+            "task_planning_batch",
+            count=len(commands),
+            parsed_commands="\n".join(f"{i}. {command_str}" for i, command_str in enumerate(commands, 1))
+        )
+        result = await call_llm(self.settings, prompt)
+        
+        try:
+            plans = parse_llm_json(result, opener="[")
+        except (json.JSONDecodeError, AttributeError) as e:
+            plans = None
+            logger.debug(f"Could not parse batched task plans: {e}")
+        
+        if isinstance(plans, list) and len(plans) == len(commands) and all(isinstance(plan, dict) for plan in plans):
+            return [json.dumps(plan) for plan in plans]
+        
+        logger.debug(f"Batched planning of {len(commands)} commands failed, planning individually")
+        return list(await asyncio.gather(*(self._plan_one(command_str) for command_str in commands)))
+
 
 class TaskPlanner:
     """
@@ -24,6 +381,7 @@ class TaskPlanner:
     Converts structured command instructions into a sequence of executable
     browser automation steps.
     """
+    __slots__ = ("settings", "context_manager", "_plan_cache", "_batcher", "_last_key", "_last_plan")
     
     def __init__(self, settings: Settings, context_manager: ContextManager):
         """
@@ -36,17 +394,16 @@ class TaskPlanner:
         self.settings = settings
         self.context_manager = context_manager
         
-        # Map of action types to planning functions
-        self.action_planners = {
-            "navigate": self._plan_navigation,
-            "click": self._plan_click,
-            "search": self._plan_search,
-            "extract": self._plan_extraction,
-            "login": self._plan_login,
-            "fill": self._plan_form_fill,
-            "scroll": self._plan_scroll,
-            "wait": self._plan_wait,
-        }
+        # LLM plans stored as templates, reused for commands that differ only
+        # in their URL, search term or credentials
+        self._plan_cache = ResponseCache(settings.llm_cache_size)
+        
+        # Optional micro-batching of concurrent LLM planning requests
+        self._batcher = _PlanBatcher(settings) if settings.plan_batch_window_ms > 0 else None
+        
+        # Most recent command and its plan, for immediate re-plans
+        self._last_key: Optional[str] = None
+        self._last_plan: Optional[Dict[str, Any]] = None
     
     async def plan_tasks(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -58,18 +415,38 @@ class TaskPlanner:
         Returns:
             A task plan with executable steps
         """
-        logger.info(f"Planning tasks for command: {parsed_command['action']}")
+        logger.info("Planning tasks for command: %s", parsed_command["action"])
+        
+        # Re-planning the previous command returns a copy of its plan
+        key = _encode_canonical(parsed_command)
+        if key == self._last_key:
+            logger.debug("Reusing task plan of the previous identical command")
+            task_plan = copy.deepcopy(self._last_plan)
+            self.context_manager.add_task_plan(task_plan)
+            return task_plan
         
         # Check if we have a specialized planner for this action
         action = parsed_command.get("action", "unknown")
-        if action in self.action_planners:
-            # Use specialized planning
-            task_plan = await self.action_planners[action](parsed_command)
-            logger.debug(f"Generated task plan using specialized planner: {task_plan}")
+        planner = self._ACTION_PLANNERS.get(action)
+        if planner is not None:
+            # Use specialized planning; only the LLM-backed planners are async
+            task_plan = planner(self, parsed_command)
+            if action in _LLM_PLANNED_ACTIONS:
+                task_plan = await task_plan
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated task plan using specialized planner: %s", task_plan)
         else:
             # Use general LLM planning
             task_plan = await self._plan_with_llm(parsed_command)
-            logger.debug(f"Generated task plan using LLM: {task_plan}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated task plan using LLM: %s", task_plan)
+        
+        # Remember the plan unless it failed, so a retry plans afresh
+        if any(step.get("action") == "error" for step in task_plan.get("steps", [])):
+            self._last_key = self._last_plan = None
+        else:
+            self._last_key = key
+            self._last_plan = copy.deepcopy(task_plan)
         
         # Add task plan to context
         self.context_manager.add_task_plan(task_plan)
@@ -86,74 +463,66 @@ class TaskPlanner:
         Returns:
             Task plan from LLM inference
         """
-        # Get planning prompt
-        command_str = json.dumps(parsed_command, indent=2)
-        prompt = get_prompt("task_planning", parsed_command=command_str)
+        # Reuse the plan of an equivalent earlier command, with its values swapped in
+        cache_key, values = _plan_cache_key(parsed_command)
+        template = self._plan_cache.get(cache_key)
+        if template is not None:
+            logger.debug("Reusing cached LLM task plan template")
+            return _substitute(template, values)
+        
+        # Get planning prompt; compact JSON keeps the prompt short and stays on
+        # the C encoder (indent=2 falls back to the pure-Python one)
+        command_str = _encode_compact(parsed_command)
         
         # Call appropriate LLM API based on settings
-        if self.settings.default_llm_provider == "openai":
-            from nlp.parser import CommandParser
-            result = await CommandParser(self.settings)._call_openai(prompt)
-        else:  # anthropic
-            from nlp.parser import CommandParser
-            result = await CommandParser(self.settings)._call_anthropic(prompt)
+        if self._batcher is not None:
+            result = await self._batcher.submit(command_str)
+        else:
+            prompt = get_prompt("task_planning", parsed_command=command_str)
+            result = await call_llm(self.settings, prompt)
         
         # Extract and parse JSON from the response
         try:
-            import re
-            
-            # Find JSON in the response
-            json_match = re.search(r'```json\n(.*?)\n```|{.*}', result, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1) if json_match.group(1) else json_match.group(0)
-                task_plan = json.loads(json_str)
-            else:
-                # Try to parse the entire response as JSON
-                task_plan = json.loads(result)
+            task_plan = parse_llm_json(result)
             
             # Ensure plan has required fields
             if "steps" not in task_plan:
                 task_plan["steps"] = []
-            if "expected_outcome" not in task_plan:
-                task_plan["expected_outcome"] = "Complete the requested action"
+            task_plan.setdefault("expected_outcome", "Complete the requested action")
                 
-            # Validate steps structure
-            for i, step in enumerate(task_plan["steps"]):
-                if "action" not in step:
-                    step["action"] = "unknown"
+            # Validate steps structure; constant defaults use setdefault, the
+            # per-step ones are only built when missing
+            for i, step in enumerate(task_plan["steps"], 1):
+                step.setdefault("action", "unknown")
                 if "params" not in step:
                     step["params"] = {}
                 if "description" not in step:
-                    step["description"] = f"Step {i+1}"
-                if "error_recovery" not in step:
-                    step["error_recovery"] = {
-                        "conditions": ["timeout", "element_not_found"],
-                        "actions": ["retry", "wait", "abort"]
-                    }
+                    step["description"] = f"Step {i}"
+                step.setdefault("error_recovery", _RECOVERY_DEFAULT)
+            
+            # Store with the command's values abstracted back to placeholders,
+            # unless equal values or a value outside its slot make that ambiguous
+            reverse = {value: placeholder for placeholder, value in values.items()}
+            slots = {value: _PLACEHOLDER_SLOTS[placeholder] for value, placeholder in reverse.items()}
+            if (
+                len(reverse) == len(values)
+                and not any(step["action"] == "error" for step in task_plan["steps"])
+                and _is_templatable(task_plan, slots)
+            ):
+                self._plan_cache.put(cache_key, _substitute(task_plan, reverse))
             
             return task_plan
         
         except (json.JSONDecodeError, AttributeError) as e:
             logger.error(f"Error parsing LLM task plan response: {e}")
             # Return a minimal valid task plan
-            return {
-                "steps": [
-                    {
-                        "action": "error",
-                        "params": {
-                            "error_message": f"Failed to create task plan: {str(e)}"
-                        },
-                        "description": "Error in task planning",
-                        "error_recovery": {
-                            "conditions": [],
-                            "actions": ["abort"]
-                        }
-                    }
-                ],
-                "expected_outcome": "Error in task planning"
-            }
+            return _error_plan(
+                f"Failed to create task plan: {str(e)}",
+                "Error in task planning",
+                "Error in task planning"
+            )
     
-    async def _plan_navigation(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_navigation(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a task plan for navigation.
         
@@ -166,22 +535,11 @@ class TaskPlanner:
         target_url = parsed_command.get("target_url")
         
         if not target_url:
-            return {
-                "steps": [
-                    {
-                        "action": "error",
-                        "params": {
-                            "error_message": "No target URL provided for navigation"
-                        },
-                        "description": "Error: Missing target URL",
-                        "error_recovery": {
-                            "conditions": [],
-                            "actions": ["abort"]
-                        }
-                    }
-                ],
-                "expected_outcome": "Error: Cannot navigate without a target URL"
-            }
+            return _error_plan(
+                "No target URL provided for navigation",
+                "Error: Missing target URL",
+                "Error: Cannot navigate without a target URL"
+            )
         
         # Simple navigation plan
         return {
@@ -193,16 +551,13 @@ class TaskPlanner:
                         "wait_until": "networkidle"
                     },
                     "description": f"Navigate to {target_url}",
-                    "error_recovery": {
-                        "conditions": ["timeout", "navigation_error"],
-                        "actions": ["retry", "check_connection", "abort"]
-                    }
+                    "error_recovery": _RECOVERY_NAVIGATION
                 }
             ],
             "expected_outcome": f"Successfully navigated to {target_url}"
         }
     
-    async def _plan_click(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_click(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a task plan for clicking an element.
         
@@ -215,22 +570,11 @@ class TaskPlanner:
         elements = parsed_command.get("elements", [])
         
         if not elements:
-            return {
-                "steps": [
-                    {
-                        "action": "error",
-                        "params": {
-                            "error_message": "No target element provided for clicking"
-                        },
-                        "description": "Error: Missing target element",
-                        "error_recovery": {
-                            "conditions": [],
-                            "actions": ["abort"]
-                        }
-                    }
-                ],
-                "expected_outcome": "Error: Cannot click without a target element"
-            }
+            return _error_plan(
+                "No target element provided for clicking",
+                "Error: Missing target element",
+                "Error: Cannot click without a target element"
+            )
         
         # Get the first element description
         element_desc = elements[0].get("description", "element")
@@ -247,10 +591,7 @@ class TaskPlanner:
                     "wait_until": "networkidle"
                 },
                 "description": f"Navigate to {parsed_command['target_url']}",
-                "error_recovery": {
-                    "conditions": ["timeout", "navigation_error"],
-                    "actions": ["retry", "check_connection", "abort"]
-                }
+                "error_recovery": _RECOVERY_NAVIGATION
             })
         
         # Add step to wait for the element to be visible
@@ -262,10 +603,7 @@ class TaskPlanner:
                 "timeout": self.settings.wait_timeout
             },
             "description": f"Wait for {element_desc} to be visible",
-            "error_recovery": {
-                "conditions": ["timeout", "element_not_found"],
-                "actions": ["scroll_into_view", "retry", "abort"]
-            }
+            "error_recovery": _RECOVERY_WAIT_SCROLL
         })
         
         # Add click step
@@ -275,10 +613,7 @@ class TaskPlanner:
                 "element": element_desc
             },
             "description": f"Click on {element_desc}",
-            "error_recovery": {
-                "conditions": ["element_not_found", "element_not_clickable"],
-                "actions": ["scroll_into_view", "retry", "abort"]
-            }
+            "error_recovery": _RECOVERY_CLICK
         })
         
         return {
@@ -286,7 +621,7 @@ class TaskPlanner:
             "expected_outcome": f"Successfully clicked on {element_desc}"
         }
     
-    async def _plan_search(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_search(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a task plan for performing a search.
         
@@ -299,102 +634,59 @@ class TaskPlanner:
         search_term = parsed_command.get("inputs", {}).get("search_term")
         
         if not search_term:
-            return {
-                "steps": [
-                    {
-                        "action": "error",
-                        "params": {
-                            "error_message": "No search term provided"
-                        },
-                        "description": "Error: Missing search term",
-                        "error_recovery": {
-                            "conditions": [],
-                            "actions": ["abort"]
-                        }
-                    }
-                ],
-                "expected_outcome": "Error: Cannot search without a search term"
-            }
-        
-        # Search plan
-        steps = []
+            return _error_plan(
+                "No search term provided",
+                "Error: Missing search term",
+                "Error: Cannot search without a search term"
+            )
         
         # First, navigate to the search engine if provided
         target_url = parsed_command.get("target_url", "https://www.google.com")
-        steps.append({
-            "action": "navigate",
-            "params": {
-                "url": target_url,
-                "wait_until": "networkidle"
-            },
-            "description": f"Navigate to {target_url}",
-            "error_recovery": {
-                "conditions": ["timeout", "navigation_error"],
-                "actions": ["retry", "check_connection", "abort"]
-            }
-        })
         
-        # Wait for search box
+        # Use the described search box if one was given
         search_box_desc = "search box"
         for element in parsed_command.get("elements", []):
             if element.get("role") == "input":
                 search_box_desc = element.get("description", search_box_desc)
                 break
-                
-        steps.append({
-            "action": "wait",
-            "params": {
-                "element": search_box_desc,
-                "state": "visible",
-                "timeout": self.settings.wait_timeout
-            },
-            "description": f"Wait for {search_box_desc} to be visible",
-            "error_recovery": {
-                "conditions": ["timeout", "element_not_found"],
-                "actions": ["retry", "abort"]
-            }
-        })
         
-        # Type search term
-        steps.append({
-            "action": "type",
-            "params": {
-                "element": search_box_desc,
-                "text": search_term
+        # Search plan: navigate, wait for the box, type, submit, wait for results
+        steps = [
+            {
+                "action": "navigate",
+                "params": {"url": target_url, "wait_until": "networkidle"},
+                "description": f"Navigate to {target_url}",
+                "error_recovery": _RECOVERY_NAVIGATION
             },
-            "description": f"Type '{search_term}' into {search_box_desc}",
-            "error_recovery": {
-                "conditions": ["element_not_found", "input_error"],
-                "actions": ["retry", "abort"]
-            }
-        })
-        
-        # Submit search
-        steps.append({
-            "action": "press",
-            "params": {
-                "key": "Enter"
+            {
+                "action": "wait",
+                "params": {
+                    "element": search_box_desc,
+                    "state": "visible",
+                    "timeout": self.settings.wait_timeout
+                },
+                "description": f"Wait for {search_box_desc} to be visible",
+                "error_recovery": _RECOVERY_WAIT
             },
-            "description": "Press Enter to submit search",
-            "error_recovery": {
-                "conditions": ["timeout"],
-                "actions": ["retry", "abort"]
-            }
-        })
-        
-        # Wait for results
-        steps.append({
-            "action": "wait",
-            "params": {
-                "state": "networkidle",
-                "timeout": self.settings.navigation_timeout
+            {
+                "action": "type",
+                "params": {"element": search_box_desc, "text": search_term},
+                "description": f"Type '{search_term}' into {search_box_desc}",
+                "error_recovery": _RECOVERY_INPUT
+            },
+            {
+                "action": "press",
+                "params": {"key": "Enter"},
+                "description": "Press Enter to submit search",
+                "error_recovery": _RECOVERY_TIMEOUT
             },
-            "description": "Wait for search results to load",
-            "error_recovery": {
-                "conditions": ["timeout"],
-                "actions": ["retry", "abort"]
+            {
+                "action": "wait",
+                "params": {"state": "networkidle", "timeout": self.settings.navigation_timeout},
+                "description": "Wait for search results to load",
+                "error_recovery": _RECOVERY_TIMEOUT
             }
-        })
+        ]
         
         return {
             "steps": steps,
@@ -411,10 +703,38 @@ class TaskPlanner:
         Returns:
             Task plan for data extraction
         """
+        # Elements that already carry selectors are extracted directly
+        elements = parsed_command.get("elements") or []
+        if elements and all(isinstance(element, dict) and element.get("selector") for element in elements):
+            steps = []
+            if parsed_command.get("target_url"):
+                steps.append({
+                    "action": "navigate",
+                    "params": {
+                        "url": parsed_command["target_url"],
+                        "wait_until": "networkidle"
+                    },
+                    "description": f"Navigate to {parsed_command['target_url']}",
+                    "error_recovery": _RECOVERY_NAVIGATION
+                })
+            steps.extend(
+                {
+                    "action": "extract",
+                    "params": {"selector": element["selector"]},
+                    "description": f"Extract {element.get('description', element['selector'])}",
+                    "error_recovery": _RECOVERY_WAIT
+                }
+                for element in elements
+            )
+            return {
+                "steps": steps,
+                "expected_outcome": f"Extracted {len(elements)} fields"
+            }
+        
         # For more complex extraction, use LLM planning
         return await self._plan_with_llm(parsed_command)
     
-    async def _plan_login(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_login(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a task plan for logging into a website.
         
@@ -429,112 +749,37 @@ class TaskPlanner:
         password = parsed_command.get("inputs", {}).get("password")
         
         if not target_url:
-            return {
-                "steps": [
-                    {
-                        "action": "error",
-                        "params": {
-                            "error_message": "No target URL provided for login"
-                        },
-                        "description": "Error: Missing target URL",
-                        "error_recovery": {
-                            "conditions": [],
-                            "actions": ["abort"]
-                        }
-                    }
-                ],
-                "expected_outcome": "Error: Cannot login without a target website"
-            }
-        
-        # Login plan
-        steps = []
-        
-        # Navigate to the website
-        steps.append({
-            "action": "navigate",
-            "params": {
-                "url": target_url,
-                "wait_until": "networkidle"
-            },
-            "description": f"Navigate to {target_url}",
-            "error_recovery": {
-                "conditions": ["timeout", "navigation_error"],
-                "actions": ["retry", "check_connection", "abort"]
-            }
-        })
-        
-        # Find and interact with username field
-        steps.append({
-            "action": "wait",
-            "params": {
-                "element": "username field",
-                "state": "visible",
-                "timeout": self.settings.wait_timeout
-            },
-            "description": "Wait for username field to be visible",
-            "error_recovery": {
-                "conditions": ["timeout", "element_not_found"],
-                "actions": ["retry", "find_login_link", "abort"]
-            }
-        })
+            return _error_plan(
+                "No target URL provided for login",
+                "Error: Missing target URL",
+                "Error: Cannot login without a target website"
+            )
         
+        # Type credentials that were given, otherwise ask the user for them
         if username:
-            steps.append({
+            username_step = {
                 "action": "type",
-                "params": {
-                    "element": "username field",
-                    "text": username
-                },
+                "params": {"element": "username field", "text": username},
                 "description": f"Type username '{username}'",
-                "error_recovery": {
-                    "conditions": ["element_not_found", "input_error"],
-                    "actions": ["retry", "abort"]
-                }
-            })
+                "error_recovery": _RECOVERY_INPUT
+            }
         else:
-            steps.append({
+            username_step = {
                 "action": "user_input",
-                "params": {
-                    "prompt": "Please enter your username:",
-                    "field": "username field"
-                },
+                "params": {"prompt": "Please enter your username:", "field": "username field"},
                 "description": "Request and input username from user",
-                "error_recovery": {
-                    "conditions": ["element_not_found", "input_error"],
-                    "actions": ["retry", "abort"]
-                }
-            })
-        
-        # Find and interact with password field
-        steps.append({
-            "action": "wait",
-            "params": {
-                "element": "password field",
-                "state": "visible",
-                "timeout": self.settings.wait_timeout
-            },
-            "description": "Wait for password field to be visible",
-            "error_recovery": {
-                "conditions": ["timeout", "element_not_found"],
-                "actions": ["retry", "abort"]
+                "error_recovery": _RECOVERY_INPUT
             }
-        })
         
         if password:
-            steps.append({
+            password_step = {
                 "action": "type",
-                "params": {
-                    "element": "password field",
-                    "text": password
-                },
+                "params": {"element": "password field", "text": password},
                 "description": "Type password (hidden)",
-                "error_recovery": {
-                    "conditions": ["element_not_found", "input_error"],
-                    "actions": ["retry", "abort"]
-                }
-            })
+                "error_recovery": _RECOVERY_INPUT
+            }
         else:
-            steps.append({
+            password_step = {
                 "action": "user_input",
                 "params": {
                     "prompt": "Please enter your password:",
@@ -542,51 +787,58 @@ class TaskPlanner:
                     "is_password": True
                 },
                 "description": "Request and input password from user",
-                "error_recovery": {
-                    "conditions": ["element_not_found", "input_error"],
-                    "actions": ["retry", "abort"]
-                }
-            })
-        
-        # Submit login form
-        steps.append({
-            "action": "click",
-            "params": {
-                "element": "login button"
-            },
-            "description": "Click login button",
-            "error_recovery": {
-                "conditions": ["element_not_found", "element_not_clickable"],
-                "actions": ["retry", "press_enter", "abort"]
+                "error_recovery": _RECOVERY_INPUT
             }
-        })
         
-        # Wait for login completion
-        steps.append({
-            "action": "wait",
-            "params": {
-                "state": "networkidle",
-                "timeout": self.settings.navigation_timeout
+        # Login plan: navigate, fill both fields, submit, then verify
+        steps = [
+            {
+                "action": "navigate",
+                "params": {"url": target_url, "wait_until": "networkidle"},
+                "description": f"Navigate to {target_url}",
+                "error_recovery": _RECOVERY_NAVIGATION
             },
-            "description": "Wait for login to complete",
-            "error_recovery": {
-                "conditions": ["timeout", "navigation_error"],
-                "actions": ["check_login_status", "retry", "abort"]
-            }
-        })
-        
-        # Check for login errors
-        steps.append({
-            "action": "check",
-            "params": {
-                "condition": "login_success"
+            {
+                "action": "wait",
+                "params": {
+                    "element": "username field",
+                    "state": "visible",
+                    "timeout": self.settings.wait_timeout
+                },
+                "description": "Wait for username field to be visible",
+                "error_recovery": _RECOVERY_WAIT_LOGIN_FIELD
             },
-            "description": "Verify successful login",
-            "error_recovery": {
-                "conditions": ["login_failed", "captcha_detected"],
-                "actions": ["handle_captcha", "report_login_error", "abort"]
+            username_step,
+            {
+                "action": "wait",
+                "params": {
+                    "element": "password field",
+                    "state": "visible",
+                    "timeout": self.settings.wait_timeout
+                },
+                "description": "Wait for password field to be visible",
+                "error_recovery": _RECOVERY_WAIT
+            },
+            password_step,
+            {
+                "action": "click",
+                "params": {"element": "login button"},
+                "description": "Click login button",
+                "error_recovery": _RECOVERY_LOGIN_SUBMIT
+            },
+            {
+                "action": "wait",
+                "params": {"state": "networkidle", "timeout": self.settings.navigation_timeout},
+                "description": "Wait for login to complete",
+                "error_recovery": _RECOVERY_LOGIN_WAIT
+            },
+            {
+                "action": "check",
+                "params": {"condition": "login_success"},
+                "description": "Verify successful login",
+                "error_recovery": _RECOVERY_LOGIN_CHECK
             }
-        })
+        ]
         
         return {
             "steps": steps,
@@ -603,10 +855,55 @@ class TaskPlanner:
         Returns:
             Task plan for form filling
         """
+        # Flat inputs whose fields each name a described element are typed directly
+        inputs = parsed_command.get("inputs")
+        descriptions = [
+            element["description"]
+            for element in parsed_command.get("elements") or []
+            if isinstance(element, dict) and isinstance(element.get("description"), str)
+        ]
+        targets = {}
+        if isinstance(inputs, dict) and inputs and descriptions:
+            for field, value in inputs.items():
+                if not isinstance(value, str):
+                    break
+                target = next((desc for desc in descriptions if field.casefold() in desc.casefold()), None)
+                if target is None:
+                    break
+                targets[field] = target
+            else:
+                steps = []
+                if parsed_command.get("target_url"):
+                    steps.append({
+                        "action": "navigate",
+                        "params": {
+                            "url": parsed_command["target_url"],
+                            "wait_until": "networkidle"
+                        },
+                        "description": f"Navigate to {parsed_command['target_url']}",
+                        "error_recovery": _RECOVERY_NAVIGATION
+                    })
+                steps.extend(
+                    {
+                        "action": "type",
+                        "params": {"element": targets[field], "text": value},
+                        "description": (
+                            f"Type {field} (hidden)" if "password" in field.casefold()
+                            else f"Type '{value}' into {targets[field]}"
+                        ),
+                        "error_recovery": _RECOVERY_INPUT
+                    }
+                    for field, value in inputs.items()
+                )
+                return {
+                    "steps": steps,
+                    "expected_outcome": "Successfully filled out the form"
+                }
+        
         # For complex form filling, use LLM planning
         return await self._plan_with_llm(parsed_command)
     
-    async def _plan_scroll(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_scroll(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a task plan for scrolling on a page.
         
@@ -629,16 +926,13 @@ class TaskPlanner:
                         "amount": amount
                     },
                     "description": f"Scroll {direction} by {amount}",
-                    "error_recovery": {
-                        "conditions": ["page_error"],
-                        "actions": ["retry", "abort"]
-                    }
+                    "error_recovery": _RECOVERY_SCROLL
                 }
             ],
             "expected_outcome": f"Successfully scrolled {direction}"
         }
     
-    async def _plan_wait(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
+    def _plan_wait(self, parsed_command: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a task plan for waiting on a page.
         
@@ -659,11 +953,20 @@ class TaskPlanner:
                         "duration": duration
                     },
                     "description": f"Wait for {duration} milliseconds",
-                    "error_recovery": {
-                        "conditions": [],
-                        "actions": []
-                    }
+                    "error_recovery": _RECOVERY_NONE
                 }
             ],
             "expected_outcome": f"Successfully waited for {duration} milliseconds"
         }
+    
+    # Map of action types to planning functions, built once for the class
+    _ACTION_PLANNERS = {
+        "navigate": _plan_navigation,
+        "click": _plan_click,
+        "search": _plan_search,
+        "extract": _plan_extraction,
+        "login": _plan_login,
+        "fill": _plan_form_fill,
+        "scroll": _plan_scroll,
+        "wait": _plan_wait,
+    }
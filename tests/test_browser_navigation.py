@@ -5,10 +5,17 @@ This module tests the navigation functionality of the browser module.
 """
 
 import unittest
-import asyncio
+from unittest.mock import AsyncMock
 from tests.test_framework import BrowserTestCase, async_test, skip_if_no_browser
 from browser.navigation import navigate_to, go_back, go_forward, refresh_page
 
+# Shared history fixture; tests copy it before navigating
+_NAVIGATION_HISTORY = (
+    "https://example.com/page1",
+    "https://example.com/page2",
+    "https://example.com/page3",
+)
+
 
 class TestBrowserNavigation(BrowserTestCase):
     """Test case for browser navigation functionality."""
@@ -18,7 +25,7 @@ class TestBrowserNavigation(BrowserTestCase):
         """Test navigating to a URL."""
         # Set up
         page = self.mock_page
-        self.browser_manager.get_current_page = asyncio.coroutine(lambda: page)
+        self.browser_manager.get_current_page = AsyncMock(return_value=page)
         
         # Test
         url = "https://example.com/test"
@@ -34,13 +41,9 @@ class TestBrowserNavigation(BrowserTestCase):
         """Test navigating back in history."""
         # Set up
         page = self.mock_page
-        page.navigation_history = [
-            "https://example.com/page1",
-            "https://example.com/page2",
-            "https://example.com/page3"
-        ]
+        page.navigation_history = list(_NAVIGATION_HISTORY)
         page.url = page.navigation_history[-1]
-        self.browser_manager.get_current_page = asyncio.coroutine(lambda: page)
+        self.browser_manager.get_current_page = AsyncMock(return_value=page)
         
         # Test
         result = await go_back(self.browser_manager)
@@ -54,14 +57,10 @@ class TestBrowserNavigation(BrowserTestCase):
         """Test navigating forward in history."""
         # Set up
         page = self.mock_page
-        page.navigation_history = [
-            "https://example.com/page1",
-            "https://example.com/page2",
-            "https://example.com/page3"
-        ]
+        page.navigation_history = list(_NAVIGATION_HISTORY)
         # Set current page to the middle of history
         page.url = page.navigation_history[1]
-        self.browser_manager.get_current_page = asyncio.coroutine(lambda: page)
+        self.browser_manager.get_current_page = AsyncMock(return_value=page)
         
         # Test 
         result = await go_forward(self.browser_manager)
@@ -85,8 +84,8 @@ class TestBrowserNavigation(BrowserTestCase):
             page.reload_called = True
             await original_goto(page.url, **kwargs)
             
-        page.reload = mock_reload
-        self.browser_manager.get_current_page = asyncio.coroutine(lambda: page)
+        page.reload = AsyncMock(side_effect=mock_reload)
+        self.browser_manager.get_current_page = AsyncMock(return_value=page)
         
         # Test
         result = await refresh_page(self.browser_manager)
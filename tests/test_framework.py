@@ -11,33 +11,40 @@ import json
 import asyncio
 import logging
 import unittest
-from typing import Dict, List, Any, Optional, Union, Callable, Awaitable, Type
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Union, Callable, Awaitable, Type
 from unittest.mock import MagicMock, patch
 
+# Use uvloop for test event loops when it is available
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import application modules
 from config.settings import Settings, load_settings
-from browser.manager import BrowserManager
-from controller.workflow import WorkflowController
-from controller.session import SessionManager
-from controller.state import StateTracker
+# Browser and controller modules pull in Playwright and the NLP stack, so the
+# test case classes import them when they are first set up
 from utils.errors import BrowserAIError
 from utils.logging import setup_logging
 
 
 class MockElementHandle:
     """Mock ElementHandle for testing element interactions."""
+    __slots__ = ("element_id", "tag_name", "attributes", "text_value", "is_visible_value", "children")
     
     def __init__(self, element_id: str = "mock_element", tag_name: str = "div",
                  attributes: Dict[str, str] = None, text_content: str = "Mock Element"):
         self.element_id = element_id
         self.tag_name = tag_name
         self.attributes = attributes or {}
-        self.text_content = text_content
+        self.text_value = text_content
         self.is_visible_value = True
-        self.children = []
+        self.children = ()
         
     async def get_attribute(self, name: str) -> Optional[str]:
         """Mock get_attribute method."""
@@ -45,7 +52,7 @@ class MockElementHandle:
         
     async def text_content(self) -> str:
         """Mock text_content method."""
-        return self.text_content
+        return self.text_value
         
     async def is_visible(self) -> bool:
         """Mock is_visible method."""
@@ -56,7 +63,7 @@ class MockElementHandle:
         # Simple mock implementation that returns first child if any exist
         return self.children[0] if self.children else None
         
-    async def query_selector_all(self, selector: str) -> List['MockElementHandle']:
+    async def query_selector_all(self, selector: str) -> Sequence['MockElementHandle']:
         """Mock query_selector_all method."""
         return self.children
         
@@ -66,20 +73,29 @@ class MockElementHandle:
         
     def add_child(self, child: 'MockElementHandle'):
         """Add a child element."""
-        self.children.append(child)
+        self.children += (child,)
+
+
+# Mock results for page.evaluate(), keyed by the expression they answer
+_JS_HANDLERS: Dict[str, Callable[["MockPage"], Any]] = {
+    "document.title": lambda page: page.title,
+    "document.documentElement.outerHTML": lambda page: page.content,
+}
 
 
 class MockPage:
     """Mock Page for testing page interactions."""
     
+    # Invariant across pages; instances only get their own copy once set
+    screenshot_data = b"mock_screenshot_data"
+    
     def __init__(self, url: str = "https://example.com", title: str = "Example Page"):
         self.url = url
         self.title = title
         self.content = "<html><body><h1>Mock Page</h1></body></html>"
-        self.elements = {}  # Maps selectors to MockElementHandle objects
+        self.elements = {}  # Maps selectors to 1-tuples of MockElementHandle objects
         self.navigation_history = []
-        self.screenshot_data = b"mock_screenshot_data"
-        self.cookies = []
+        self.cookies = None  # Created on the first set_cookie()
         self.event_listeners = {}
         
     async def goto(self, url: str, **kwargs) -> None:
@@ -95,21 +111,22 @@ class MockPage:
         
     async def query_selector(self, selector: str) -> Optional[MockElementHandle]:
         """Mock query_selector method."""
-        return self.elements.get(selector)
+        matches = self.elements.get(selector)
+        return matches[0] if matches else None
         
-    async def query_selector_all(self, selector: str) -> List[MockElementHandle]:
+    async def query_selector_all(self, selector: str) -> Sequence[MockElementHandle]:
         """Mock query_selector_all method."""
-        if selector in self.elements:
-            return [self.elements[selector]]
-        return []
+        return self.elements.get(selector, ())
         
     async def evaluate(self, js_code: str, *args) -> Any:
         """Mock evaluate method."""
-        # Return mock data based on the js_code
-        if "document.title" in js_code:
-            return self.title
-        if "document.documentElement.outerHTML" in js_code:
-            return self.content
+        # Exact expressions resolve with one lookup; anything else is scanned
+        handler = _JS_HANDLERS.get(js_code)
+        if handler is not None:
+            return handler(self)
+        for marker, handler in _JS_HANDLERS.items():
+            if marker in js_code:
+                return handler(self)
         return None
         
     async def screenshot(self, **kwargs) -> bytes:
@@ -118,10 +135,12 @@ class MockPage:
         
     async def get_cookies(self) -> List[Dict[str, Any]]:
         """Mock get_cookies method."""
-        return self.cookies
+        return self.cookies or []
         
     async def set_cookie(self, cookie: Dict[str, Any]) -> None:
         """Mock set_cookie method."""
+        if self.cookies is None:
+            self.cookies = []
         self.cookies.append(cookie)
         
     async def add_event_listener(self, event: str, callback: Callable) -> None:
@@ -132,7 +151,7 @@ class MockPage:
         
     def add_mock_element(self, selector: str, element: MockElementHandle) -> None:
         """Add a mock element for a selector."""
-        self.elements[selector] = element
+        self.elements[selector] = (element,)
         
     def set_content(self, content: str) -> None:
         """Set page content."""
@@ -141,6 +160,7 @@ class MockPage:
 
 class MockBrowserContext:
     """Mock BrowserContext for testing browser context interactions."""
+    __slots__ = ("browser_type", "id", "pages", "is_closed")
     
     def __init__(self, browser_type: str = "chromium"):
         self.browser_type = browser_type
@@ -161,6 +181,7 @@ class MockBrowserContext:
 
 class MockBrowser:
     """Mock Browser for testing browser interactions."""
+    __slots__ = ("browser_type", "contexts", "is_closed")
     
     def __init__(self, browser_type: str = "chromium"):
         self.browser_type = browser_type
@@ -180,6 +201,7 @@ class MockBrowser:
 
 class MockPlaywright:
     """Mock Playwright for testing."""
+    __slots__ = ("chromium", "firefox", "webkit")
     
     def __init__(self):
         self.chromium = MockBrowserLauncher("chromium")
@@ -193,6 +215,7 @@ class MockPlaywright:
 
 class MockBrowserLauncher:
     """Mock Browser Launcher for testing."""
+    __slots__ = ("browser_type",)
     
     def __init__(self, browser_type: str):
         self.browser_type = browser_type
@@ -224,33 +247,42 @@ class BaseTestCase(unittest.TestCase):
         # Create event loop for async tests
         cls.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(cls.loop)
+        
+        # Common patches; the stateless Playwright mock is shared by the class
+        cls.mock_playwright = MockPlaywright()
+        cls.playwright_patch = patch('playwright.async_api.async_playwright')
+        cls.mock_async_playwright = cls.playwright_patch.start()
+        cls.mock_async_playwright.return_value.__aenter__.return_value = cls.mock_playwright
     
     @classmethod
     def tearDownClass(cls):
         """Tear down test class."""
+        # Stop patches
+        cls.playwright_patch.stop()
         cls.loop.close()
     
     def setUp(self):
         """Set up test case."""
-        # Create mocks
-        self.mock_playwright = MockPlaywright()
+        # Create mocks; tests mutate and replace their attributes freely, so
+        # these stay per test
         self.mock_browser = MockBrowser()
         self.mock_context = MockBrowserContext()
         self.mock_page = MockPage()
-        
-        # Common patches
-        self.playwright_patch = patch('playwright.async_api.async_playwright')
-        self.mock_async_playwright = self.playwright_patch.start()
-        self.mock_async_playwright.return_value.__aenter__.return_value = self.mock_playwright
-        
+    
     def tearDown(self):
         """Tear down test case."""
-        # Stop patches
-        self.playwright_patch.stop()
+        # unittest keeps finished test instances alive, so drop the mocks
+        self.mock_browser = None
+        self.mock_context = None
+        self.mock_page = None
     
     def run_async(self, coro):
         """Run coroutine in the event loop."""
         return self.loop.run_until_complete(coro)
+    
+    def run_async_many(self, *coros):
+        """Run several coroutines concurrently in one pass of the event loop."""
+        return self.loop.run_until_complete(asyncio.gather(*coros))
 
 
 class BrowserTestCase(BaseTestCase):
@@ -259,6 +291,7 @@ class BrowserTestCase(BaseTestCase):
     def setUp(self):
         """Set up test case."""
         super().setUp()
+        from browser.manager import BrowserManager
         
         # Create browser manager with mocks
         self.browser_manager = BrowserManager(self.settings)
@@ -270,20 +303,37 @@ class BrowserTestCase(BaseTestCase):
         """Tear down test case."""
         # Clean up browser manager
         self.run_async(self.browser_manager.cleanup())
+        self.browser_manager = None
         super().tearDown()
 
 
 class ControllerTestCase(BaseTestCase):
     """Test case specifically for controller-related tests."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up test class."""
+        super().setUpClass()
+        from browser.manager import BrowserManager
+        from controller.session import SessionManager
+        from controller.state import StateTracker
+        
+        # Spec'd mocks introspect their class, so build them once per class
+        cls._browser_manager_mock = MagicMock(spec=BrowserManager)
+        cls._session_manager_mock = MagicMock(spec=SessionManager)
+        cls._state_tracker_mock = MagicMock(spec=StateTracker)
+    
     def setUp(self):
         """Set up test case."""
         super().setUp()
+        from controller.workflow import WorkflowController
         
-        # Create mocked dependencies
-        self.mock_browser_manager = MagicMock(spec=BrowserManager)
-        self.mock_session_manager = MagicMock(spec=SessionManager)
-        self.mock_state_tracker = MagicMock(spec=StateTracker)
+        # Reuse the class mocks with recorded calls and configured results cleared
+        for mock in (self._browser_manager_mock, self._session_manager_mock, self._state_tracker_mock):
+            mock.reset_mock(return_value=True, side_effect=True)
+        self.mock_browser_manager = self._browser_manager_mock
+        self.mock_session_manager = self._session_manager_mock
+        self.mock_state_tracker = self._state_tracker_mock
         
         # Create workflow controller with mocks
         self.workflow = WorkflowController(
@@ -297,6 +347,10 @@ class ControllerTestCase(BaseTestCase):
         """Tear down test case."""
         # Clean up controller
         self.run_async(self.workflow.cleanup())
+        self.workflow = None
+        self.mock_browser_manager = None
+        self.mock_session_manager = None
+        self.mock_state_tracker = None
         super().tearDown()
 
 
@@ -306,6 +360,10 @@ class EndToEndTestCase(BaseTestCase):
     def setUp(self):
         """Set up test case."""
         super().setUp()
+        from browser.manager import BrowserManager
+        from controller.session import SessionManager
+        from controller.state import StateTracker
+        from controller.workflow import WorkflowController
         
         # Create real components for end-to-end testing
         self.browser_manager = BrowserManager(self.settings)
@@ -327,33 +385,54 @@ class EndToEndTestCase(BaseTestCase):
         """Tear down test case."""
         # Clean up components
         self.run_async(self.workflow.cleanup())
+        self.workflow = None
+        self.browser_manager = None
+        self.session_manager = None
+        self.state_tracker = None
         super().tearDown()
 
 
 def async_test(coro):
     """Decorator for running async test functions."""
-    def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(coro(*args, **kwargs))
+    fallback_loop = None
+    
+    def wrapper(self, *args, **kwargs):
+        nonlocal fallback_loop
+        # Reuse the loop created once per test class, or one bound to this test
+        loop = getattr(self, "loop", None)
+        if loop is None:
+            fallback_loop = fallback_loop or asyncio.new_event_loop()
+            loop = fallback_loop
+        return loop.run_until_complete(coro(self, *args, **kwargs))
     return wrapper
 
 
+async def _check_browser() -> bool:
+    """Check whether a real Chromium browser can be launched."""
+    try:
+        from playwright.async_api import async_playwright
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            await browser.close()
+        return True
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _probe_browser_once() -> bool:
+    """Launch the browser probe once per process on its own event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(_check_browser())
+    finally:
+        loop.close()
+
+
 def skip_if_no_browser(test_func):
     """Decorator to skip tests if browser is not available."""
-    async def check_browser():
-        try:
-            from playwright.async_api import async_playwright
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                await browser.close()
-            return True
-        except Exception:
-            return False
-    
     def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
-        browser_available = loop.run_until_complete(check_browser())
-        if not browser_available:
+        if not _probe_browser_once():
             raise unittest.SkipTest("Browser not available for testing")
         return test_func(*args, **kwargs)
     
@@ -0,0 +1,93 @@
+"""
+Tests for the natural language processing components.
+
+This module tests the task planner's LLM plan template cache.
+"""
+
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from config.settings import Settings
+from nlp.planner import TaskPlanner
+
+
+def _command(**inputs):
+    """Build a parsed command with the given inputs."""
+    return {"command_type": "custom", "target_url": "https://example.com", "inputs": inputs}
+
+
+def _plan(*steps):
+    """Build an LLM plan response from (action, params) pairs."""
+    return json.dumps({
+        "steps": [{"action": action, "params": params} for action, params in steps],
+        "expected_outcome": "Done"
+    })
+
+
+class TestPlanTemplateCache(unittest.IsolatedAsyncioTestCase):
+    """Test case for reusing LLM plans as templates."""
+
+    def setUp(self):
+        """Set up a planner with a fresh plan cache."""
+        self.planner = TaskPlanner(Settings(), MagicMock())
+
+    async def test_reuses_plan_with_new_values(self):
+        """Test that a plan with each value in its own slot is reused."""
+        # Set up
+        llm = AsyncMock(return_value=_plan(
+            ("navigate", {"url": "https://example.com"}),
+            ("type", {"element": "search box", "text": "laptop"}),
+        ))
+
+        # Test
+        with patch("nlp.planner.call_llm", llm):
+            await self.planner._plan_with_llm(_command(search_term="laptop"))
+            plan = await self.planner._plan_with_llm(_command(search_term="usb hub"))
+
+        # Assert
+        self.assertEqual(llm.await_count, 1)
+        self.assertEqual(plan["steps"][1]["params"]["text"], "usb hub")
+
+    async def test_equal_values_are_not_cached(self):
+        """Test that a plan for equal username and password is not reused."""
+        # Set up
+        llm = AsyncMock(side_effect=[
+            _plan(("type", {"element": "username field", "text": "admin"}),
+                  ("type", {"element": "password field", "text": "admin"})),
+            _plan(("type", {"element": "username field", "text": "bob"}),
+                  ("type", {"element": "password field", "text": "secret"})),
+        ])
+
+        # Test
+        with patch("nlp.planner.call_llm", llm):
+            await self.planner._plan_with_llm(_command(username="admin", password="admin"))
+            plan = await self.planner._plan_with_llm(_command(username="bob", password="secret"))
+
+        # Assert
+        self.assertEqual(llm.await_count, 2)
+        self.assertEqual(plan["steps"][0]["params"]["text"], "bob")
+        self.assertEqual(plan["steps"][1]["params"]["text"], "secret")
+
+    async def test_value_outside_its_slot_is_not_cached(self):
+        """Test that a search term that also names a key is not templated."""
+        # Set up
+        llm = AsyncMock(side_effect=[
+            _plan(("type", {"element": "search box", "text": "Enter"}),
+                  ("press", {"key": "Enter"})),
+            _plan(("type", {"element": "search box", "text": "usb hub"}),
+                  ("press", {"key": "Enter"})),
+        ])
+
+        # Test
+        with patch("nlp.planner.call_llm", llm):
+            await self.planner._plan_with_llm(_command(search_term="Enter"))
+            plan = await self.planner._plan_with_llm(_command(search_term="usb hub"))
+
+        # Assert
+        self.assertEqual(llm.await_count, 2)
+        self.assertEqual(plan["steps"][1]["params"], {"key": "Enter"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for utility functions.
+
+This module tests the helper, logging and validation utilities.
+"""
+
+import logging
+import unittest
+
+from utils.errors import ValidationError
+from utils.helpers import is_valid_json
+from utils.logging import LogContext
+from utils.validation import Validator
+
+
+class TestHelpers(unittest.TestCase):
+    """Test case for helper functions."""
+
+    def test_is_valid_json(self):
+        """Test JSON validity checks, including input nested too deeply to parse."""
+        self.assertTrue(is_valid_json('{"a": [1, 2]}'))
+        self.assertFalse(is_valid_json("not json"))
+        self.assertFalse(is_valid_json(None))
+        self.assertFalse(is_valid_json("[" * 100000))
+
+
+class TestValidator(unittest.TestCase):
+    """Test case for the schema validator."""
+
+    def test_validate_or_raise_inside_log_context(self):
+        """Test that a failed validation raises ValidationError under a LogContext."""
+        # Set up
+        validator = Validator("model", {"a": {"type": "integer"}})
+        log = logging.getLogger("tests.validation")
+
+        # Test
+        with self.assertLogs("utils.validation", level="WARNING") as captured:
+            with LogContext(log, request_id="1"):
+                with self.assertRaises(ValidationError) as raised:
+                    validator.validate_or_raise({"a": "s"})
+
+        # Assert
+        self.assertEqual(raised.exception.details["errors"], ["Field 'a' must be an integer"])
+        record = captured.records[0]
+        self.assertEqual(record.validation_errors, ["Field 'a' must be an integer"])
+        self.assertEqual(record.extra_fields["request_id"], "1")
+
+
+if __name__ == '__main__':
+    unittest.main()
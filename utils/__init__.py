@@ -19,7 +19,7 @@ from utils.logging import (
 from utils.validation import (
     validate_url, validate_email, validate_integer, validate_float,
     validate_string, validate_boolean, validate_list, validate_dict,
-    validate_json, Validator
+    validate_json, make_dict_validator, Validator
 )
 
 __all__ = [
@@ -36,5 +36,5 @@ __all__ = [
     # Validation
     'validate_url', 'validate_email', 'validate_integer', 'validate_float',
     'validate_string', 'validate_boolean', 'validate_list', 'validate_dict',
-    'validate_json', 'Validator'
+    'validate_json', 'make_dict_validator', 'Validator'
 ]
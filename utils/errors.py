@@ -6,44 +6,59 @@ This module provides exception classes and error handling utilities for the appl
 
 import logging
 import traceback
-from typing import Dict, Any, Optional, List, Tuple, Type, Union
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, List, Tuple, Type, Union
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Logger methods by level name, bound once
+_LOG_METHODS = {
+    level: getattr(logger, level)
+    for level in ("debug", "info", "warning", "error", "critical")
+}
+
+# Read-only details shared by every error created without any
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
 
 class BrowserAIError(Exception):
     """Base exception class for the application."""
+    __slots__ = ("message", "details")
+    
+    # Category prefix prepended to the message when the error is formatted
+    _prefix = ""
     
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         """
         Initialize the exception.
         
         Args:
-            message: Error message
-            details: Additional error details
+            message: Error message, without the category prefix
+            details: Additional error details; errors without any share a
+                read-only empty mapping
         """
         self.message = message
-        self.details = details or {}
+        self.details = details if details else _NO_DETAILS
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        """Format the message with its category prefix."""
+        return f"{self._prefix}{self.message}"
 
 
 class BrowserError(BrowserAIError):
     """Exception raised for browser-related errors."""
+    __slots__ = ()
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        """
-        Initialize the exception.
-        
-        Args:
-            message: Error message
-            details: Additional error details
-        """
-        super().__init__(f"Browser error: {message}", details)
+    _prefix = "Browser error: "
 
 
 class NavigationError(BrowserError):
     """Exception raised for navigation-related errors."""
+    __slots__ = ()
+    
+    _prefix = "Browser error: Navigation error: "
     
     def __init__(self, message: str, url: str, details: Optional[Dict[str, Any]] = None):
         """
@@ -54,13 +69,16 @@ class NavigationError(BrowserError):
             url: The URL that failed to navigate
             details: Additional error details
         """
-        details = details or {}
+        details = dict(details) if details else {}
         details["url"] = url
-        super().__init__(f"Navigation error: {message}", details)
+        super().__init__(message, details)
 
 
 class ElementNotFoundError(BrowserError):
     """Exception raised when an element cannot be found."""
+    __slots__ = ()
+    
+    _prefix = "Browser error: Element not found: "
     
     def __init__(self, selector: str, details: Optional[Dict[str, Any]] = None):
         """
@@ -70,13 +88,16 @@ class ElementNotFoundError(BrowserError):
             selector: The selector that failed to find an element
             details: Additional error details
         """
-        details = details or {}
+        details = dict(details) if details else {}
         details["selector"] = selector
-        super().__init__(f"Element not found: {selector}", details)
+        super().__init__(selector, details)
 
 
 class TimeoutError(BrowserError):
     """Exception raised when an operation times out."""
+    __slots__ = ()
+    
+    _prefix = "Browser error: Operation timed out: "
     
     def __init__(self, operation: str, timeout: float, details: Optional[Dict[str, Any]] = None):
         """
@@ -87,28 +108,28 @@ class TimeoutError(BrowserError):
             timeout: The timeout value in seconds
             details: Additional error details
         """
-        details = details or {}
+        details = dict(details) if details else {}
         details["operation"] = operation
         details["timeout"] = timeout
-        super().__init__(f"Operation timed out: {operation} (after {timeout}s)", details)
+        super().__init__(operation, details)
+    
+    def __str__(self) -> str:
+        """Format the message with its category prefix and the timeout."""
+        return f"{self._prefix}{self.message} (after {self.details['timeout']}s)"
 
 
 class ParserError(BrowserAIError):
     """Exception raised for parsing-related errors."""
+    __slots__ = ()
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        """
-        Initialize the exception.
-        
-        Args:
-            message: Error message
-            details: Additional error details
-        """
-        super().__init__(f"Parser error: {message}", details)
+    _prefix = "Parser error: "
 
 
 class APIError(BrowserAIError):
     """Exception raised for API-related errors."""
+    __slots__ = ()
+    
+    _prefix = "API error: "
     
     def __init__(self, message: str, status_code: Optional[int] = None, details: Optional[Dict[str, Any]] = None):
         """
@@ -119,42 +140,31 @@ class APIError(BrowserAIError):
             status_code: HTTP status code
             details: Additional error details
         """
-        details = details or {}
+        details = dict(details) if details else {}
         if status_code is not None:
             details["status_code"] = status_code
-        super().__init__(f"API error: {message}", details)
+        super().__init__(message, details)
 
 
 class NLPError(BrowserAIError):
     """Exception raised for NLP-related errors."""
+    __slots__ = ()
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        """
-        Initialize the exception.
-        
-        Args:
-            message: Error message
-            details: Additional error details
-        """
-        super().__init__(f"NLP error: {message}", details)
+    _prefix = "NLP error: "
 
 
 class ExtractionError(BrowserAIError):
     """Exception raised for data extraction errors."""
+    __slots__ = ()
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        """
-        Initialize the exception.
-        
-        Args:
-            message: Error message
-            details: Additional error details
-        """
-        super().__init__(f"Extraction error: {message}", details)
+    _prefix = "Extraction error: "
 
 
 class ValidationError(BrowserAIError):
     """Exception raised for validation errors."""
+    __slots__ = ()
+    
+    _prefix = "Validation error: "
     
     def __init__(self, message: str, field: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         """
@@ -165,24 +175,17 @@ class ValidationError(BrowserAIError):
             field: The field that failed validation
             details: Additional error details
         """
-        details = details or {}
+        details = dict(details) if details else {}
         if field is not None:
             details["field"] = field
-        super().__init__(f"Validation error: {message}", details)
+        super().__init__(message, details)
 
 
 class ConfigError(BrowserAIError):
     """Exception raised for configuration errors."""
+    __slots__ = ()
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        """
-        Initialize the exception.
-        
-        Args:
-            message: Error message
-            details: Additional error details
-        """
-        super().__init__(f"Configuration error: {message}", details)
+    _prefix = "Configuration error: "
 
 
 def format_exception(
@@ -208,14 +211,54 @@ def format_exception(
     if isinstance(exc, BrowserAIError) and exc.details:
         result["details"] = exc.details
     
-    # Add traceback if requested
+    # Add traceback if requested, taken from the exception itself rather
+    # than whatever sys.exc_info() currently holds
     if include_traceback:
-        result["traceback"] = traceback.format_exc()
+        result["traceback"] = "".join(traceback.TracebackException.from_exception(exc).format())
     
     return result
 
 
-def get_error_recovery_strategy(error: Exception) -> Tuple[str, Dict[str, Any]]:
+# Recovery strategies; the parameters are shared read-only mappings
+_STRATEGY_DEFAULT = ("retry", MappingProxyType({"max_retries": 3, "delay": 1.0}))
+_STRATEGY_NAVIGATION = ("retry_navigation", MappingProxyType({"max_retries": 3, "delay": 2.0}))
+_STRATEGY_ELEMENT = (
+    "wait_and_retry",
+    MappingProxyType({"max_retries": 5, "delay": 1.0, "increasing_delay": True})
+)
+_STRATEGY_TIMEOUT = ("increase_timeout", MappingProxyType({"timeout_multiplier": 2.0, "max_timeout": 60.0}))
+_STRATEGY_PARSER = ("alternative_parser", MappingProxyType({"fallback_parsers": ("simple", "regex")}))
+_STRATEGY_API_RATE_LIMIT = (
+    "backoff_retry",
+    MappingProxyType({"max_retries": 5, "initial_delay": 2.0, "backoff_factor": 2.0})
+)
+_STRATEGY_API_SERVER = ("retry", MappingProxyType({"max_retries": 3, "delay": 5.0}))
+_STRATEGY_API_REPORT = ("report_error", MappingProxyType({"notify_user": True}))
+
+
+def _api_error_strategy(error: APIError) -> Tuple[str, Mapping[str, Any]]:
+    """Pick a recovery strategy for an API error from its status code."""
+    status_code = error.details.get("status_code", 0)
+    
+    if status_code == 429:  # Too Many Requests
+        return _STRATEGY_API_RATE_LIMIT
+    elif status_code >= 500:  # Server errors
+        return _STRATEGY_API_SERVER
+    else:
+        return _STRATEGY_API_REPORT
+
+
+# Recovery strategy builders keyed by error class
+_RECOVERY_STRATEGIES: Dict[Type[Exception], Callable[[Any], Tuple[str, Mapping[str, Any]]]] = {
+    NavigationError: lambda error: _STRATEGY_NAVIGATION,
+    ElementNotFoundError: lambda error: _STRATEGY_ELEMENT,
+    TimeoutError: lambda error: _STRATEGY_TIMEOUT,
+    ParserError: lambda error: _STRATEGY_PARSER,
+    APIError: _api_error_strategy,
+}
+
+
+def get_error_recovery_strategy(error: Exception) -> Tuple[str, Mapping[str, Any]]:
     """
     Get a recovery strategy for an error.
     
@@ -223,38 +266,56 @@ def get_error_recovery_strategy(error: Exception) -> Tuple[str, Dict[str, Any]]:
         error: The exception to get a recovery strategy for
         
     Returns:
-        Tuple of (strategy_name, strategy_params)
+        Tuple of (strategy_name, strategy_params); the parameters are shared
+        and read-only
     """
-    # Default strategy
-    default_strategy = ("retry", {"max_retries": 3, "delay": 1.0})
-    
-    # Define strategies based on error type
-    if isinstance(error, NavigationError):
-        return ("retry_navigation", {"max_retries": 3, "delay": 2.0})
-    
-    elif isinstance(error, ElementNotFoundError):
-        return ("wait_and_retry", {"max_retries": 5, "delay": 1.0, "increasing_delay": True})
-    
-    elif isinstance(error, TimeoutError):
-        return ("increase_timeout", {"timeout_multiplier": 2.0, "max_timeout": 60.0})
-    
-    elif isinstance(error, ParserError):
-        return ("alternative_parser", {"fallback_parsers": ["simple", "regex"]})
-    
-    elif isinstance(error, APIError):
-        # Different strategy based on status code
-        details = getattr(error, "details", {})
-        status_code = details.get("status_code", 0)
-        
-        if status_code == 429:  # Too Many Requests
-            return ("backoff_retry", {"max_retries": 5, "initial_delay": 2.0, "backoff_factor": 2.0})
-        elif status_code >= 500:  # Server errors
-            return ("retry", {"max_retries": 3, "delay": 5.0})
-        else:
-            return ("report_error", {"notify_user": True})
+    # The most specific registered class in the error's MRO decides
+    for cls in type(error).__mro__:
+        strategy = _RECOVERY_STRATEGIES.get(cls)
+        if strategy is not None:
+            return strategy(error)
     
     # Default fallback
-    return default_strategy
+    return _STRATEGY_DEFAULT
+
+
+def _api_error_message(error: APIError) -> str:
+    """Build the user message for an API error from its status code."""
+    status_code = error.details.get("status_code", 0)
+    
+    if status_code == 429:
+        return "The service is limiting requests. Please try again later."
+    elif status_code >= 500:
+        return "The service is experiencing technical difficulties. Please try again later."
+    else:
+        return "There was a problem with the service request. Please check your inputs and try again."
+
+
+# User message builders keyed by error class
+_USER_MESSAGES: Dict[Type[Exception], Callable[[Any], str]] = {
+    NavigationError: lambda error: (
+        f"I couldn't navigate to {error.details.get('url', 'the requested page')}. "
+        "The page might be unavailable or taking too long to load."
+    ),
+    ElementNotFoundError: lambda error: (
+        f"I couldn't find {error.details.get('selector', 'the element')} on the page. "
+        "It might not exist or it might be loading."
+    ),
+    TimeoutError: lambda error: (
+        f"{error.details.get('operation', 'the operation')} took too long to complete. "
+        "The website might be slow or unresponsive."
+    ),
+    ParserError: lambda error: "I had trouble understanding the content on the page. The format might be unexpected.",
+    APIError: _api_error_message,
+    NLPError: lambda error: "I had trouble understanding your request. Could you please rephrase it?",
+    ExtractionError: lambda error: (
+        "I had trouble extracting the data you requested. The content might not be in the expected format."
+    ),
+    ValidationError: lambda error: (
+        f"There was a problem with the {error.details.get('field', 'input')}. Please check it and try again."
+    ),
+    ConfigError: lambda error: "There's a configuration issue. Please check your settings and try again.",
+}
 
 
 def error_to_user_message(error: Exception) -> str:
@@ -267,48 +328,56 @@ def error_to_user_message(error: Exception) -> str:
     Returns:
         User-friendly error message
     """
-    # Base message for different error types
-    if isinstance(error, NavigationError):
-        url = getattr(error, "details", {}).get("url", "the requested page")
-        return f"I couldn't navigate to {url}. The page might be unavailable or taking too long to load."
-    
-    elif isinstance(error, ElementNotFoundError):
-        selector = getattr(error, "details", {}).get("selector", "the element")
-        return f"I couldn't find {selector} on the page. It might not exist or it might be loading."
+    # The most specific registered class in the error's MRO decides
+    for cls in type(error).__mro__:
+        build_message = _USER_MESSAGES.get(cls)
+        if build_message is not None:
+            return build_message(error)
     
-    elif isinstance(error, TimeoutError):
-        operation = getattr(error, "details", {}).get("operation", "the operation")
-        return f"{operation} took too long to complete. The website might be slow or unresponsive."
-    
-    elif isinstance(error, ParserError):
-        return "I had trouble understanding the content on the page. The format might be unexpected."
+    # Generic fallback
+    return f"An error occurred: {str(error)}"
+
+
+def _classify(error: Exception) -> Tuple[str, Tuple[str, Mapping[str, Any]]]:
+    """
+    Look up an error's user message and recovery strategy together.
     
-    elif isinstance(error, APIError):
-        details = getattr(error, "details", {})
-        status_code = details.get("status_code", 0)
+    Args:
+        error: The exception to classify
         
-        if status_code == 429:
-            return "The service is limiting requests. Please try again later."
-        elif status_code >= 500:
-            return "The service is experiencing technical difficulties. Please try again later."
-        else:
-            return "There was a problem with the service request. Please check your inputs and try again."
-    
-    elif isinstance(error, NLPError):
-        return "I had trouble understanding your request. Could you please rephrase it?"
-    
-    elif isinstance(error, ExtractionError):
-        return "I had trouble extracting the data you requested. The content might not be in the expected format."
-    
-    elif isinstance(error, ValidationError):
-        field = getattr(error, "details", {}).get("field", "input")
-        return f"There was a problem with the {field}. Please check it and try again."
+    Returns:
+        Tuple of (user message, (strategy_name, strategy_params))
+    """
+    build_message = build_strategy = None
+    for cls in type(error).__mro__:
+        if build_message is None:
+            build_message = _USER_MESSAGES.get(cls)
+        if build_strategy is None:
+            build_strategy = _RECOVERY_STRATEGIES.get(cls)
+        if build_message is not None and build_strategy is not None:
+            break
     
-    elif isinstance(error, ConfigError):
-        return "There's a configuration issue. Please check your settings and try again."
+    user_message = build_message(error) if build_message is not None else f"An error occurred: {str(error)}"
+    strategy = build_strategy(error) if build_strategy is not None else _STRATEGY_DEFAULT
+    return user_message, strategy
+
+
+def _log_line(error_type: str, error_message: str, details: Optional[Mapping[str, Any]]) -> str:
+    """
+    Build the log line for an exception.
     
-    # Generic fallback
-    return f"An error occurred: {str(error)}"
+    Args:
+        error_type: Exception class name
+        error_message: Formatted exception message
+        details: Error details, if any
+        
+    Returns:
+        Log message
+    """
+    if details:
+        details_str = ", ".join(f"{k}={v}" for k, v in details.items())
+        return f"{error_type}: {error_message} - {details_str}"
+    return f"{error_type}: {error_message}"
 
 
 def log_exception(
@@ -325,30 +394,21 @@ def log_exception(
         include_traceback: Whether to include the traceback
     """
     # Get the logger method based on level
-    logger_method = getattr(logger, level.lower(), logger.error)
+    logger_method = _LOG_METHODS.get(level) or getattr(logger, level.lower(), logger.error)
     
     # Format the error message
-    error_type = error.__class__.__name__
-    error_message = str(error)
-    
-    # Get additional details for BrowserAIError
-    if isinstance(error, BrowserAIError) and error.details:
-        details_str = ", ".join([f"{k}={v}" for k, v in error.details.items()])
-        log_message = f"{error_type}: {error_message} - {details_str}"
-    else:
-        log_message = f"{error_type}: {error_message}"
+    details = error.details if isinstance(error, BrowserAIError) else None
+    log_message = _log_line(error.__class__.__name__, str(error), details)
     
     # Log the message
-    if include_traceback:
-        logger_method(log_message, exc_info=True)
-    else:
-        logger_method(log_message)
+    logger_method(log_message, exc_info=include_traceback)
 
 
 def handle_exception(
     error: Exception,
     context: Optional[Dict[str, Any]] = None,
-    raise_error: bool = False
+    raise_error: bool = False,
+    include_traceback: bool = True
 ) -> Dict[str, Any]:
     """
     Handle an exception with standardized error processing.
@@ -357,6 +417,7 @@ def handle_exception(
         error: The exception to handle
         context: Additional context about where the error occurred
         raise_error: Whether to re-raise the error after handling
+        include_traceback: Whether to log and return the traceback
         
     Returns:
         Dictionary with error information and recovery strategy
@@ -364,25 +425,35 @@ def handle_exception(
     Raises:
         The original exception if raise_error is True
     """
+    # Read the exception once for logging and the result
+    error_type = error.__class__.__name__
+    error_message = str(error)
+    details = error.details if isinstance(error, BrowserAIError) else None
+    
     # Log the error
-    log_exception(error)
+    logger.error(_log_line(error_type, error_message, details), exc_info=include_traceback)
     
     # Format the error details
-    error_details = format_exception(error)
+    error_details = {
+        "type": error_type,
+        "message": error_message
+    }
+    if details:
+        error_details["details"] = details
+    if include_traceback:
+        error_details["traceback"] = "".join(traceback.TracebackException.from_exception(error).format())
     
     # Add context if provided
     if context:
         error_details["context"] = context
     
-    # Get recovery strategy
-    strategy_name, strategy_params = get_error_recovery_strategy(error)
+    # Recovery strategy and user-friendly message from a single MRO walk
+    user_message, (strategy_name, strategy_params) = _classify(error)
     error_details["recovery_strategy"] = {
         "name": strategy_name,
-        "params": strategy_params
+        "params": dict(strategy_params)
     }
-    
-    # Add user-friendly message
-    error_details["user_message"] = error_to_user_message(error)
+    error_details["user_message"] = user_message
     
     # Re-raise if requested
     if raise_error:
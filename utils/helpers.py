@@ -6,16 +6,48 @@ This module provides general-purpose helper functions for the application.
 
 import os
 import re
+import asyncio
 import uuid
 import json
+import math
 import time
 import random
 import hashlib
 import datetime
-from typing import Dict, List, Any, Optional, Union, Tuple, Callable, TypeVar, Generic
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Sequence, Any, Optional, Union, Tuple, Type, Callable, TypeVar, Generic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 T = TypeVar('T')
 
+# Precompiled patterns
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_CONTROL_CHARS = re.compile(r'[\x00-\x1F\x7F]')
+_URL_PATTERN = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+')
+_DOMAIN_PATTERN = re.compile(r'https?://(?:www\.)?([^/]+)')
+
+# strftime directives that time.strftime renders differently from a naive datetime
+_DATETIME_ONLY_DIRECTIVES = ("%f", "%z", "%Z")
+
+# Size units for human_readable_size and the divisor for each
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SIZE_DIVISORS = tuple(1024 ** i for i in range(len(_SIZE_UNITS)))
+
+# Hash constructors supported by hash_string
+_HASHERS: Dict[str, Callable[..., Any]] = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+}
+
+# Characters a JSON document can start with (N/I cover json's NaN/Infinity)
+_JSON_STARTS = frozenset('{["tfn-0123456789NI')
+
 
 def generate_id(prefix: str = "") -> str:
     """
@@ -25,9 +57,9 @@ def generate_id(prefix: str = "") -> str:
         prefix: Optional prefix for the ID
         
     Returns:
-        A unique ID string
+        A unique ID string (32 hex digits, after the prefix if given)
     """
-    unique_id = str(uuid.uuid4())
+    unique_id = uuid.uuid4().hex
     if prefix:
         return f"{prefix}_{unique_id}"
     return unique_id
@@ -60,6 +92,18 @@ def format_timestamp(
     # Convert to seconds if in milliseconds
     if timestamp > 1e10:  # More than 10 billion means it's in milliseconds
         timestamp /= 1000
+    
+    # time.strftime formats a C struct tm directly; datetime is only needed
+    # for microseconds and for the empty timezone fields of a naive datetime
+    if not any(directive in format_str for directive in _DATETIME_ONLY_DIRECTIVES):
+        # Round to the microsecond first, as datetime.fromtimestamp() does
+        fraction, seconds = math.modf(timestamp)
+        microseconds = round(fraction * 1e6)
+        if microseconds >= 1000000:
+            seconds += 1
+        elif microseconds < 0:
+            seconds -= 1
+        return time.strftime(format_str, time.localtime(seconds))
         
     dt = datetime.datetime.fromtimestamp(timestamp)
     return dt.strftime(format_str)
@@ -76,21 +120,50 @@ def throttle(func: Callable, rate_limit: float) -> Callable:
     Returns:
         Throttled function
     """
-    last_called = [0.0]  # Use a list for nonlocal mutable value
+    last_called = [float("-inf")]  # Use a list for nonlocal mutable value
     
     def wrapper(*args, **kwargs):
-        now = time.time()
+        # Monotonic clock, so wall-clock adjustments cannot skew the limit
+        now = time.monotonic()
         elapsed = now - last_called[0]
         
         if elapsed < rate_limit:
             time.sleep(rate_limit - elapsed)
             
-        last_called[0] = time.time()
+        last_called[0] = time.monotonic()
         return func(*args, **kwargs)
         
     return wrapper
 
 
+def athrottle(func: Callable, rate_limit: float) -> Callable:
+    """
+    Decorator to throttle the call rate of a coroutine function.
+    
+    Unlike throttle, waiting does not block the event loop.
+    
+    Args:
+        func: Coroutine function to throttle
+        rate_limit: Minimum time between calls in seconds
+        
+    Returns:
+        Throttled coroutine function
+    """
+    last_called = [float("-inf")]  # Use a list for nonlocal mutable value
+    
+    async def wrapper(*args, **kwargs):
+        now = time.monotonic()
+        elapsed = now - last_called[0]
+        
+        if elapsed < rate_limit:
+            await asyncio.sleep(rate_limit - elapsed)
+            
+        last_called[0] = time.monotonic()
+        return await func(*args, **kwargs)
+        
+    return wrapper
+
+
 def retry(
     max_attempts: int = 3,
     exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
@@ -112,6 +185,10 @@ def retry(
         Retry decorator
     """
     def decorator(func):
+        # Coroutine functions must back off without blocking the event loop
+        if asyncio.iscoroutinefunction(func):
+            return aretry(max_attempts, exceptions, delay, backoff, logger)(func)
+        
         def wrapper(*args, **kwargs):
             attempt = 0
             current_delay = delay
@@ -137,6 +214,54 @@ def retry(
     return decorator
 
 
+def aretry(
+    max_attempts: int = 3,
+    exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    logger: Optional[Any] = None
+) -> Callable:
+    """
+    Decorator for retrying a coroutine function upon exception.
+    
+    Unlike retry, waiting between attempts does not block the event loop.
+    
+    Args:
+        max_attempts: Maximum number of retry attempts
+        exceptions: Exception types to catch and retry
+        delay: Initial delay between retries in seconds
+        backoff: Backoff multiplier
+        logger: Optional logger to log retries
+        
+    Returns:
+        Retry decorator
+    """
+    def decorator(func):
+        async def wrapper(*args, **kwargs):
+            attempt = 0
+            current_delay = delay
+            
+            while attempt < max_attempts:
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    attempt += 1
+                    if attempt >= max_attempts:
+                        raise
+                        
+                    if logger:
+                        logger.warning(
+                            f"Retry {attempt}/{max_attempts} for {func.__name__} "
+                            f"due to {type(e).__name__}: {str(e)}"
+                        )
+                        
+                    await asyncio.sleep(current_delay)
+                    current_delay *= backoff
+                    
+        return wrapper
+    return decorator
+
+
 def chunks(lst: List[T], n: int) -> List[List[T]]:
     """
     Split a list into chunks of size n.
@@ -151,6 +276,53 @@ def chunks(lst: List[T], n: int) -> List[List[T]]:
     return [lst[i:i + n] for i in range(0, len(lst), n)]
 
 
+def iter_chunks(seq: Sequence[T], n: int) -> Iterator[Sequence[T]]:
+    """
+    Lazily split a sequence into chunks of size n.
+    
+    Only one chunk is alive at a time when the caller consumes them in turn.
+    
+    Args:
+        seq: Sequence to split
+        n: Maximum chunk size
+        
+    Yields:
+        Successive chunks
+    """
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+
+def chunks_view(buf: Union[bytes, bytearray, memoryview], n: int) -> Iterator[memoryview]:
+    """
+    Split a bytes-like buffer into zero-copy chunks of size n.
+    
+    Args:
+        buf: Buffer to split
+        n: Maximum chunk size in bytes
+        
+    Yields:
+        Memoryview slices sharing the buffer's memory
+    """
+    view = memoryview(buf)
+    for i in range(0, len(view), n):
+        yield view[i:i + n]
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """
+    Split a dotted key path into its keys.
+    
+    Args:
+        path: Key path with dots
+        
+    Returns:
+        Tuple of keys
+    """
+    return tuple(path.split('.'))
+
+
 def deep_get(d: Dict[str, Any], keys: Union[str, List[str]], default: Any = None) -> Any:
     """
     Safely access nested dictionary values.
@@ -167,19 +339,14 @@ def deep_get(d: Dict[str, Any], keys: Union[str, List[str]], default: Any = None
         return default
         
     if isinstance(keys, str):
-        keys = keys.split('.')
-        
-    if not keys:
-        return d
-        
-    key = keys[0]
-    if key not in d:
-        return default
-        
-    if len(keys) == 1:
-        return d[key]
-        
-    return deep_get(d[key], keys[1:], default)
+        keys = _split_path(keys)
+    
+    current = d
+    for key in keys:
+        if not isinstance(current, dict) or key not in current:
+            return default
+        current = current[key]
+    return current
 
 
 def deep_set(d: Dict[str, Any], keys: Union[str, List[str]], value: Any) -> Dict[str, Any]:
@@ -195,20 +362,19 @@ def deep_set(d: Dict[str, Any], keys: Union[str, List[str]], value: Any) -> Dict
         Modified dictionary
     """
     if isinstance(keys, str):
-        keys = keys.split('.')
+        keys = _split_path(keys)
         
     if not keys:
         return d
-        
-    key = keys[0]
-    if len(keys) == 1:
-        d[key] = value
-        return d
-        
-    if key not in d or not isinstance(d[key], dict):
-        d[key] = {}
-        
-    deep_set(d[key], keys[1:], value)
+    
+    current = d
+    for key in keys[:-1]:
+        child = current.get(key)
+        if not isinstance(child, dict):
+            child = current[key] = {}
+        current = child
+    
+    current[keys[-1]] = value
     return d
 
 
@@ -223,11 +389,16 @@ def deep_merge(d1: Dict[str, Any], d2: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Merged dictionary (d1 modified in-place)
     """
-    for key, value in d2.items():
-        if key in d1 and isinstance(d1[key], dict) and isinstance(value, dict):
-            deep_merge(d1[key], value)
-        else:
-            d1[key] = value
+    # Nested dictionaries still to merge, as (target, source) pairs
+    stack = [(d1, d2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            existing = target.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                stack.append((existing, value))
+            else:
+                target[key] = value
     return d1
 
 
@@ -285,10 +456,10 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace unsafe characters with underscore
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = _UNSAFE_FILENAME_CHARS.sub('_', filename)
     
     # Remove control characters
-    sanitized = re.sub(r'[\x00-\x1F\x7F]', '', sanitized)
+    sanitized = _CONTROL_CHARS.sub('', sanitized)
     
     # Ensure file name is not empty
     if not sanitized or sanitized.isspace():
@@ -312,14 +483,27 @@ def human_readable_size(size_bytes: int) -> str:
         
     if size_bytes == 0:
         return "0 B"
+    
+    # Each unit spans 10 bits, so the bit length picks the unit directly;
+    # dividing by a power of two is exact, matching repeated halving
+    i = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / _SIZE_DIVISORS[i]:.2f} {_SIZE_UNITS[i]}"
+
+
+def human_readable_sizes(sizes: Iterable[int]) -> List[str]:
+    """
+    Convert many byte counts to human-readable size strings.
+    
+    Args:
+        sizes: Sizes in bytes
         
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(units) - 1:
-        size_bytes /= 1024
-        i += 1
+    Returns:
+        Human-readable size strings in the same order
         
-    return f"{size_bytes:.2f} {units[i]}"
+    Raises:
+        ValueError: If any size is negative
+    """
+    return [human_readable_size(size) for size in sizes]
 
 
 def extract_urls_from_text(text: str) -> List[str]:
@@ -332,9 +516,7 @@ def extract_urls_from_text(text: str) -> List[str]:
     Returns:
         List of extracted URLs
     """
-    # URL regular expression pattern
-    url_pattern = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'
-    return re.findall(url_pattern, text)
+    return _URL_PATTERN.findall(text)
 
 
 def hash_string(s: str, algorithm: str = 'sha256') -> str:
@@ -348,14 +530,36 @@ def hash_string(s: str, algorithm: str = 'sha256') -> str:
     Returns:
         Hex digest of the hash
     """
-    if algorithm == 'md5':
-        return hashlib.md5(s.encode()).hexdigest()
-    elif algorithm == 'sha1':
-        return hashlib.sha1(s.encode()).hexdigest()
-    elif algorithm == 'sha512':
-        return hashlib.sha512(s.encode()).hexdigest()
-    else:  # Default to sha256
-        return hashlib.sha256(s.encode()).hexdigest()
+    # Unknown algorithms default to sha256
+    return _HASHERS.get(algorithm, hashlib.sha256)(s.encode()).hexdigest()
+
+
+def hash_strings(strings: Iterable[str], algorithm: str = 'sha256', prefix: str = "") -> List[str]:
+    """
+    Generate hashes for many strings, optionally sharing a common prefix.
+    
+    Each result equals hash_string(prefix + s, algorithm). The prefix is
+    hashed once and its state copied for every string.
+    
+    Args:
+        strings: Strings to hash
+        algorithm: Hash algorithm to use (md5, sha1, sha256, sha512)
+        prefix: Prefix (e.g. a salt) prepended to every string
+        
+    Returns:
+        Hex digests in the same order as the strings
+    """
+    hasher = _HASHERS.get(algorithm, hashlib.sha256)
+    if not prefix:
+        return [hasher(s.encode()).hexdigest() for s in strings]
+    
+    base = hasher(prefix.encode())
+    digests = []
+    for s in strings:
+        h = base.copy()
+        h.update(s.encode())
+        digests.append(h.hexdigest())
+    return digests
 
 
 def ensure_dir(directory: str) -> None:
@@ -365,8 +569,8 @@ def ensure_dir(directory: str) -> None:
     Args:
         directory: Directory path
     """
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    # One mkdir call, race-free when the directory already exists
+    os.makedirs(directory, exist_ok=True)
 
 
 def is_valid_json(json_str: str) -> bool:
@@ -379,10 +583,26 @@ def is_valid_json(json_str: str) -> bool:
     Returns:
         True if valid JSON, False otherwise
     """
+    # Reject obvious non-JSON without paying for the parser and its exception
+    if isinstance(json_str, str):
+        stripped = json_str.lstrip()
+        if not stripped or stripped[0] not in _JSON_STARTS:
+            return False
+
+    # Parse in C with orjson when installed; anything it rejects gets a
+    # second opinion from the stdlib, which also accepts NaN/Infinity and
+    # integers beyond 64 bits
+    if orjson is not None:
+        try:
+            orjson.loads(json_str)
+            return True
+        except (TypeError, ValueError):
+            pass
+
     try:
         json.loads(json_str)
         return True
-    except Exception:
+    except (TypeError, ValueError, RecursionError):
         return False
 
 
@@ -412,7 +632,7 @@ def extract_domain(url: str) -> str:
         return ""
         
     # Match domain in URL
-    match = re.search(r'https?://(?:www\.)?([^/]+)', url)
+    match = _DOMAIN_PATTERN.search(url)
     if match:
         return match.group(1)
         
@@ -4,24 +4,123 @@ Logging utilities module.
 This module provides logging configuration and utilities for the application.
 """
 
+import atexit
+import copy
 import logging
+import math
 import os
+import re
 import sys
 import json
 import time
-from datetime import datetime
+from contextvars import ContextVar
+from datetime import date, datetime
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Dict, Any, Optional, Union, List, TextIO
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default log format
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DEFAULT_LOG_LEVEL = "INFO"
 
+# Background listener that writes queued records to the configured handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    Queue handler for an in-process queue.
+    
+    Records never leave the process, so exception info is kept for the
+    formatters on the listener thread instead of being flattened into the
+    message.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments so later mutation cannot change the output.
+        
+        Args:
+            record: The log record to enqueue
+            
+        Returns:
+            A copy of the record with its message already formatted
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def stop_queue_listener() -> None:
+    """
+    Flush queued log records and stop the background logging thread.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_queue_listener)
+
+
+def _attach_handlers(
+    root_logger: logging.Logger,
+    handlers: List[logging.Handler],
+    use_queue: bool
+) -> None:
+    """
+    Attach output handlers to the root logger.
+    
+    Args:
+        root_logger: The root logger
+        handlers: Console and file handlers to attach
+        use_queue: Whether to write through a background thread via a queue
+    """
+    stop_queue_listener()
+    if not handlers:
+        return
+    
+    if not use_queue:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return
+    
+    # Callers only pay for a queue put; formatting and I/O run off-thread
+    global _queue_listener
+    queue = SimpleQueue()
+    root_logger.addHandler(_LocalQueueHandler(queue))
+    _queue_listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+
+# Words that mark a field as sensitive wherever they occur in its name
+_SENSITIVE_FIELDS = frozenset({
+    "password", "token", "secret", "api_key", "apikey", "api-key",
+    "authorization", "auth", "credentials", "credit_card", "creditcard",
+    "ssn", "social_security", "socialsecurity"
+})
+_SENSITIVE_KEY_PATTERN = re.compile(
+    "|".join(re.escape(field) for field in sorted(_SENSITIVE_FIELDS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# Request headers whose values are never logged (lowercase)
+_REDACTED_HEADERS = frozenset({"authorization", "api-key", "x-api-key"})
+
 
 def setup_logging(
     log_level: str = None,
     log_file: str = None,
     log_format: str = None,
-    enable_console: bool = True
+    enable_console: bool = True,
+    use_queue: bool = True
 ) -> logging.Logger:
     """
     Configure logging for the application.
@@ -31,6 +130,7 @@ def setup_logging(
         log_file: Path to log file
         log_format: Log message format
         enable_console: Whether to log to console
+        use_queue: Whether handlers write from a background thread
         
     Returns:
         The root logger instance
@@ -49,26 +149,52 @@ def setup_logging(
     # Format string
     formatter = logging.Formatter(log_format or DEFAULT_LOG_FORMAT)
     
+    handlers: List[logging.Handler] = []
+    
     # Add console handler if enabled
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Add file handler if specified
     if log_file:
         # Ensure directory exists
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
             
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    _attach_handlers(root_logger, handlers, use_queue)
     
     return root_logger
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Convert a value the JSON encoder cannot handle natively.
+    
+    Args:
+        obj: Value to convert
+        
+    Returns:
+        JSON-serializable replacement, following the rules of
+        utils.helpers.safe_json_serialize
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
 class JsonFormatter(logging.Formatter):
     """
     JSON formatter for structured logging.
@@ -83,6 +209,41 @@ class JsonFormatter(logging.Formatter):
         """
         super().__init__()
         self.include_extra_fields = include_extra_fields
+        
+        # Last whole second formatted, as (seconds, ISO prefix)
+        self._second_cache = (None, "")
+    
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format a record creation time like datetime.isoformat().
+        
+        Records logged within the same second reuse the formatted date and
+        time; only the microseconds are formatted per record.
+        
+        Args:
+            created: Record creation time in seconds since the epoch
+            
+        Returns:
+            ISO 8601 local timestamp
+        """
+        # Split the way datetime.fromtimestamp() does, rounding half to even
+        fraction, seconds = math.modf(created)
+        microseconds = round(fraction * 1e6)
+        if microseconds >= 1000000:
+            seconds += 1
+            microseconds -= 1000000
+        elif microseconds < 0:
+            seconds -= 1
+            microseconds += 1000000
+        
+        cached_seconds, prefix = self._second_cache
+        if cached_seconds != seconds:
+            prefix = datetime.fromtimestamp(seconds).isoformat()
+            self._second_cache = (seconds, prefix)
+        
+        if microseconds:
+            return f"{prefix}.{microseconds:06d}"
+        return prefix
     
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -95,7 +256,7 @@ class JsonFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
@@ -120,14 +281,22 @@ class JsonFormatter(logging.Formatter):
                     if key not in log_data:
                         log_data[key] = value
         
-        return json.dumps(log_data)
+        # Encode in C with orjson when installed; values it rejects (e.g.
+        # integers beyond 64 bits) fall back to the stdlib encoder
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass
+        return json.dumps(log_data, default=_json_default)
 
 
 def setup_structured_logging(
     log_level: str = None,
     log_file: str = None,
     enable_console: bool = True,
-    include_extra_fields: bool = True
+    include_extra_fields: bool = True,
+    use_queue: bool = True
 ) -> logging.Logger:
     """
     Configure structured JSON logging for the application.
@@ -137,6 +306,7 @@ def setup_structured_logging(
         log_file: Path to log file
         enable_console: Whether to log to console
         include_extra_fields: Whether to include extra fields in JSON
+        use_queue: Whether handlers write from a background thread
         
     Returns:
         The root logger instance
@@ -155,29 +325,62 @@ def setup_structured_logging(
     # Create formatter
     formatter = JsonFormatter(include_extra_fields=include_extra_fields)
     
+    handlers: List[logging.Handler] = []
+    
     # Add console handler if enabled
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Add file handler if specified
     if log_file:
         # Ensure directory exists
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
             
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    _attach_handlers(root_logger, handlers, use_queue)
     
     return root_logger
 
 
+# Context fields for records created in the current thread or task
+_LOG_CONTEXT: ContextVar[Optional[Dict[str, Any]]] = ContextVar("log_context", default=None)
+_context_factory_installed = False
+
+
+def _install_context_factory() -> None:
+    """Wrap the log record factory once so records pick up LogContext fields."""
+    global _context_factory_installed
+    if _context_factory_installed:
+        return
+    _context_factory_installed = True
+    
+    base_factory = logging.getLogRecordFactory()
+    
+    def record_factory(*args, **kwargs):
+        record = base_factory(*args, **kwargs)
+        context = _LOG_CONTEXT.get()
+        if context:
+            if not hasattr(record, "extra_fields"):
+                record.extra_fields = {}
+            record.extra_fields.update(context)
+        return record
+    
+    logging.setLogRecordFactory(record_factory)
+
+
 class LogContext:
     """
     Context manager for adding context to log records.
+    
+    Context applies to records created in the same thread or asyncio task;
+    nested contexts add to, and may override, the fields of outer ones.
     """
     
     def __init__(self, logger: logging.Logger, **context):
@@ -190,34 +393,24 @@ class LogContext:
         """
         self.logger = logger
         self.context = context
-        self.old_factory = logging.getLogRecordFactory()
+        self._token = None
     
     def __enter__(self):
         """
         Set up the context when entering the with block.
         """
-        # Create a new factory that adds our context
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            if not hasattr(record, "extra_fields"):
-                record.extra_fields = {}
-            
-            # Add context to record
-            for key, value in self.context.items():
-                record.extra_fields[key] = value
-            
-            return record
+        _install_context_factory()
         
-        # Replace the factory
-        logging.setLogRecordFactory(record_factory)
+        outer = _LOG_CONTEXT.get()
+        self._token = _LOG_CONTEXT.set({**outer, **self.context} if outer else dict(self.context))
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Clean up when exiting the with block.
         """
-        # Restore the original factory
-        logging.setLogRecordFactory(self.old_factory)
+        # Restore the enclosing context
+        _LOG_CONTEXT.reset(self._token)
 
 
 class RequestLogger:
@@ -257,7 +450,7 @@ class RequestLogger:
         """
         # Generate request ID if not provided
         if not request_id:
-            request_id = f"req_{int(time.time() * 1000)}"
+            request_id = f"req_{time.time_ns() // 1_000_000}"
         
         # Build log data
         log_data = {
@@ -269,13 +462,11 @@ class RequestLogger:
         
         # Add headers (filtered)
         if headers:
-            filtered_headers = headers.copy()
-            # Remove sensitive headers
-            for sensitive in ["authorization", "api-key", "x-api-key"]:
-                if sensitive in filtered_headers:
-                    filtered_headers[sensitive] = "[REDACTED]"
-                    
-            log_data["headers"] = filtered_headers
+            # Redact sensitive headers (names are case-insensitive) in one pass
+            log_data["headers"] = {
+                name: "[REDACTED]" if name.lower() in _REDACTED_HEADERS else value
+                for name, value in headers.items()
+            }
         
         # Add body if present (potentially truncate or filter)
         if body:
@@ -365,23 +556,20 @@ class RequestLogger:
         if not isinstance(data, dict):
             return data
             
-        sensitive_fields = {
-            "password", "token", "secret", "api_key", "apikey", "api-key",
-            "authorization", "auth", "credentials", "credit_card", "creditcard",
-            "ssn", "social_security", "socialsecurity"
-        }
-        
         filtered = {}
         for key, value in data.items():
             # Check if key contains sensitive words
-            if any(sensitive in key.lower() for sensitive in sensitive_fields):
+            if _SENSITIVE_KEY_PATTERN.search(key):
                 filtered[key] = "[REDACTED]"
             elif isinstance(value, dict):
                 # Recursively filter nested dictionaries
                 filtered[key] = self._filter_sensitive_data(value)
-            elif isinstance(value, list) and all(isinstance(item, dict) for item in value):
-                # Filter dictionaries in lists
-                filtered[key] = [self._filter_sensitive_data(item) for item in value]
+            elif isinstance(value, list):
+                # Filter dictionaries in lists, leaving other items as-is
+                filtered[key] = [
+                    self._filter_sensitive_data(item) if isinstance(item, dict) else item
+                    for item in value
+                ]
             else:
                 filtered[key] = value
                 
@@ -401,7 +589,7 @@ class PerformanceLogger:
             logger: The logger to use
         """
         self.logger = logger
-        self.timers = {}
+        self.timers: Dict[str, int] = {}  # Operation name -> perf_counter_ns() start
     
     def start_timer(self, operation: str) -> None:
         """
@@ -410,7 +598,7 @@ class PerformanceLogger:
         Args:
             operation: Name of the operation to time
         """
-        self.timers[operation] = time.time()
+        self.timers[operation] = time.perf_counter_ns()
     
     def end_timer(self, operation: str, log_level: str = "debug") -> float:
         """
@@ -426,14 +614,13 @@ class PerformanceLogger:
         Raises:
             ValueError: If timer was not started
         """
-        if operation not in self.timers:
+        # Remove the timer
+        start = self.timers.pop(operation, None)
+        if start is None:
             raise ValueError(f"Timer for '{operation}' was not started")
-            
-        elapsed = time.time() - self.timers[operation]
-        elapsed_ms = elapsed * 1000
         
-        # Remove the timer
-        del self.timers[operation]
+        # Monotonic integer nanoseconds, converted once
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
         
         # Log the elapsed time
         log_data = {
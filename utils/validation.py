@@ -7,9 +7,16 @@ This module provides data validation utilities for the application.
 import re
 import json
 import logging
-from typing import Dict, Any, Optional, List, Union, Callable, TypeVar, Generic, Type
+import threading
+from functools import lru_cache, partial
+from typing import Dict, Any, Optional, List, Union, Callable, TypeVar, Generic, Type, Pattern, Tuple
 from urllib.parse import urlparse
 
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 from utils.errors import ValidationError
 
 # Set up logger
@@ -18,6 +25,59 @@ logger = logging.getLogger(__name__)
 # Type variables for generic functions
 T = TypeVar('T')
 
+# Email address; bounded quantifiers (RFC 5321 limits) cap backtracking on hostile input
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,63}$')
+
+# Characters urlparse removes from a URL before splitting it
+_URL_IGNORED_CHARS = re.compile(r'[\t\r\n]')
+
+# Types accepted as numbers (bool is excluded separately)
+_NUMBER_TYPES = (int, float)
+
+# Superset of the strings float() accepts, to reject the rest without raising
+_FLOAT_PATTERN = re.compile(
+    r'\s*[+-]?(?:\d[\d_]*)?\.?[\d_]*(?:[eE][+-]?\d[\d_]*)?\s*'
+    r'|\s*[+-]?(?:inf(?:inity)?|nan)\s*',
+    re.IGNORECASE
+)
+
+# Accepted boolean strings (lowercase) and their usual spellings
+_BOOLEAN_STRINGS = frozenset({'true', 'false', '1', '0', 'yes', 'no'})
+_BOOLEAN_SPELLINGS = _BOOLEAN_STRINGS | {
+    spelling
+    for word in _BOOLEAN_STRINGS
+    for spelling in (word.capitalize(), word.upper())
+}
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: Union[str, Pattern]) -> Pattern:
+    """
+    Compile a schema pattern once and reuse it for later calls.
+    
+    Args:
+        pattern: Regular expression string or compiled pattern
+        
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=4096)
+def _has_scheme_and_host(url: str) -> bool:
+    """
+    Check whether a URL parses with both a scheme and a host.
+    
+    Args:
+        url: The URL to check
+        
+    Returns:
+        True if the parsed URL has a scheme and netloc, False otherwise
+    """
+    result = urlparse(url)
+    return bool(result.scheme and result.netloc)
+
 
 def validate_url(url: str, allow_relative: bool = False) -> bool:
     """
@@ -38,9 +98,16 @@ def validate_url(url: str, allow_relative: bool = False) -> bool:
         return True
         
     try:
-        result = urlparse(url)
-        # Check for scheme and netloc (hostname)
-        return all([result.scheme, result.netloc])
+        # A scheme needs a colon, and a host needs '//' right after it; skip
+        # parsing when either is missing (urlparse drops tabs and newlines
+        # before splitting, so URLs containing them are left to it)
+        colon = url.find(':')
+        if colon < 1:
+            return False
+        if not url.startswith('//', colon + 1) and not _URL_IGNORED_CHARS.search(url):
+            return False
+        # Check for scheme and netloc (hostname); repeated URLs hit the cache
+        return _has_scheme_and_host(url)
     except Exception:
         return False
 
@@ -58,9 +125,7 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
         
-    # Simple regex for email validation
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_PATTERN.match(email))
 
 
 def validate_integer(
@@ -80,10 +145,16 @@ def validate_integer(
         True if valid, False otherwise
     """
     try:
-        # Convert to int if string
+        # Convert to int if string; strings that cannot hold an integer
+        # literal are rejected without raising
         if isinstance(value, str):
+            digits = value.strip()
+            if digits[:1] in ('+', '-'):
+                digits = digits[1:]
+            if not digits.replace('_', '').isdecimal():
+                return False
             value = int(value)
-        elif not isinstance(value, int) or isinstance(value, bool):
+        elif not isinstance(value, int) or type(value) is bool:
             return False
             
         # Check range if specified
@@ -114,10 +185,13 @@ def validate_float(
         True if valid, False otherwise
     """
     try:
-        # Convert to float if string
+        # Convert to float if string; strings that cannot hold a float
+        # literal are rejected without raising
         if isinstance(value, str):
+            if not _FLOAT_PATTERN.fullmatch(value):
+                return False
             value = float(value)
-        elif not isinstance(value, (int, float)) or isinstance(value, bool):
+        elif not isinstance(value, _NUMBER_TYPES) or type(value) is bool:
             return False
             
         # Check range if specified
@@ -159,7 +233,7 @@ def validate_string(
         return False
         
     # Check pattern if specified
-    if pattern is not None and not re.match(pattern, value):
+    if pattern is not None and not _compile_pattern(pattern).match(value):
         return False
         
     return True
@@ -178,10 +252,9 @@ def validate_boolean(value: Any) -> bool:
     if isinstance(value, bool):
         return True
         
-    # Handle string representations
+    # Handle string representations; common spellings skip the lower() copy
     if isinstance(value, str):
-        value = value.lower()
-        return value in ('true', 'false', '1', '0', 'yes', 'no')
+        return value in _BOOLEAN_SPELLINGS or value.lower() in _BOOLEAN_STRINGS
         
     # Handle integer representations
     if isinstance(value, int):
@@ -217,54 +290,138 @@ def validate_list(
     if max_items is not None and len(value) > max_items:
         return False
         
-    # Check items if validator specified
+    # Check items if validator specified, stopping at the first failure
     if item_validator:
-        return all(item_validator(item) for item in value)
+        for item in value:
+            if not item_validator(item):
+                return False
         
     return True
 
 
-def validate_dict(
-    value: Any,
+def make_dict_validator(
     required_keys: Optional[List[str]] = None,
     optional_keys: Optional[List[str]] = None,
     key_validators: Optional[Dict[str, Callable[[Any], bool]]] = None,
     allow_extra_keys: bool = True
-) -> bool:
+) -> Callable[[Any], bool]:
     """
-    Validate a dictionary.
+    Build a dictionary validator with its key sets computed once.
+    
+    Use this instead of validate_dict when the same rules are applied to
+    many values.
     
     Args:
-        value: The value to validate
         required_keys: List of required keys
         optional_keys: List of optional keys
         key_validators: Dictionary of key-specific validator functions
         allow_extra_keys: Whether to allow keys not in required or optional lists
         
     Returns:
-        True if valid, False otherwise
+        Function that returns True if a value is a valid dictionary
     """
-    if not isinstance(value, dict):
-        return False
+    required = frozenset(required_keys or ())
+    # Allowed keys are only enforced when some keys are listed
+    allowed = (required | frozenset(optional_keys or ())) if not allow_extra_keys else None
+    if allowed is not None and not allowed:
+        allowed = None
+    validators = tuple(key_validators.items()) if key_validators else ()
+    
+    def validate(value: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
         
-    # Check required keys
-    if required_keys:
-        if not all(key in value for key in required_keys):
+        # Key set comparisons run in C against the dict's keys view
+        keys = value.keys()
+        if required and not keys >= required:
             return False
-            
-    # Validate against extra keys if not allowed
-    if not allow_extra_keys and (required_keys or optional_keys):
-        allowed_keys = set(required_keys or []) | set(optional_keys or [])
-        if not set(value.keys()).issubset(allowed_keys):
+        if allowed is not None and not keys <= allowed:
             return False
-            
-    # Validate values with key validators
-    if key_validators:
-        for key, validator in key_validators.items():
+        
+        for key, validator in validators:
             if key in value and not validator(value[key]):
                 return False
                 
-    return True
+        return True
+    
+    return validate
+
+
+@lru_cache(maxsize=256)
+def _cached_dict_validator(
+    required_keys: Optional[Tuple[str, ...]],
+    optional_keys: Optional[Tuple[str, ...]],
+    key_validators: Optional[Tuple[Tuple[str, Callable[[Any], bool]], ...]],
+    allow_extra_keys: bool
+) -> Callable[[Any], bool]:
+    """
+    Build a dictionary validator once per distinct set of rules.
+    
+    Args:
+        required_keys: Tuple of required keys
+        optional_keys: Tuple of optional keys
+        key_validators: Tuple of (key, validator function) pairs
+        allow_extra_keys: Whether to allow keys not in required or optional lists
+        
+    Returns:
+        Dictionary validator function
+    """
+    return make_dict_validator(
+        required_keys, optional_keys, dict(key_validators) if key_validators else None, allow_extra_keys
+    )
+
+
+def validate_dict(
+    value: Any,
+    required_keys: Optional[List[str]] = None,
+    optional_keys: Optional[List[str]] = None,
+    key_validators: Optional[Dict[str, Callable[[Any], bool]]] = None,
+    allow_extra_keys: bool = True
+) -> bool:
+    """
+    Validate a dictionary.
+    
+    Args:
+        value: The value to validate
+        required_keys: List of required keys
+        optional_keys: List of optional keys
+        key_validators: Dictionary of key-specific validator functions
+        allow_extra_keys: Whether to allow keys not in required or optional lists
+        
+    Returns:
+        True if valid, False otherwise
+    """
+    try:
+        validator = _cached_dict_validator(
+            tuple(required_keys) if required_keys else None,
+            tuple(optional_keys) if optional_keys else None,
+            tuple(key_validators.items()) if key_validators else None,
+            allow_extra_keys
+        )
+    except TypeError:
+        # Unhashable rules (e.g. a validator object without __hash__)
+        validator = make_dict_validator(required_keys, optional_keys, key_validators, allow_extra_keys)
+    return validator(value)
+
+
+# Shared decoder for validate_json; decoders hold no per-call state
+_JSON_DECODER = json.JSONDecoder()
+
+# One simdjson parser per thread; parsers are reusable but not thread-safe
+_simdjson_local = threading.local()
+
+
+def _simdjson_parser() -> Any:
+    """
+    Get this thread's simdjson parser, creating it on first use.
+    
+    Returns:
+        A simdjson.Parser instance
+    """
+    parser = getattr(_simdjson_local, "parser", None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser
 
 
 def validate_json(value: Any) -> bool:
@@ -279,19 +436,425 @@ def validate_json(value: Any) -> bool:
     """
     if not isinstance(value, str):
         return False
+    
+    # With simdjson installed, check structure without building Python
+    # objects; documents it rejects (e.g. NaN, which json accepts) get a
+    # second opinion from the stdlib parser
+    if simdjson is not None:
+        try:
+            _simdjson_parser().parse(value.encode())
+            return True
+        except (ValueError, RuntimeError):
+            pass
         
     try:
-        json.loads(value)
+        _JSON_DECODER.decode(value)
         return True
     except json.JSONDecodeError:
         return False
 
 
+# Compiled field check, called as check(field_name, value, errors, pending,
+# depth). It appends the field's errors to errors and pushes nested fields
+# onto pending as (check, field_name, value, depth) instead of recursing.
+FieldCheck = Callable[[str, Any, List[str], List[tuple], int], None]
+
+# Nesting depth below which nested fields are no longer validated
+_MAX_FIELD_DEPTH = 100
+
+
+def _check_nothing(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+    """Field check for definitions without any constraints."""
+
+
+def _run_field_check(
+    check: FieldCheck,
+    field_name: str,
+    value: Any,
+    errors: List[str],
+    pending: Optional[List[tuple]] = None
+) -> None:
+    """
+    Run a compiled field check and every nested check it schedules.
+    
+    Nested fields are taken from an explicit stack (depth first, in document
+    order), so deeply nested values cannot exhaust the interpreter stack.
+    
+    Args:
+        check: Compiled field check
+        field_name: Name of the field
+        value: Value to validate
+        errors: List the validation errors are appended to
+        pending: Empty stack to reuse across calls, or None for a new one
+    """
+    if pending is None:
+        pending = []
+    check(field_name, value, errors, pending, 0)
+    while pending:
+        check, field_name, value, depth = pending.pop()
+        check(field_name, value, errors, pending, depth)
+
+
+def _compile_string_check(field_def: Dict[str, Any], memo: Dict[int, Tuple[FieldCheck, bool]]) -> FieldCheck:
+    """
+    Compile the type and constraint checks for a string field.
+    
+    The pattern must match the whole string, not just a prefix.
+    
+    Args:
+        field_def: Field validation definition
+        memo: Checks already compiled, by id of their definition
+        
+    Returns:
+        Field check function
+    """
+    min_length = field_def.get('min_length')
+    max_length = field_def.get('max_length')
+    pattern = field_def.get('pattern')
+    compiled_pattern = _compile_pattern(pattern) if pattern is not None else None
+    
+    def check(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+        if not isinstance(value, str):
+            errors.append(f"Field '{field_name}' must be a string")
+            return
+        
+        if min_length is not None and len(value) < min_length:
+            errors.append(f"Field '{field_name}' must be at least {min_length} characters")
+            
+        if max_length is not None and len(value) > max_length:
+            errors.append(f"Field '{field_name}' must be at most {max_length} characters")
+            
+        if compiled_pattern is not None and not compiled_pattern.fullmatch(value):
+            errors.append(f"Field '{field_name}' must match pattern {pattern}")
+    
+    return check
+
+
+def _compile_range_check(
+    field_def: Dict[str, Any],
+    memo: Dict[int, Tuple[FieldCheck, bool]],
+    types: Any,
+    type_error: str
+) -> FieldCheck:
+    """
+    Compile the type and range checks for an integer or number field.
+    
+    Args:
+        field_def: Field validation definition
+        memo: Checks already compiled, by id of their definition
+        types: Type or tuple of types accepted (bool is always rejected)
+        type_error: Error suffix when the value has the wrong type
+        
+    Returns:
+        Field check function
+    """
+    min_value = field_def.get('min_value')
+    max_value = field_def.get('max_value')
+    
+    def check(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+        if not isinstance(value, types) or type(value) is bool:
+            errors.append(f"Field '{field_name}' {type_error}")
+            return
+        
+        if min_value is not None and value < min_value:
+            errors.append(f"Field '{field_name}' must be at least {min_value}")
+            
+        if max_value is not None and value > max_value:
+            errors.append(f"Field '{field_name}' must be at most {max_value}")
+    
+    return check
+
+
+def _compile_boolean_check(field_def: Dict[str, Any], memo: Dict[int, Tuple[FieldCheck, bool]]) -> FieldCheck:
+    """
+    Compile the type check for a boolean field.
+    
+    Args:
+        field_def: Field validation definition
+        memo: Checks already compiled, by id of their definition
+        
+    Returns:
+        Field check function
+    """
+    def check(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+        if not isinstance(value, bool):
+            errors.append(f"Field '{field_name}' must be a boolean")
+    
+    return check
+
+
+# Exact item types the bulk check accepts for each numeric field type
+_BULK_ITEM_TYPES = {
+    'integer': frozenset({int}),
+    'number': frozenset({int, float}),
+    'float': frozenset({int, float}),
+}
+
+
+def _compile_number_items_check(item_schema: Dict[str, Any]) -> Optional[Callable[[list], bool]]:
+    """
+    Compile a bulk check for arrays of numbers that only have range limits.
+    
+    The type test and min()/max() run as C loops over the whole list, so
+    valid numeric arrays skip the per-item checks. A False result only means
+    the per-item checks must run to find and report the failures.
+    
+    Args:
+        item_schema: Field definition for the array items
+        
+    Returns:
+        Function returning True if every item is valid, or None if the item
+        definition has checks the bulk path does not cover
+    """
+    item_types = _BULK_ITEM_TYPES.get(item_schema.get('type'))
+    if item_types is None or item_schema.get('enum') is not None or callable(item_schema.get('validator')):
+        return None
+    
+    min_value = item_schema.get('min_value')
+    max_value = item_schema.get('max_value')
+    
+    def all_valid(items: list) -> bool:
+        if not items or not set(map(type, items)) <= item_types:
+            return False
+        # min()/max() return NaN only when the first item is NaN; let the
+        # per-item checks handle that case
+        if min_value is not None:
+            lowest = min(items)
+            if lowest != lowest or lowest < min_value:
+                return False
+        if max_value is not None:
+            highest = max(items)
+            if highest != highest or highest > max_value:
+                return False
+        return True
+    
+    return all_valid
+
+
+def _too_deep(field_name: str, errors: List[str]) -> None:
+    """
+    Report a field whose nested values are beyond the depth limit.
+    
+    Args:
+        field_name: Name of the field
+        errors: List the error is appended to
+    """
+    errors.append(f"Field '{field_name}' is nested more than {_MAX_FIELD_DEPTH} levels deep")
+
+
+def _compile_array_check(field_def: Dict[str, Any], memo: Dict[int, Tuple[FieldCheck, bool]]) -> FieldCheck:
+    """
+    Compile the type, size and item checks for an array field.
+    
+    Args:
+        field_def: Field validation definition
+        memo: Checks already compiled, by id of their definition
+        
+    Returns:
+        Field check function
+    """
+    min_items = field_def.get('min_items')
+    max_items = field_def.get('max_items')
+    item_schema = field_def.get('items')
+    item_check, item_nested = _compile_field(item_schema, memo) if item_schema else (None, False)
+    items_valid = _compile_number_items_check(item_schema) if item_schema else None
+    
+    def check(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+        if not isinstance(value, list):
+            errors.append(f"Field '{field_name}' must be an array")
+            return
+        
+        if min_items is not None and len(value) < min_items:
+            errors.append(f"Field '{field_name}' must have at least {min_items} items")
+            
+        if max_items is not None and len(value) > max_items:
+            errors.append(f"Field '{field_name}' must have at most {max_items} items")
+            
+        # Per-item checks only run when the bulk check cannot vouch for all items
+        if item_check is None or (items_valid is not None and items_valid(value)):
+            return
+        
+        depth += 1
+        if not item_nested:
+            # Flat items cannot nest further, so check them in place
+            for i, item in enumerate(value):
+                item_check(f"{field_name}[{i}]", item, errors, pending, depth)
+        elif depth > _MAX_FIELD_DEPTH:
+            _too_deep(field_name, errors)
+        else:
+            # Pushed in reverse so they are checked in order
+            for i in range(len(value) - 1, -1, -1):
+                pending.append((item_check, f"{field_name}[{i}]", value[i], depth))
+    
+    return check
+
+
+def _compile_object_check(field_def: Dict[str, Any], memo: Dict[int, Tuple[FieldCheck, bool]]) -> FieldCheck:
+    """
+    Compile the type, required-property and property checks for an object field.
+    
+    Args:
+        field_def: Field validation definition
+        memo: Checks already compiled, by id of their definition
+        
+    Returns:
+        Field check function
+    """
+    required = tuple(field_def.get('required', []))
+    properties = tuple(
+        (prop_name,) + _compile_field(prop_schema, memo)
+        for prop_name, prop_schema in field_def.get('properties', {}).items()
+    )
+    any_nested = any(prop_nested for _, _, prop_nested in properties)
+    
+    def check(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+        if not isinstance(value, dict):
+            errors.append(f"Field '{field_name}' must be an object")
+            return
+        
+        get = value.get
+        for req_field in required:
+            if get(req_field) is None:
+                errors.append(f"Field '{field_name}.{req_field}' is required")
+        
+        depth += 1
+        if not any_nested:
+            # Flat properties cannot nest further, so check them in place
+            for prop_name, prop_check, _ in properties:
+                prop_value = get(prop_name)
+                if prop_value is not None:
+                    prop_check(f"{field_name}.{prop_name}", prop_value, errors, pending, depth)
+        elif depth > _MAX_FIELD_DEPTH:
+            _too_deep(field_name, errors)
+        else:
+            # Pushed in reverse so they are checked in order
+            for prop_name, prop_check, _ in reversed(properties):
+                prop_value = get(prop_name)
+                if prop_value is not None:
+                    pending.append((prop_check, f"{field_name}.{prop_name}", prop_value, depth))
+    
+    return check
+
+
+# Field type names and the compilers for their checks
+_TYPE_COMPILERS: Dict[str, Callable[..., FieldCheck]] = {
+    'string': _compile_string_check,
+    'integer': partial(_compile_range_check, types=int, type_error="must be an integer"),
+    'number': partial(_compile_range_check, types=_NUMBER_TYPES, type_error="must be a number"),
+    'boolean': _compile_boolean_check,
+    'array': _compile_array_check,
+    'object': _compile_object_check,
+}
+_TYPE_COMPILERS['float'] = _TYPE_COMPILERS['number']
+_TYPE_COMPILERS['list'] = _TYPE_COMPILERS['array']
+_TYPE_COMPILERS['dict'] = _TYPE_COMPILERS['object']
+
+# Field types whose values contain other fields
+_NESTED_TYPES = frozenset({'array', 'list', 'object', 'dict'})
+
+
+def _enum_set(enum_values: Any) -> Optional[frozenset]:
+    """
+    Build a set for O(1) enum membership tests.
+    
+    Args:
+        enum_values: Allowed values from a field definition
+        
+    Returns:
+        Frozenset of the values, or None if they are not a collection of
+        hashable values
+    """
+    if not isinstance(enum_values, (list, tuple, set, frozenset)):
+        return None
+    try:
+        return frozenset(enum_values)
+    except TypeError:
+        return None
+
+
+def _compile_field(
+    field_def: Dict[str, Any],
+    memo: Optional[Dict[int, Tuple[FieldCheck, bool]]] = None
+) -> Tuple[FieldCheck, bool]:
+    """
+    Compile a field definition into a single check function.
+    
+    The type, constraints, pattern and nested schemas are read once here so
+    that checking a value does no definition lookups. Definitions shared or
+    referenced recursively within a schema are compiled once.
+    
+    Args:
+        field_def: Field validation definition
+        memo: Checks already compiled, by id of their definition
+        
+    Returns:
+        Tuple of the field check function and whether it can schedule
+        nested checks
+    """
+    if memo is None:
+        memo = {}
+    key = id(field_def)
+    if key in memo:
+        return memo[key]
+    
+    # A definition that contains itself sees this forwarder until it is done
+    compiled: List[FieldCheck] = []
+    memo[key] = (lambda *args: compiled[0](*args), True)
+    
+    field_type = field_def.get('type', 'any')
+    type_compiler = _TYPE_COMPILERS.get(field_type)
+    type_check = type_compiler(field_def, memo) if type_compiler else None
+    nested = field_type in _NESTED_TYPES
+    
+    enum_values = field_def.get('enum')
+    enum_set = _enum_set(enum_values)
+    validator_func = field_def.get('validator')
+    if not (validator_func and callable(validator_func)):
+        validator_func = None
+    
+    def check_value(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+        # Enum validation (hashed lookup; unhashable values scan the list)
+        if enum_values is not None:
+            if enum_set is None:
+                allowed = value in enum_values
+            else:
+                try:
+                    allowed = value in enum_set
+                except TypeError:
+                    allowed = value in enum_values
+            if not allowed:
+                errors.append(f"Field '{field_name}' must be one of {enum_values}")
+            
+        # Custom validator function
+        if validator_func is not None and not validator_func(value):
+            errors.append(f"Field '{field_name}' failed custom validation")
+    
+    if enum_values is None and validator_func is None:
+        check = type_check or _check_nothing
+    elif type_check is None:
+        check = check_value
+    elif nested:
+        def check(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+            # Value checks come after the nested fields' errors
+            pending.append((check_value, field_name, value, depth))
+            type_check(field_name, value, errors, pending, depth)
+    else:
+        def check(field_name: str, value: Any, errors: List[str], pending: List[tuple], depth: int) -> None:
+            type_check(field_name, value, errors, pending, depth)
+            check_value(field_name, value, errors, pending, depth)
+    
+    compiled.append(check)
+    memo[key] = (check, nested)
+    return memo[key]
+
+
 class Validator(Generic[T]):
     """
     Generic validator for data objects.
     """
     
+    __slots__ = ("name", "validators", "required_fields", "_compiled", "_column_checks")
+    
     def __init__(
         self,
         name: str,
@@ -301,6 +864,10 @@ class Validator(Generic[T]):
         """
         Initialize the validator.
         
+        Field definitions are compiled here, so changes to them afterwards
+        are not seen. String 'pattern' constraints must match the whole
+        value (re.fullmatch), not only its start.
+        
         Args:
             name: Name of the model being validated
             validators: Dictionary of field validators
@@ -309,6 +876,19 @@ class Validator(Generic[T]):
         self.name = name
         self.validators = validators
         self.required_fields = required_fields or []
+        
+        # Field definitions are compiled once; validate() only runs the checks
+        memo: Dict[int, Tuple[FieldCheck, bool]] = {}
+        self._compiled: Dict[str, FieldCheck] = {
+            field: _compile_field(field_def, memo)[0] for field, field_def in validators.items()
+        }
+        
+        # Whole-column checks for numeric fields, used by validate_many()
+        self._column_checks: Dict[str, Callable[[list], bool]] = {}
+        for field, field_def in validators.items():
+            column_check = _compile_number_items_check(field_def)
+            if column_check is not None:
+                self._column_checks[field] = column_check
     
     def validate(self, data: Dict[str, Any]) -> List[str]:
         """
@@ -320,21 +900,57 @@ class Validator(Generic[T]):
         Returns:
             List of validation errors, empty if valid
         """
-        errors = []
-        
-        # Check required fields
-        for field in self.required_fields:
-            if field not in data or data[field] is None:
-                errors.append(f"Field '{field}' is required")
+        # Check required fields; one lookup covers both missing and None
+        get = data.get
+        errors = [f"Field '{field}' is required" for field in self.required_fields if get(field) is None]
                 
-        # Validate fields
-        for field, field_def in self.validators.items():
-            if field in data and data[field] is not None:
-                field_errors = self._validate_field(field, data[field], field_def)
-                errors.extend(field_errors)
+        # Validate fields; checks only allocate when reporting an error, and
+        # one stack serves every field since each run leaves it empty
+        pending: List[tuple] = []
+        for field, check in self._compiled.items():
+            value = get(field)
+            if value is not None:
+                _run_field_check(check, field, value, errors, pending)
                 
         return errors
     
+    def validate_many(self, rows: List[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Validate a batch of records.
+        
+        Records are checked one field at a time across the whole batch, so a
+        numeric column with only range limits is checked in a single pass.
+        
+        Args:
+            rows: The records to validate
+            
+        Returns:
+            List of validation errors for each record, in order; each list is
+            the same as validate() returns for that record
+        """
+        gets = [row.get for row in rows]
+        required_fields = self.required_fields
+        results = [
+            [f"Field '{field}' is required" for field in required_fields if get(field) is None]
+            for get in gets
+        ]
+        
+        pending: List[tuple] = []
+        column_checks = self._column_checks
+        for field, check in self._compiled.items():
+            column = [get(field) for get in gets]
+            
+            # Skip the per-record checks when the whole column is valid
+            column_check = column_checks.get(field)
+            if column_check is not None and column_check([value for value in column if value is not None]):
+                continue
+            
+            for errors, value in zip(results, column):
+                if value is not None:
+                    _run_field_check(check, field, value, errors, pending)
+                    
+        return results
+    
     def _validate_field(
         self, 
         field_name: str, 
@@ -353,118 +969,7 @@ class Validator(Generic[T]):
             List of validation errors, empty if valid
         """
         errors = []
-        field_type = field_def.get('type', 'any')
-        
-        # Type validation
-        if field_type == 'string':
-            if not isinstance(value, str):
-                errors.append(f"Field '{field_name}' must be a string")
-            else:
-                # String-specific validation
-                min_length = field_def.get('min_length')
-                max_length = field_def.get('max_length')
-                pattern = field_def.get('pattern')
-                
-                if min_length is not None and len(value) < min_length:
-                    errors.append(f"Field '{field_name}' must be at least {min_length} characters")
-                    
-                if max_length is not None and len(value) > max_length:
-                    errors.append(f"Field '{field_name}' must be at most {max_length} characters")
-                    
-                if pattern is not None and not re.match(pattern, value):
-                    errors.append(f"Field '{field_name}' must match pattern {pattern}")
-                    
-        elif field_type == 'integer':
-            if not isinstance(value, int) or isinstance(value, bool):
-                errors.append(f"Field '{field_name}' must be an integer")
-            else:
-                # Integer-specific validation
-                min_value = field_def.get('min_value')
-                max_value = field_def.get('max_value')
-                
-                if min_value is not None and value < min_value:
-                    errors.append(f"Field '{field_name}' must be at least {min_value}")
-                    
-                if max_value is not None and value > max_value:
-                    errors.append(f"Field '{field_name}' must be at most {max_value}")
-                    
-        elif field_type == 'number' or field_type == 'float':
-            if not isinstance(value, (int, float)) or isinstance(value, bool):
-                errors.append(f"Field '{field_name}' must be a number")
-            else:
-                # Number-specific validation
-                min_value = field_def.get('min_value')
-                max_value = field_def.get('max_value')
-                
-                if min_value is not None and value < min_value:
-                    errors.append(f"Field '{field_name}' must be at least {min_value}")
-                    
-                if max_value is not None and value > max_value:
-                    errors.append(f"Field '{field_name}' must be at most {max_value}")
-                    
-        elif field_type == 'boolean':
-            if not isinstance(value, bool):
-                errors.append(f"Field '{field_name}' must be a boolean")
-                
-        elif field_type == 'array' or field_type == 'list':
-            if not isinstance(value, list):
-                errors.append(f"Field '{field_name}' must be an array")
-            else:
-                # Array-specific validation
-                min_items = field_def.get('min_items')
-                max_items = field_def.get('max_items')
-                
-                if min_items is not None and len(value) < min_items:
-                    errors.append(f"Field '{field_name}' must have at least {min_items} items")
-                    
-                if max_items is not None and len(value) > max_items:
-                    errors.append(f"Field '{field_name}' must have at most {max_items} items")
-                    
-                # Validate items if item schema provided
-                item_schema = field_def.get('items')
-                if item_schema:
-                    for i, item in enumerate(value):
-                        item_errors = self._validate_field(
-                            f"{field_name}[{i}]", 
-                            item, 
-                            item_schema
-                        )
-                        errors.extend(item_errors)
-                        
-        elif field_type == 'object' or field_type == 'dict':
-            if not isinstance(value, dict):
-                errors.append(f"Field '{field_name}' must be an object")
-            else:
-                # Object-specific validation
-                properties = field_def.get('properties', {})
-                required = field_def.get('required', [])
-                
-                # Check required properties
-                for req_field in required:
-                    if req_field not in value or value[req_field] is None:
-                        errors.append(f"Field '{field_name}.{req_field}' is required")
-                        
-                # Validate properties
-                for prop_name, prop_schema in properties.items():
-                    if prop_name in value and value[prop_name] is not None:
-                        prop_errors = self._validate_field(
-                            f"{field_name}.{prop_name}", 
-                            value[prop_name], 
-                            prop_schema
-                        )
-                        errors.extend(prop_errors)
-                        
-        # Enum validation
-        enum_values = field_def.get('enum')
-        if enum_values is not None and value not in enum_values:
-            errors.append(f"Field '{field_name}' must be one of {enum_values}")
-            
-        # Custom validator function
-        validator_func = field_def.get('validator')
-        if validator_func and callable(validator_func):
-            if not validator_func(value):
-                errors.append(f"Field '{field_name}' failed custom validation")
-                
+        _run_field_check(_compile_field(field_def)[0], field_name, value, errors)
         return errors
     
     def validate_or_raise(self, data: Dict[str, Any]) -> None:
@@ -479,6 +984,12 @@ class Validator(Generic[T]):
         """
         errors = self.validate(data)
         if errors:
-            error_msg = f"Validation failed for {self.name}: {', '.join(errors)}"
-            logger.warning(error_msg)
-            raise ValidationError(error_msg, details={"errors": errors}) 
\ No newline at end of file
+            error_list = ', '.join(errors)
+            # Lazy %-formatting; the extra keys must not collide with
+            # extra_fields, which LogContext sets on every record
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Validation failed for %s: %s", self.name, error_list,
+                    extra={"validator": self.name, "validation_errors": errors}
+                )
+            raise ValidationError(f"Validation failed for {self.name}: {error_list}", details={"errors": errors}) 
\ No newline at end of file